@@ -0,0 +1,437 @@
+"""SQLModel-based resource service running on an async database engine."""
+
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
+
+from sqlmodel import SQLModel, delete, insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from pydantic_core import to_jsonable_python
+
+from .caching import ResourceCache
+from .exceptions import NotFoundError, ValidationError, ConflictError
+from .pagination import encode_cursor
+from .sql_model_resource_service import SQLModelResourceService, _chunks
+
+
+class AsyncSQLModelResourceService(SQLModelResourceService):
+    """Database-backed resource service using SQLAlchemy's asyncio support.
+
+    This class provides the same interface as SQLModelResourceService, but
+    awaits every database call on an AsyncSession (aiosqlite, asyncpg), so a
+    slow query doesn't block other requests served by the same worker.
+    """
+
+    def __init__(
+        self,
+        model: Type[SQLModel],
+        resource_name: str,
+        session: AsyncSession,
+        cache: Optional[ResourceCache] = None,
+    ):
+        """Initialize the async SQL resource service.
+
+        Args:
+            model: SQLModel class for the resource
+            resource_name: Name of the resource (e.g., "users")
+            session: The async database session to use for operations.
+            cache: If given, reads by ID are served through this cache and
+                writes through this service invalidate it.
+        """
+        super().__init__(model, resource_name, session, cache=cache)
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new resource in the database.
+
+        Args:
+            data: Resource data validated by SQLModel
+
+        Returns:
+            Created resource with generated ID
+
+        Raises:
+            ConflictError: If resource with same ID already exists
+            ValidationError: If data validation fails
+        """
+        resource_id, row = self._new_row(data)
+        statement, returning = self._insert_statement(row)
+
+        try:
+            result = await self.session.exec(statement)
+            if returning:
+                row = dict(result.mappings().one())
+            await self.session.commit()
+            self._invalidate([resource_id])
+        except IntegrityError as e:
+            await self.session.rollback()
+            if await self._existing_ids([resource_id]):
+                raise ConflictError(
+                    f"{self.resource_name} with ID {resource_id} already exists"
+                )
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+
+        return to_jsonable_python(row)
+
+    async def read(self, resource_id: str) -> Dict[str, Any]:
+        """Read a single resource by ID from the database.
+
+        Args:
+            resource_id: The ID of the resource
+
+        Returns:
+            The resource data
+
+        Raises:
+            NotFoundError: If resource doesn't exist
+        """
+        cached, version = self._cache_lookup(resource_id)
+        if cached is not None:
+            return cached
+
+        result = await self.session.exec(self._select_by_id(resource_id))
+        resources = self._rows_to_dicts(result.keys(), result.all())
+        if not resources:
+            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+
+        return self._cache_store(resource_id, resources[0], version)
+
+    async def update(
+        self, resource_id: str, data: Dict[str, Any], partial: bool = False
+    ) -> Dict[str, Any]:
+        """Update an existing resource in the database.
+
+        Args:
+            resource_id: The ID of the resource
+            data: Updated resource data
+            partial: If True, allows partial updates (PATCH)
+
+        Returns:
+            The updated resource
+
+        Raises:
+            NotFoundError: If resource doesn't exist
+            ConflictError: If the update violates a unique index
+            ValidationError: If data validation fails
+        """
+        db_resource = await self.session.get(self.model, resource_id)
+        if not db_resource:
+            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+
+        try:
+            update_data = data.copy()
+
+            if not partial:
+                # PUT: Replace entire resource (except system fields)
+                update_data["id"] = resource_id
+                existing_dict = self._model_to_dict(db_resource)
+                if "created_at" in existing_dict:
+                    update_data["created_at"] = existing_dict["created_at"]
+
+            for key, value in update_data.items():
+                if hasattr(db_resource, key):
+                    setattr(db_resource, key, value)
+
+            # Update timestamp
+            if hasattr(db_resource, "updated_at"):
+                db_resource.updated_at = datetime.now(timezone.utc)
+
+            self.session.add(db_resource)
+            await self.session.commit()
+            await self.session.refresh(db_resource)
+
+            return self._model_to_dict(db_resource)
+
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except Exception as e:
+            await self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate([resource_id])
+
+    async def delete(self, resource_id: str) -> None:
+        """Delete a resource from the database.
+
+        Args:
+            resource_id: The ID of the resource
+
+        Raises:
+            NotFoundError: If resource doesn't exist
+        """
+        db_resource = await self.session.get(self.model, resource_id)
+        if not db_resource:
+            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+
+        try:
+            await self.session.delete(db_resource)
+            await self.session.commit()
+        finally:
+            self._invalidate([resource_id])
+
+    async def upsert(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a resource with the given ID, or replace it if it exists.
+
+        Args:
+            resource_id: The ID of the resource
+            data: Resource data validated by SQLModel
+
+        Returns:
+            The resource as stored
+
+        Raises:
+            ConflictError: If the write violates a unique index
+            ValidationError: If data validation fails
+        """
+        _, row = self._new_row({**data, "id": resource_id})
+        return (await self._commit_upserts([row]))[0]
+
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many resources in one transaction.
+
+        Args:
+            items: Resource data for each new resource
+
+        Returns:
+            Created resources, in the order given
+
+        Raises:
+            ConflictError: If an ID already exists or is repeated in the batch
+            ValidationError: If any item is invalid
+        """
+        rows = self._new_rows(items)
+        ids = Counter(row["id"] for row in rows)
+        self._check_conflicts(ids, await self._existing_ids(list(ids)))
+
+        try:
+            if rows:
+                await self.session.exec(insert(self.model), params=rows)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        self._invalidate(ids)
+
+        return [to_jsonable_python(row) for row in rows]
+
+    async def bulk_update(
+        self, items: List[Dict[str, Any]], partial: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Update many resources in one transaction.
+
+        Args:
+            items: Updated data for each resource, including its ``id``
+            partial: If True, merge each item into the existing resource
+                (PATCH); otherwise replace it (PUT)
+
+        Returns:
+            Updated resources, in the order given
+
+        Raises:
+            NotFoundError: If any resource doesn't exist
+            ConflictError: If an update violates a unique index
+            ValidationError: If an item has no ``id`` or any result is invalid
+        """
+        ids = [item.get("id") for item in items]
+        if not all(ids):
+            raise ValidationError("Invalid data: every item needs an id")
+
+        primary_key = self._primary_key()
+        db_resources = {}
+        for chunk in _chunks(ids):
+            results = await self.session.exec(
+                select(self.model).where(primary_key.in_(chunk))
+            )
+            for resource in results.all():
+                db_resources[getattr(resource, primary_key.key)] = resource
+        missing = [rid for rid in ids if rid not in db_resources]
+        if missing:
+            raise NotFoundError(
+                f"{self.resource_name} with IDs {', '.join(map(str, missing))} not found"
+            )
+
+        rows = self._merge_updates(items, db_resources, partial)
+        try:
+            results = self._apply_updates(rows, db_resources)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except Exception as e:
+            await self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate(ids)
+
+        return results
+
+    async def bulk_delete(self, resource_ids: List[str]) -> None:
+        """Delete many resources in one transaction.
+
+        Args:
+            resource_ids: IDs of the resources to delete
+
+        Raises:
+            NotFoundError: If any resource doesn't exist
+        """
+        found = await self._existing_ids(resource_ids)
+        missing = [rid for rid in resource_ids if rid not in found]
+        if missing:
+            raise NotFoundError(
+                f"{self.resource_name} with IDs {', '.join(map(str, missing))} not found"
+            )
+
+        primary_key = self._primary_key()
+        try:
+            for chunk in _chunks(resource_ids):
+                await self.session.exec(
+                    delete(self.model).where(primary_key.in_(chunk))
+                )
+            await self.session.commit()
+        finally:
+            self._invalidate(resource_ids)
+
+    async def bulk_upsert(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create or replace many resources in one transaction.
+
+        Args:
+            items: Resource data for each resource, including its ``id``
+
+        Returns:
+            The resources as stored, in the order given
+
+        Raises:
+            ConflictError: If an ID is repeated in the batch or a write
+                violates a unique index
+            ValidationError: If an item has no ``id`` or any item is invalid
+        """
+        return await self._commit_upserts(self._new_upsert_rows(items))
+
+    async def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """List resources from the database with filtering.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+            **filters: Additional filter parameters
+
+        Returns:
+            List of resources matching the filters
+        """
+        query = self._select_rows()
+        if filters:
+            query = self._apply_filters(query, filters)
+        query = query.offset(offset).limit(limit)
+
+        result = await self.session.exec(query)
+        return self._rows_to_dicts(result.keys(), result.all())
+
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of resources using keyset (cursor) pagination.
+
+        Args:
+            limit: Maximum number of results
+            cursor: Cursor returned with the previous page, or None to start
+            **filters: Additional filter parameters
+
+        Returns:
+            The page of resources and the cursor for the next page, or None
+            if this is the last page
+
+        Raises:
+            ValidationError: If the cursor or limit is invalid
+        """
+        if limit < 1:
+            raise ValidationError("Invalid limit: must be at least 1")
+        primary_key = self._primary_key()
+        query = self._select_rows()
+
+        if filters:
+            query = self._apply_filters(query, filters)
+        if cursor:
+            query = query.where(primary_key > self._cursor_key(cursor))
+
+        # Fetch one extra row to know whether another page follows
+        query = query.order_by(primary_key).limit(limit + 1)
+        result = await self.session.exec(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(getattr(rows[-1], primary_key.key))
+
+        return self._rows_to_dicts(result.keys(), rows), next_cursor
+
+    async def stream(
+        self, batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every resource matching the filters, in primary key order.
+
+        The query runs once over the table's columns on a dedicated
+        connection, and rows are read through a server-side cursor
+        ``batch_size`` at a time, so memory use stays constant.
+
+        Args:
+            batch_size: Number of rows fetched from the cursor at a time
+            **filters: Filter parameters
+
+        Yields:
+            Matching resources
+        """
+        query = self._stream_query(filters).execution_options(yield_per=batch_size)
+        async with self.session.bind.connect() as connection:
+            result = await connection.stream(query)
+            keys = list(result.keys())
+            async for rows in result.partitions():
+                for resource in self._rows_to_dicts(keys, rows):
+                    yield resource
+
+    async def _commit_upserts(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write validated upsert rows and commit them (see upsert).
+
+        The INSERT ... ON CONFLICT statements are shared with the sync
+        service, run through the session's sync side.
+        """
+        try:
+            resources = await self.session.run_sync(self._upsert_rows, rows)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate(row["id"] for row in rows)
+
+        return resources
+
+    async def _existing_ids(self, resource_ids: List[Any]) -> set:
+        """Return which of the given primary keys exist in the table."""
+        primary_key = self._primary_key()
+        found = set()
+        for chunk in _chunks(resource_ids):
+            found.update(
+                await self.session.exec(
+                    select(primary_key).where(primary_key.in_(chunk))
+                )
+            )
+        return found
@@ -0,0 +1,261 @@
+"""Read-through caches for resources served by the SQL backends."""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from pydantic_core import to_json
+
+
+class ResourceCache:
+    """Interface of a cache of resources by ID, for one resource type.
+
+    Values are the JSON-compatible dicts services return. Readers take a
+    ``version()`` before loading a resource and pass it to ``set``, so a value
+    read while a write to the same resource was in flight isn't cached after
+    the write has invalidated it.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached resource, or None on a miss."""
+        raise NotImplementedError
+
+    def set(
+        self, key: str, value: Dict[str, Any], version: Optional[int] = None
+    ) -> None:
+        """Cache a resource, unless the cache was invalidated since ``version``."""
+        raise NotImplementedError
+
+    def version(self) -> int:
+        """Return a token to pass to ``set`` for a resource about to be read."""
+        return 0
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        """Drop resources that were written."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every cached resource."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        """Return the number of cached resources."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit, miss and eviction counters and the number of entries."""
+        lookups = self.hits + self.misses
+        return {
+            "cache": type(self).__name__,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+class LRUCache(ResourceCache):
+    """In-process cache evicting the least recently used resources.
+
+    Entries older than ``ttl`` seconds are treated as misses, which bounds
+    how long a resource written by another process can be served stale.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached resources
+            ttl: Seconds an entry stays valid, or None to keep it until it
+                is evicted or invalidated
+        """
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (
+                self.ttl is not None and time.monotonic() - entry[1] > self.ttl
+            ):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def set(
+        self, key: str, value: Dict[str, Any], version: Optional[int] = None
+    ) -> None:
+        with self._lock:
+            if version is not None and version != self._version:
+                return
+            self._entries[key] = (dict(value), time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._version += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "max_entries": self.max_entries, "ttl": self.ttl}
+
+
+class SharedCache(ResourceCache):
+    """Cache in a local SQLite file, shared by the workers on one host.
+
+    A write in any worker invalidates the resource for all of them. When the
+    cache is full the least recently stored entries are evicted. Versions
+    only track invalidations made by this process, so ``ttl`` also bounds
+    how long a read racing a write in another worker can stay cached.
+    """
+
+    # Check the size limit every this many stores rather than on each one
+    TRIM_INTERVAL = 100
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        namespace: str,
+        max_entries: int = 10000,
+        ttl: Optional[float] = None,
+    ):
+        """Open (or create) the cache file.
+
+        Args:
+            path: Path of the SQLite cache file
+            namespace: Resource type the cached entries belong to
+            max_entries: Maximum number of cached resources in the namespace
+            ttl: Seconds an entry stays valid, or None to keep it until it
+                is evicted or invalidated
+        """
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = Path(path)
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._version = 0
+        self._stores = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.path), timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        # The cache can always be rebuilt, so don't pay for durability
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "stored REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_stored ON entries (namespace, stored)"
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, stored FROM entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None or (
+                self.ttl is not None and time.time() - row[1] > self.ttl
+            ):
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(
+        self, key: str, value: Dict[str, Any], version: Optional[int] = None
+    ) -> None:
+        encoded = to_json(value).decode()
+        with self._lock:
+            if version is not None and version != self._version:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (self.namespace, key, encoded, time.time()),
+            )
+            self._stores += 1
+            if self._stores % self.TRIM_INTERVAL == 0:
+                self._trim()
+
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            self._version += 1
+            self._connection.executemany(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                [(self.namespace, key) for key in keys],
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._connection.execute(
+                "DELETE FROM entries WHERE namespace = ?", (self.namespace,)
+            )
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._connection.close()
+
+    def _trim(self) -> None:
+        """Evict the oldest entries beyond the size limit."""
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries "
+                "WHERE namespace = ? ORDER BY stored LIMIT ?)",
+                (self.namespace, excess),
+            )
+            self.evictions += excess
+
+    def __len__(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "max_entries": self.max_entries, "ttl": self.ttl}
@@ -0,0 +1,141 @@
+"""Group commit of concurrent writes for the SQLModel backend."""
+
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+
+# A write to run in a shared transaction; returns the caller's result
+Operation = Callable[[Session], Any]
+
+
+class WriteCoalescer:
+    """Run concurrent writes together in shared transactions.
+
+    Writes submitted within ``window`` seconds of each other, or while the
+    previous batch is committing, are run in one transaction of up to
+    ``max_batch`` writes, so N concurrent writers cost one commit (and one
+    fsync) instead of N. Each write runs inside its own SAVEPOINT: a write
+    that fails is rolled back alone and its error goes to its own caller,
+    while the rest of the batch still commits. If the commit itself fails,
+    every caller in the batch gets that error.
+
+    Batches are committed on a worker thread, one at a time.
+    """
+
+    def __init__(self, engine: Engine, window: float = 0.002, max_batch: int = 100):
+        """Initialize the coalescer.
+
+        Args:
+            engine: Engine to open batch sessions on
+            window: Seconds to wait for more writes before committing a batch
+            max_batch: Maximum number of writes per transaction
+        """
+        self.engine = engine
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.operations = 0
+        self._pending: List[Tuple[Operation, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_full: Optional[asyncio.Event] = None
+
+    async def submit(self, operation: Operation) -> Any:
+        """Run a write in the next batch and return its result.
+
+        Args:
+            operation: Function that performs the write on the batch session
+                without committing, and returns the caller's result
+
+        Returns:
+            The operation's result, once its batch has committed
+
+        Raises:
+            Exception: Whatever the operation raised, or the commit error
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((operation, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        elif len(self._pending) >= self.max_batch and self._batch_full is not None:
+            self._batch_full.set()
+        return await future
+
+    async def _flush(self) -> None:
+        """Commit batches until no writes are pending."""
+        batch: List[Tuple[Operation, asyncio.Future]] = []
+        try:
+            # Give concurrent writers a moment to join the first batch; later
+            # batches are made of writes that arrived during the last commit
+            if self.window > 0 and len(self._pending) < self.max_batch:
+                self._batch_full = asyncio.Event()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+                self._batch_full = None
+
+            loop = asyncio.get_running_loop()
+            while self._pending:
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+
+                outcomes = await loop.run_in_executor(
+                    None, self._run_batch, [operation for operation, _ in batch]
+                )
+                self.batches += 1
+                self.operations += len(batch)
+                for (_, future), (result, error) in zip(batch, outcomes):
+                    if future.done():
+                        continue
+                    if error is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(error)
+                batch = []
+        except BaseException as e:
+            # The batch never ran to completion (e.g. the executor is shut
+            # down, or the flush was cancelled): don't leave callers waiting
+            failed = batch + self._pending
+            self._pending = []
+            self._batch_full = None
+            for _, future in failed:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            self._flush_task = None
+
+    def _run_batch(
+        self, operations: List[Operation]
+    ) -> List[Tuple[Any, Optional[BaseException]]]:
+        """Run a batch of writes in one transaction and commit it.
+
+        Returns:
+            A (result, error) pair per operation
+        """
+        outcomes: List[Tuple[Any, Optional[BaseException]]] = []
+        with Session(self.engine) as session:
+            try:
+                if self.engine.dialect.driver == "pysqlite":
+                    # pysqlite only begins a transaction before DML, so the
+                    # first SAVEPOINT would otherwise commit when released
+                    session.connection().exec_driver_sql("BEGIN")
+                for operation in operations:
+                    try:
+                        with session.begin_nested():
+                            outcomes.append((operation(session), None))
+                    except Exception as e:
+                        outcomes.append((None, e))
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                return [(None, e)] * len(operations)
+        return outcomes
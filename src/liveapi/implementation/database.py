@@ -1,24 +1,256 @@
 """Database connection and session management for SQLModel."""
 
+import json
 import os
-from typing import Generator, Optional
+import re
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple
 from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.engine import Engine
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Connection, Engine, make_url
+from sqlalchemy.pool import Pool, QueuePool, SingletonThreadPool
+
+from .caching import LRUCache, ResourceCache, SharedCache
+from .coalescing import WriteCoalescer
+from .session_scope import SessionScopes, UnitOfWork
+from .threadpool import BlockingExecutor
+
+
+# Async drivers used by the sqlmodel_async backend, per database
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+# Environment variables that override DatabaseConfig fields
+ENV_VARS = {
+    "pool_size": ("DATABASE_POOL_SIZE", int),
+    "max_overflow": ("DATABASE_MAX_OVERFLOW", int),
+    "pool_timeout": ("DATABASE_POOL_TIMEOUT", float),
+    "pool_recycle": ("DATABASE_POOL_RECYCLE", int),
+    "pool_pre_ping": ("DATABASE_POOL_PRE_PING", _env_bool),
+    "statement_cache_size": ("DATABASE_STATEMENT_CACHE_SIZE", int),
+    "sqlite_journal_mode": ("DATABASE_SQLITE_JOURNAL_MODE", str),
+    "sqlite_synchronous": ("DATABASE_SQLITE_SYNCHRONOUS", str),
+    "sqlite_mmap_size": ("DATABASE_SQLITE_MMAP_SIZE", int),
+    "sqlite_cache_size": ("DATABASE_SQLITE_CACHE_SIZE", int),
+    "write_coalescing": ("DATABASE_WRITE_COALESCING", _env_bool),
+    "write_batch_window": ("DATABASE_WRITE_BATCH_WINDOW", float),
+    "write_batch_size": ("DATABASE_WRITE_BATCH_SIZE", int),
+    "read_cache_size": ("DATABASE_READ_CACHE_SIZE", int),
+    "read_cache_ttl": ("DATABASE_READ_CACHE_TTL", float),
+    "read_cache_path": ("DATABASE_READ_CACHE_PATH", str),
+    "executor_threads": ("DATABASE_EXECUTOR_THREADS", int),
+    "executor_queue_size": ("DATABASE_EXECUTOR_QUEUE_SIZE", int),
+}
+
+
+@dataclass
+class DatabaseConfig:
+    """Connection pool and engine settings for the SQL backends.
+
+    Settings come from the ``database`` section of ``.liveapi/config.json``
+    and can be overridden with ``DATABASE_*`` environment variables (see
+    ENV_VARS). SQLite pragmas are only applied when set.
+    """
+
+    pool_size: int = 5  # Connections kept open in the pool
+    max_overflow: int = 10  # Extra connections opened under load
+    pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    pool_recycle: int = -1  # Reconnect connections older than this (seconds)
+    pool_pre_ping: bool = False  # Test connections before handing them out
+    statement_cache_size: int = 500  # Compiled statements cached per engine
+    sqlite_journal_mode: Optional[str] = None  # e.g. "WAL"
+    sqlite_synchronous: Optional[str] = None  # e.g. "NORMAL"
+    sqlite_mmap_size: Optional[int] = None  # Bytes of the file to memory-map
+    sqlite_cache_size: Optional[int] = None  # Pages, or KiB if negative
+    write_coalescing: bool = False  # Commit concurrent writes together
+    write_batch_window: float = 0.002  # Seconds to gather a write batch
+    write_batch_size: int = 100  # Maximum writes per shared transaction
+    read_cache_size: int = 0  # Resources cached per type for reads by ID (0: off)
+    read_cache_ttl: Optional[float] = None  # Seconds a cached resource is valid
+    read_cache_path: Optional[str] = None  # SQLite file shared by local workers
+    executor_threads: int = 4  # Threads running sync queries (0: event loop)
+    executor_queue_size: int = 64  # Queries waiting for a thread before backpressure
+
+    @classmethod
+    def load(cls, project_root: Optional[Path] = None) -> "DatabaseConfig":
+        """Load settings from the project config and the environment.
+
+        Args:
+            project_root: Directory containing ``.liveapi``. Defaults to the
+                current directory.
+
+        Returns:
+            The merged configuration
+
+        Raises:
+            ValueError: If a setting is unknown or has an invalid value
+        """
+        settings: Dict[str, Any] = {}
+        config_file = (project_root or Path.cwd()) / ".liveapi" / "config.json"
+        if config_file.exists():
+            with open(config_file, "r") as f:
+                settings.update(json.load(f).get("database") or {})
+
+        for name, (variable, parse) in ENV_VARS.items():
+            if variable in os.environ:
+                try:
+                    settings[name] = parse(os.environ[variable])
+                except ValueError:
+                    raise ValueError(f"Invalid value for {variable}")
+
+        known = {field.name for field in fields(cls)}
+        unknown = sorted(set(settings) - known)
+        if unknown:
+            raise ValueError(f"Unknown database settings: {', '.join(unknown)}")
+        return cls(**settings)
+
+    def engine_options(self, url: URL) -> Dict[str, Any]:
+        """Build create_engine keyword arguments for a database URL.
+
+        Pool sizing only applies to queue pools; SQLite in-memory databases
+        use a single shared connection instead.
+        """
+        options: Dict[str, Any] = {
+            "pool_pre_ping": self.pool_pre_ping,
+            "pool_recycle": self.pool_recycle,
+            "query_cache_size": self.statement_cache_size,
+        }
+        if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+            options.update(
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout,
+            )
+        if url.get_backend_name() == "sqlite" and url.get_driver_name() == "pysqlite":
+            options["connect_args"] = {"check_same_thread": False}
+        elif url.get_driver_name() == "asyncpg":
+            options["connect_args"] = {
+                "prepared_statement_cache_size": self.statement_cache_size
+            }
+        return options
+
+    def sqlite_pragmas(self) -> List[Tuple[str, Any]]:
+        """Return the configured SQLite pragmas as (name, value) pairs.
+
+        Raises:
+            ValueError: If a pragma value is invalid
+        """
+        pragmas = []
+        for name in ("journal_mode", "synchronous"):
+            value = getattr(self, f"sqlite_{name}")
+            if value is not None:
+                if not re.fullmatch(r"[A-Za-z]+", str(value)):
+                    raise ValueError(f"Invalid SQLite {name}: {value}")
+                pragmas.append((name, value))
+        for name in ("mmap_size", "cache_size"):
+            value = getattr(self, f"sqlite_{name}")
+            if value is not None:
+                pragmas.append((name, int(value)))
+        return pragmas
+
+
+class PoolMonitor:
+    """Count connection checkouts on a pool, for sizing it from data."""
+
+    def __init__(self, pool: Pool):
+        """Start monitoring a pool.
+
+        Args:
+            pool: Connection pool to monitor
+        """
+        self.pool = pool
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    def _on_checkout(self, *args: Any) -> None:
+        self.checkouts += 1
+        self.checked_out += 1
+        self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, *args: Any) -> None:
+        self.checked_out -= 1
+
+    def status(self) -> Dict[str, Any]:
+        """Return current and cumulative statistics for the pool."""
+        stats: Dict[str, Any] = {
+            "pool": type(self.pool).__name__,
+            "checked_out": self.checked_out,
+            "peak_checked_out": self.peak_checked_out,
+            "checkouts": self.checkouts,
+        }
+        if isinstance(self.pool, QueuePool):
+            stats.update(
+                size=self.pool.size(),
+                checked_in=self.pool.checkedin(),
+                overflow=self.pool.overflow(),
+                timeout=self.pool.timeout(),
+            )
+        return stats
+
+
+def _apply_sqlite_pragmas(engine: Engine, pragmas: List[Tuple[str, Any]]) -> None:
+    """Run the given PRAGMA statements on every new connection."""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _create_schema(connection: Connection) -> None:
+    """Create missing tables, and missing indexes on existing tables.
+
+    ``create_all`` only creates indexes along with their table, so indexes
+    added to the spec later are created here for tables that already exist.
+    """
+    SQLModel.metadata.create_all(connection)
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 class DatabaseManager:
     """Manages database connections and sessions for SQLModel."""
 
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        config: Optional[DatabaseConfig] = None,
+    ):
         """Initialize database manager.
 
         Args:
             database_url: Database connection URL. If None, uses DATABASE_URL env var
                          or defaults to SQLite in-memory database for development.
+            config: Pool and engine settings. If None, they are loaded from the
+                project config and environment (see DatabaseConfig.load).
         """
         self.database_url = database_url or self._get_database_url()
+        self.config = config or DatabaseConfig.load()
         self.engine: Optional[Engine] = None
+        self.async_engine: Optional[Any] = None
+        self._monitors: Dict[str, PoolMonitor] = {}
+        self._write_coalescer: Optional[WriteCoalescer] = None
+        self._read_caches: Dict[str, ResourceCache] = {}
+        self._executor: Optional[BlockingExecutor] = None
+        self._session_scopes: Dict[str, SessionScopes] = {}
         self._initialized = False
+        self._async_initialized = False
 
     def _get_database_url(self) -> str:
         """Get database URL from environment or return default."""
@@ -32,30 +264,222 @@ class DatabaseManager:
     def get_engine(self) -> Engine:
         """Get or create database engine."""
         if self.engine is None:
-            # Configure engine based on database type
-            if self.database_url.startswith("sqlite"):
-                # SQLite-specific configuration
-                self.engine = create_engine(
-                    self.database_url,
-                    connect_args={"check_same_thread": False},
-                    echo=os.getenv("DATABASE_DEBUG", "false").lower() == "true",
+            url = make_url(self.database_url)
+            self.engine = create_engine(
+                url,
+                echo=os.getenv("DATABASE_DEBUG", "false").lower() == "true",
+                **self.config.engine_options(url),
+            )
+            if url.get_backend_name() == "sqlite":
+                _apply_sqlite_pragmas(self.engine, self.config.sqlite_pragmas())
+            self._monitors["sync"] = PoolMonitor(self.engine.pool)
+
+        return self.engine
+
+    def get_async_database_url(self) -> str:
+        """Get the database URL with an async driver.
+
+        URLs without a driver get the matching one from ASYNC_DRIVERS, so
+        ``sqlite:///app.db`` becomes ``sqlite+aiosqlite:///app.db``. URLs
+        that already name a driver are used as given.
+        """
+        url = make_url(self.database_url)
+        if url.drivername in ASYNC_DRIVERS:
+            url = url.set(
+                drivername=f"{url.drivername}+{ASYNC_DRIVERS[url.drivername]}"
+            )
+        return url.render_as_string(hide_password=False)
+
+    def get_async_engine(self):
+        """Get or create the async database engine.
+
+        Raises:
+            ImportError: If the async driver for the database isn't installed
+        """
+        if self.async_engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            url = make_url(self.get_async_database_url())
+            self.async_engine = create_async_engine(
+                url,
+                echo=os.getenv("DATABASE_DEBUG", "false").lower() == "true",
+                **self.config.engine_options(url),
+            )
+            sync_engine = self.async_engine.sync_engine
+            if url.get_backend_name() == "sqlite":
+                _apply_sqlite_pragmas(sync_engine, self.config.sqlite_pragmas())
+            self._monitors["async"] = PoolMonitor(sync_engine.pool)
+
+        return self.async_engine
+
+    def get_write_coalescer(self) -> Optional[WriteCoalescer]:
+        """Get the write coalescer for the sync engine.
+
+        Returns:
+            The shared WriteCoalescer, or None if write coalescing is off
+        """
+        if not self.config.write_coalescing:
+            return None
+        if self._write_coalescer is None:
+            self._write_coalescer = WriteCoalescer(
+                self.get_engine(),
+                window=self.config.write_batch_window,
+                max_batch=self.config.write_batch_size,
+            )
+        return self._write_coalescer
+
+    def get_executor(self) -> Optional[BlockingExecutor]:
+        """Get the thread pool running the sync backend's blocking work.
+
+        In-memory SQLite keeps one connection per thread, each with its own
+        database, so its queries stay on the event loop.
+
+        Returns:
+            The shared BlockingExecutor, or None if queries run on the loop
+        """
+        if self.config.executor_threads <= 0:
+            return None
+        if self._executor is None:
+            if isinstance(self.get_engine().pool, SingletonThreadPool):
+                return None
+            self._executor = BlockingExecutor(
+                self.config.executor_threads, self.config.executor_queue_size
+            )
+        return self._executor
+
+    def executor_stats(self) -> Optional[Dict[str, Any]]:
+        """Return queue depth and wait statistics of the thread pool, if any."""
+        return self._executor.stats() if self._executor else None
+
+    def get_read_cache(self, resource_name: str) -> Optional[ResourceCache]:
+        """Get the read-through cache for a resource type.
+
+        The cache lives in this process, or in the ``read_cache_path`` file
+        shared by the workers on this host.
+
+        Args:
+            resource_name: Name of the resource (e.g., "users")
+
+        Returns:
+            The resource type's cache, or None if read caching is off
+        """
+        if self.config.read_cache_size <= 0:
+            return None
+        if resource_name not in self._read_caches:
+            if self.config.read_cache_path:
+                cache: ResourceCache = SharedCache(
+                    self.config.read_cache_path,
+                    resource_name,
+                    max_entries=self.config.read_cache_size,
+                    ttl=self.config.read_cache_ttl,
                 )
             else:
-                # PostgreSQL and other databases
-                self.engine = create_engine(
-                    self.database_url,
-                    echo=os.getenv("DATABASE_DEBUG", "false").lower() == "true",
+                cache = LRUCache(
+                    self.config.read_cache_size, ttl=self.config.read_cache_ttl
                 )
+            self._read_caches[resource_name] = cache
+        return self._read_caches[resource_name]
 
-        return self.engine
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return read cache statistics keyed by resource name."""
+        return {name: cache.stats() for name, cache in self._read_caches.items()}
+
+    def get_session_scopes(self) -> SessionScopes:
+        """Get the pool of request units of work for the sync backend.
+
+        Their services use this manager's write coalescer, read caches and
+        executor.
+
+        Returns:
+            The shared SessionScopes
+        """
+        if "sync" not in self._session_scopes:
+            engine = self.get_engine()
+            self._session_scopes["sync"] = SessionScopes(
+                lambda: Session(engine),
+                self._build_sql_service,
+                max_idle=self.config.pool_size + self.config.max_overflow,
+                executor=self.get_executor(),
+            )
+        return self._session_scopes["sync"]
+
+    def get_async_session_scopes(self) -> SessionScopes:
+        """Get the pool of request units of work for the async backend.
+
+        Instances aren't expired on commit, since reloading them implicitly
+        isn't possible with async I/O.
+
+        Returns:
+            The shared SessionScopes
+        """
+        if "async" not in self._session_scopes:
+            from sqlmodel.ext.asyncio.session import AsyncSession
+
+            engine = self.get_async_engine()
+            self._session_scopes["async"] = SessionScopes(
+                lambda: AsyncSession(engine, expire_on_commit=False),
+                self._build_async_sql_service,
+                max_idle=self.config.pool_size + self.config.max_overflow,
+            )
+        return self._session_scopes["async"]
+
+    def session_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return unit of work reuse statistics keyed by "sync" and/or "async"."""
+        return {name: scopes.stats() for name, scopes in self._session_scopes.items()}
+
+    def _build_sql_service(
+        self, model: Any, resource_name: str, session: Session
+    ) -> Any:
+        """Build a sync SQL resource service for a unit of work."""
+        from .sql_model_resource_service import SQLModelResourceService
+
+        return SQLModelResourceService(
+            model=model,
+            resource_name=resource_name,
+            session=session,
+            coalescer=self.get_write_coalescer(),
+            cache=self.get_read_cache(resource_name),
+            executor=self.get_executor(),
+        )
+
+    def _build_async_sql_service(
+        self, model: Any, resource_name: str, session: Any
+    ) -> Any:
+        """Build an async SQL resource service for a unit of work."""
+        from .async_sql_model_resource_service import AsyncSQLModelResourceService
+
+        return AsyncSQLModelResourceService(
+            model=model,
+            resource_name=resource_name,
+            session=session,
+            cache=self.get_read_cache(resource_name),
+        )
+
+    def pool_status(self) -> Dict[str, Dict[str, Any]]:
+        """Return connection pool statistics for each engine in use.
+
+        Returns:
+            Statistics keyed by "sync" and/or "async", including connections
+            currently and at most checked out and the total checkouts
+        """
+        return {name: monitor.status() for name, monitor in self._monitors.items()}
 
     def create_db_and_tables(self) -> None:
-        """Create database tables from SQLModel metadata."""
+        """Create database tables and their indexes from SQLModel metadata."""
         if not self._initialized:
             engine = self.get_engine()
-            SQLModel.metadata.create_all(engine)
+            with engine.begin() as connection:
+                _create_schema(connection)
             self._initialized = True
 
+    async def create_db_and_tables_async(self) -> None:
+        """Create database tables and indexes on the async engine."""
+        if not self._async_initialized:
+            engine = self.get_async_engine()
+            async with engine.begin() as connection:
+                await connection.run_sync(_create_schema)
+            self._async_initialized = True
+
     def get_session(self) -> Generator[Session, None, None]:
         """Get database session for dependency injection.
 
@@ -69,12 +493,52 @@ class DatabaseManager:
             finally:
                 session.close()
 
+    async def get_async_session(self) -> AsyncGenerator[Any, None]:
+        """Get an async database session for dependency injection.
+
+        Instances aren't expired on commit, since reloading them implicitly
+        isn't possible with async I/O.
+
+        Yields:
+            Async database session that is automatically closed after use.
+        """
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        async with AsyncSession(
+            self.get_async_engine(), expire_on_commit=False
+        ) as session:
+            yield session
+
     def close(self) -> None:
         """Close database engine and connections."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
+            self._monitors.pop("sync", None)
+            self._session_scopes.pop("sync", None)
+            self._write_coalescer = None
             self._initialized = False
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+        self._close_read_caches()
+
+    async def close_async(self) -> None:
+        """Close the async database engine and its connections."""
+        if self.async_engine:
+            await self.async_engine.dispose()
+            self.async_engine = None
+            self._monitors.pop("async", None)
+            self._session_scopes.pop("async", None)
+            self._async_initialized = False
+        self._close_read_caches()
+
+    def _close_read_caches(self) -> None:
+        """Drop the read caches, closing any shared cache files."""
+        for cache in self._read_caches.values():
+            if isinstance(cache, SharedCache):
+                cache.close()
+        self._read_caches.clear()
 
 
 # Global database manager instance
@@ -95,12 +559,55 @@ def get_db_session() -> Generator[Session, None, None]:
     yield from db_manager.get_session()
 
 
+async def get_async_db_session() -> AsyncGenerator[Any, None]:
+    """FastAPI dependency for getting an async database session."""
+    db_manager = get_database_manager()
+    async for session in db_manager.get_async_session():
+        yield session
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """FastAPI dependency for the request's unit of work on the sync backend.
+
+    FastAPI resolves it once per request, so every resource service a request
+    depends on shares its session.
+    """
+    scopes = get_database_manager().get_session_scopes()
+    unit = scopes.acquire()
+    try:
+        yield unit
+    finally:
+        await scopes.release(unit)
+
+
+async def get_async_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """FastAPI dependency for the request's unit of work on the async backend."""
+    scopes = get_database_manager().get_async_session_scopes()
+    unit = scopes.acquire()
+    try:
+        yield unit
+    finally:
+        await scopes.release(unit)
+
+
 def init_database() -> None:
     """Initialize database tables."""
     db_manager = get_database_manager()
     db_manager.create_db_and_tables()
 
 
+async def init_async_database() -> None:
+    """Initialize database tables through the async engine."""
+    db_manager = get_database_manager()
+    await db_manager.create_db_and_tables_async()
+
+
+async def close_async_database() -> None:
+    """Close async database connections."""
+    db_manager = get_database_manager()
+    await db_manager.close_async()
+
+
 def close_database() -> None:
     """Close database connections."""
     global _db_manager
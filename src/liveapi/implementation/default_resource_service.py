@@ -1,9 +1,31 @@
 """Standard default handlers for LiveAPI resources."""
 
-from typing import Dict, Any, List, Type
+import asyncio
+from array import array
+from collections import Counter
+from contextlib import asynccontextmanager
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import (
+    Dict,
+    Any,
+    AsyncIterator,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+)
 from fastapi import Query, Path
 from pydantic import BaseModel
 from .exceptions import NotFoundError, ValidationError, ConflictError
+from .filters import BoundFilterPlan, compile_filters
+from .indexes import IndexDefinition, build_indexes
+from .pagination import decode_cursor, encode_cursor
+from .persistence import PUT, ResourceJournal
+from .storage import create_storage
+from .validation import validate_many, validate_partial
 
 
 class DefaultResourceService:
@@ -16,18 +38,66 @@ class DefaultResourceService:
     - Delete: DELETE /resources/{id}
     - List: GET /resources
     - Search: GET /resources with query parameters
+
+    Exact-match, range and substring filters on fields covered by a secondary
+    index (declared with ``x-liveapi-index`` in the spec) are resolved through
+    the index instead of scanning every stored resource.
     """
 
-    def __init__(self, model: Type[BaseModel], resource_name: str):
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        resource_name: str,
+        indexes: Optional[List[IndexDefinition]] = None,
+        storage_engine: str = "dict",
+        journal: Optional[ResourceJournal] = None,
+    ):
         """Initialize the resource service.
 
         Args:
             model: Pydantic model for the resource
             resource_name: Name of the resource (e.g., "users")
+            indexes: Secondary index definitions. Defaults to the indexes
+                declared on the model by the PydanticGenerator.
+            storage_engine: "dict" to keep each resource as a dict, or
+                "columnar" for compact column-wise storage (see
+                ColumnarStorage). Resources are returned as dicts either way.
+            journal: Optional snapshot + write-ahead log. When given, existing
+                resources are loaded from it and every change is logged and
+                made durable before the write returns. With a shared journal,
+                changes made by other processes are applied before each
+                operation.
+
+        Raises:
+            ValueError: If the storage engine is unknown
         """
         self.resource_name = resource_name
         self.model = model
-        self._storage: Dict[str, Dict[str, Any]] = {}  # In-memory storage
+        self._storage_engine = storage_engine
+        # In-memory storage
+        self._storage: MutableMapping[str, Dict[str, Any]] = create_storage(
+            storage_engine
+        )
+
+        if indexes is None:
+            indexes = getattr(model, "index_definitions", None) or []
+        self._indexes = build_indexes(indexes)
+
+        # Insertion order: sequence number per resource, plus parallel
+        # sequence/ID arrays that allow positional slicing and seeking.
+        # Deleted resources leave a None in the ID array until compacted.
+        self._sequence: Dict[str, int] = {}
+        self._order_sequences = array("q")
+        self._order_ids: List[Optional[str]] = []
+        self._tombstones = 0
+        self._next_sequence = 0
+
+        self._journal = journal
+        self._compacting = False
+        # Serializes journal catch-up, writes and compaction in this process
+        self._journal_lock = asyncio.Lock()
+        if journal is not None:
+            self._load_journal()
 
     async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new resource.
@@ -58,21 +128,28 @@ class DefaultResourceService:
             resource_id = str(uuid.uuid4())
             resource_data["id"] = resource_id
 
-        # Check for conflicts
-        if resource_id in self._storage:
-            raise ConflictError(
-                f"{self.resource_name} with ID {resource_id} already exists"
-            )
+        async with self._writing():
+            # Check for conflicts
+            if resource_id in self._storage:
+                raise ConflictError(
+                    f"{self.resource_name} with ID {resource_id} already exists"
+                )
 
-        # Add timestamps
-        from datetime import datetime, UTC
+            # Add timestamps
+            from datetime import datetime, UTC
 
-        now = datetime.now(UTC).isoformat()
-        resource_data["created_at"] = now
-        resource_data["updated_at"] = now
+            now = datetime.now(UTC).isoformat()
+            resource_data["created_at"] = now
+            resource_data["updated_at"] = now
 
-        # Store the resource
-        self._storage[resource_id] = resource_data
+            # Store the resource
+            self._storage[resource_id] = resource_data
+            self._track(resource_id, resource_data)
+            if self._journal is not None:
+                self._journal.put(resource_id, resource_data)
+
+        if self._journal is not None:
+            await self._persist()
 
         return resource_data
 
@@ -88,6 +165,7 @@ class DefaultResourceService:
         Raises:
             NotFoundError: If resource doesn't exist
         """
+        await self._refresh()
         if resource_id not in self._storage:
             raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
 
@@ -110,52 +188,273 @@ class DefaultResourceService:
             NotFoundError: If resource doesn't exist
             ValidationError: If data validation fails
         """
-        if resource_id not in self._storage:
-            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+        async with self._writing():
+            if resource_id not in self._storage:
+                raise NotFoundError(
+                    f"{self.resource_name} with ID {resource_id} not found"
+                )
+
+            existing = self._storage[resource_id]
+
+            if partial:
+                # PATCH: Validate only the changed fields
+                resource_data = validate_partial(self.model, existing, data)
+            else:
+                # PUT: Replace entirely
+                update_data = data
+                # Preserve system fields
+                update_data["id"] = resource_id
+                update_data["created_at"] = existing.get("created_at")
+
+                # Validate updated data
+                try:
+                    validated = self.model(**update_data)
+                    resource_data = validated.model_dump()
+                except Exception as e:
+                    raise ValidationError(f"Invalid data: {str(e)}")
+
+            # Update timestamp
+            from datetime import datetime, UTC
+
+            resource_data["updated_at"] = datetime.now(UTC).isoformat()
+
+            # Store updated resource
+            self._index_replace(resource_id, existing, resource_data)
+            self._storage[resource_id] = resource_data
+            if self._journal is not None:
+                self._journal.put(resource_id, resource_data)
+
+        if self._journal is not None:
+            await self._persist()
 
-        existing = self._storage[resource_id].copy()
+        return resource_data
 
-        if partial:
-            # PATCH: Merge with existing data
-            existing.update(data)
-            update_data = existing
-        else:
-            # PUT: Replace entirely
-            update_data = data
-            # Preserve system fields
-            update_data["id"] = resource_id
-            update_data["created_at"] = existing.get("created_at")
+    async def delete(self, resource_id: str) -> None:
+        """Delete a resource.
 
-        # Validate updated data
+        Args:
+            resource_id: The ID of the resource
+
+        Raises:
+            NotFoundError: If resource doesn't exist
+        """
+        async with self._writing():
+            if resource_id not in self._storage:
+                raise NotFoundError(
+                    f"{self.resource_name} with ID {resource_id} not found"
+                )
+
+            self._untrack(resource_id, self._storage.pop(resource_id))
+            if self._journal is not None:
+                self._journal.delete(resource_id)
+
+        if self._journal is not None:
+            await self._persist()
+
+    async def upsert(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a resource with the given ID, or replace it if it exists.
+
+        A replaced resource keeps its ``created_at``.
+
+        Args:
+            resource_id: The ID of the resource
+            data: Resource data
+
+        Returns:
+            The stored resource
+
+        Raises:
+            ValidationError: If data validation fails
+        """
         try:
-            validated = self.model(**update_data)
+            validated = self.model(**{**data, "id": resource_id})
             resource_data = validated.model_dump()
         except Exception as e:
             raise ValidationError(f"Invalid data: {str(e)}")
 
-        # Update timestamp
         from datetime import datetime, UTC
 
-        resource_data["updated_at"] = datetime.now(UTC).isoformat()
+        now = datetime.now(UTC).isoformat()
+        async with self._writing():
+            self._put(resource_id, resource_data, now)
 
-        # Store updated resource
-        self._storage[resource_id] = resource_data
+        if self._journal is not None:
+            await self._persist()
 
         return resource_data
 
-    async def delete(self, resource_id: str) -> None:
-        """Delete a resource.
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many resources at once.
+
+        All items are validated in a single pass and either all are created
+        or, if any is invalid or conflicts, none are.
 
         Args:
-            resource_id: The ID of the resource
+            items: Resource data for each new resource
+
+        Returns:
+            Created resources, in the order given
 
         Raises:
-            NotFoundError: If resource doesn't exist
+            ConflictError: If an ID already exists or is repeated in the batch
+            ValidationError: If any item is invalid
         """
-        if resource_id not in self._storage:
-            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+        resources = validate_many(self.model, items)
+
+        import uuid
+        from datetime import datetime, UTC
+
+        now = datetime.now(UTC).isoformat()
+        async with self._writing():
+            seen = set()
+            for resource_data in resources:
+                resource_id = resource_data.get("id")
+                if not resource_id:
+                    resource_id = str(uuid.uuid4())
+                    resource_data["id"] = resource_id
+                if resource_id in self._storage or resource_id in seen:
+                    raise ConflictError(
+                        f"{self.resource_name} with ID {resource_id} already exists"
+                    )
+                seen.add(resource_id)
+
+            for resource_data in resources:
+                resource_id = resource_data["id"]
+                resource_data["created_at"] = now
+                resource_data["updated_at"] = now
+                self._storage[resource_id] = resource_data
+                self._track(resource_id, resource_data)
+                if self._journal is not None:
+                    self._journal.put(resource_id, resource_data)
+
+        if self._journal is not None:
+            await self._persist()
+
+        return resources
+
+    async def bulk_update(
+        self, items: List[Dict[str, Any]], partial: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Update many resources at once.
+
+        Each item carries the ``id`` of the resource to update. All merged
+        resources are validated in a single pass and either all updates are
+        applied or none are.
+
+        Args:
+            items: Updated data for each resource, including its ``id``
+            partial: If True, merge each item into the existing resource
+                (PATCH); otherwise replace it (PUT)
+
+        Returns:
+            Updated resources, in the order given
+
+        Raises:
+            NotFoundError: If any resource doesn't exist
+            ValidationError: If an item has no ``id`` or any result is invalid
+        """
+        from datetime import datetime, UTC
+
+        async with self._writing():
+            merged = []
+            for item in items:
+                resource_id = item.get("id")
+                if not resource_id:
+                    raise ValidationError("Invalid data: every item needs an id")
+                if resource_id not in self._storage:
+                    raise NotFoundError(
+                        f"{self.resource_name} with ID {resource_id} not found"
+                    )
+                existing = self._storage[resource_id]
+                if partial:
+                    update_data = {**existing, **item}
+                else:
+                    update_data = {**item, "created_at": existing.get("created_at")}
+                merged.append(update_data)
+
+            resources = validate_many(self.model, merged)
+
+            now = datetime.now(UTC).isoformat()
+            for resource_data in resources:
+                resource_id = resource_data["id"]
+                resource_data["updated_at"] = now
+                self._index_replace(
+                    resource_id, self._storage[resource_id], resource_data
+                )
+                self._storage[resource_id] = resource_data
+                if self._journal is not None:
+                    self._journal.put(resource_id, resource_data)
+
+        if self._journal is not None:
+            await self._persist()
+
+        return resources
+
+    async def bulk_delete(self, resource_ids: List[str]) -> None:
+        """Delete many resources at once.
 
-        del self._storage[resource_id]
+        Either all resources are deleted or, if any doesn't exist, none are.
+
+        Args:
+            resource_ids: IDs of the resources to delete
+
+        Raises:
+            NotFoundError: If any resource doesn't exist
+        """
+        async with self._writing():
+            missing = [rid for rid in resource_ids if rid not in self._storage]
+            if missing:
+                raise NotFoundError(
+                    f"{self.resource_name} with IDs {', '.join(map(str, missing))} not found"
+                )
+
+            for resource_id in dict.fromkeys(resource_ids):
+                self._untrack(resource_id, self._storage.pop(resource_id))
+                if self._journal is not None:
+                    self._journal.delete(resource_id)
+
+        if self._journal is not None:
+            await self._persist()
+
+    async def bulk_upsert(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create or replace many resources at once.
+
+        Each item carries the ``id`` of its resource. All items are validated
+        in a single pass and either all are written or, if any is invalid,
+        none are.
+
+        Args:
+            items: Resource data for each resource, including its ``id``
+
+        Returns:
+            The stored resources, in the order given
+
+        Raises:
+            ConflictError: If an ID is repeated in the batch
+            ValidationError: If an item has no ``id`` or any item is invalid
+        """
+        ids = [item.get("id") for item in items]
+        if not all(ids):
+            raise ValidationError("Invalid data: every item needs an id")
+        repeated = sorted(str(rid) for rid, count in Counter(ids).items() if count > 1)
+        if repeated:
+            raise ConflictError(
+                f"{self.resource_name} with IDs {', '.join(repeated)} "
+                "repeated in the batch"
+            )
+        resources = validate_many(self.model, items)
+
+        from datetime import datetime, UTC
+
+        now = datetime.now(UTC).isoformat()
+        async with self._writing():
+            for resource_data in resources:
+                self._put(resource_data["id"], resource_data, now)
+
+        if self._journal is not None:
+            await self._persist()
+
+        return resources
 
     async def list(
         self,
@@ -165,6 +464,10 @@ class DefaultResourceService:
     ) -> List[Dict[str, Any]]:
         """List resources (simplified - no pagination).
 
+        Only the requested page is materialised: without filters the page is
+        sliced straight from the insertion order, and with filters matching
+        stops as soon as ``offset + limit`` resources have been found.
+
         Args:
             limit: Maximum number of results
             offset: Number of results to skip
@@ -173,67 +476,388 @@ class DefaultResourceService:
         Returns:
             Simple list of resources
         """
-        # Get all resources
-        all_resources = list(self._storage.values())
+        await self._refresh()
+        plan = compile_filters(filters)
 
-        # Apply filters
-        filtered = self._apply_filters(all_resources, filters)
+        if not plan:
+            if self._tombstones:
+                self._compact_order()
+            page = self._order_ids[offset : offset + limit]
+            return [self._storage[resource_id] for resource_id in page]
 
-        # Apply simple limit/offset (no pagination wrapper)
-        return filtered[offset : offset + limit]
+        return list(islice(self._iter_matches(plan), offset, offset + limit))
 
-    def _apply_filters(
-        self, resources: List[Dict[str, Any]], filters: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Apply filters to resource list.
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of resources using keyset (cursor) pagination.
+
+        The cursor encodes the insertion sequence of the last resource on the
+        previous page, so fetching any page costs the same as the first.
+
+        Args:
+            limit: Maximum number of results
+            cursor: Cursor returned with the previous page, or None to start
+            **filters: Additional filter parameters
+
+        Returns:
+            The page of resources and the cursor for the next page, or None
+            if this is the last page
+
+        Raises:
+            ValidationError: If the cursor or limit is invalid
+        """
+        if limit < 1:
+            raise ValidationError("Invalid limit: must be at least 1")
+        after = None
+        if cursor:
+            after = decode_cursor(cursor)
+            # bool is an int subclass, but never a sequence number
+            if isinstance(after, bool) or not isinstance(after, int):
+                raise ValidationError(f"Invalid pagination cursor: {cursor!r}")
+
+        await self._refresh()
+        plan = compile_filters(filters)
+        page = list(islice(self._iter_matches(plan, after), limit + 1))
+
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor(self._sequence[page[-1]["id"]])
+        return page, next_cursor
+
+    async def stream(
+        self, batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every resource matching the filters, in insertion order.
+
+        Resources are fetched a batch at a time and the position is resumed
+        by insertion sequence, so writes made while a consumer is between
+        batches are tolerated and memory use stays flat.
 
         Args:
-            resources: List of resources to filter
-            filters: Filter parameters
+            batch_size: Number of resources fetched per batch
+            **filters: Filter parameters
+
+        Yields:
+            Matching resources
+        """
+        plan = compile_filters(filters)
+        after = None
+        while True:
+            await self._refresh()
+            batch = list(islice(self._iter_matches(plan, after), batch_size))
+            if not batch:
+                return
+            after = self._sequence[batch[-1]["id"]]
+            for resource in batch:
+                yield resource
+            if len(batch) < batch_size:
+                return
+
+    def _iter_matches(
+        self, plan: BoundFilterPlan, after: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily yield resources matching a filter plan, in insertion order.
+
+        Args:
+            plan: Compiled filter plan
+            after: Only yield resources inserted after this sequence number
+        """
+        # Narrow the candidates through a secondary index when possible
+        ids = self._index_candidate_ids(plan)
+
+        start = 0
+        if ids is None:
+            ids = self._order_ids
+            if after is not None:
+                start = bisect_right(self._order_sequences, after)
+        elif after is not None:
+            start = bisect_right(ids, after, key=self._sequence.__getitem__)
+
+        storage = self._storage
+        for position in range(start, len(ids)):
+            resource_id = ids[position]
+            if resource_id is None:
+                continue
+            resource = storage[resource_id]
+            if plan.matches(resource):
+                yield resource
+
+    def index_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Report size and estimated memory use of each secondary index.
 
         Returns:
-            Filtered list of resources
+            Mapping of index name to its type, fields, entry count and
+            estimated memory in bytes
+        """
+        return {
+            name: {
+                "type": index.definition.type.value,
+                "fields": list(index.fields),
+                "entries": len(index),
+                "memory_bytes": index.memory_usage(),
+            }
+            for name, index in self._indexes.items()
+        }
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild insertion order and secondary indexes from the storage."""
+        for index in self._indexes.values():
+            index.clear()
+        self._sequence = {}
+        self._order_sequences = array("q")
+        self._order_ids = []
+        self._tombstones = 0
+        self._next_sequence = 0
+        for resource_id in self._storage:
+            # Only secondary indexes need the resource itself; skipping it
+            # otherwise keeps lazily loaded storage undecoded
+            resource = self._storage[resource_id] if self._indexes else None
+            self._track(resource_id, resource)
+
+    async def _persist(self) -> None:
+        """Wait for logged changes to be durable and compact the log if due.
+
+        Changes are applied in memory and appended to the journal without
+        yielding to the event loop, so concurrent writers always see a
+        consistent state; only the wait for the group commit is awaited.
+
+        Compaction encodes and writes every resource, so it runs on a worker
+        thread. Writers to this collection wait for it to finish (the log it
+        replaces must not grow meanwhile); other requests carry on.
+        """
+        await self._journal.commit()
+        if self._journal.needs_compaction() and not self._compacting:
+            self._compacting = True
+            try:
+                async with self._writing():
+                    # Another process may have compacted the log meanwhile
+                    if self._journal.needs_compaction():
+                        await self._journal.wait_for_sync()
+                        items = self._snapshot_items(
+                            self._storage, list(self._order_ids)
+                        )
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(None, self._journal.compact, items)
+            finally:
+                self._compacting = False
+
+    @asynccontextmanager
+    async def _writing(self) -> AsyncIterator[None]:
+        """Guard a write against other writers to the journal.
+
+        Waits for any catch-up or compaction in progress in this process,
+        then holds the journal's write lock (a no-op unless it is shared) and
+        applies changes made by other processes before the write proceeds.
+        """
+        if self._journal is None:
+            yield
+            return
+        async with self._journal_lock:
+            with self._journal.locked():
+                self._catch_up()
+                yield
+
+    async def _refresh(self) -> None:
+        """Apply changes other processes have logged before a read.
+
+        The log is read (or, after another process compacted it, reloaded)
+        on a worker thread, so reads don't do file I/O or wait for the
+        journal's lock on the event loop.
         """
-        if not filters:
-            return resources
-
-        filtered = []
-        for resource in resources:
-            match = True
-            for key, value in filters.items():
-                # Skip pagination parameters
-                if key in ("limit", "offset"):
-                    continue
-
-                # Handle different filter types
-                if key.endswith("__gte"):
-                    # Greater than or equal
-                    field = key[:-5]
-                    if field in resource and resource[field] < value:
-                        match = False
-                        break
-                elif key.endswith("__lte"):
-                    # Less than or equal
-                    field = key[:-5]
-                    if field in resource and resource[field] > value:
-                        match = False
-                        break
-                elif key.endswith("__contains"):
-                    # Contains (for strings)
-                    field = key[:-10]
-                    if field in resource and value not in str(resource[field]):
-                        match = False
-                        break
+        if self._journal is None or not self._journal.shared:
+            return
+        async with self._journal_lock:
+            loop = asyncio.get_running_loop()
+            changes = await loop.run_in_executor(None, self._journal.read_new)
+            if changes is None:
+                # The log was compacted by another process
+                loaded = await loop.run_in_executor(
+                    None, self._journal.load, self._decode
+                )
+                self._use_loaded(loaded)
+            else:
+                self._apply_changes(changes)
+
+    def _catch_up(self) -> None:
+        """Apply changes other processes have logged to a shared journal.
+
+        Only called while holding the journal's write lock; reads use
+        ``_refresh``.
+        """
+        changes = self._journal.read_new()
+        if changes is None:
+            # The log was compacted by another process
+            self._load_journal()
+        else:
+            self._apply_changes(changes)
+
+    def _apply_changes(
+        self, changes: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> None:
+        """Apply changes read from a shared journal to the storage."""
+        storage = self._storage
+        for op, resource_id, resource in changes:
+            if op == PUT:
+                # Store what the writing process stored, not the JSON of it
+                resource = self._decode(resource)
+                if resource_id in storage:
+                    self._index_replace(resource_id, storage[resource_id], resource)
+                    storage[resource_id] = resource
                 else:
-                    # Exact match
-                    if key in resource and resource[key] != value:
-                        match = False
-                        break
+                    storage[resource_id] = resource
+                    self._track(resource_id, resource)
+            elif resource_id in storage:
+                self._untrack(resource_id, storage.pop(resource_id))
+
+    def _load_journal(self) -> None:
+        """Replace the stored resources with the contents of the journal."""
+        self._use_loaded(self._journal.load(self._decode))
+
+    def _use_loaded(self, loaded: MutableMapping) -> None:
+        """Serve the resources loaded from the journal."""
+        if self._storage_engine == "dict":
+            # Serve straight from the (lazily decoded) snapshot
+            self._storage = loaded
+        else:
+            self._storage = create_storage(self._storage_engine)
+            self._storage.update(loaded)
+        self.rebuild_indexes()
+
+    def _decode(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a resource read back from JSON into the form writes store.
+
+        JSON has no date-time type, so fields the model keeps as ``datetime``
+        (or any other non-JSON type) come back as strings. Validating the
+        record restores them, so filters and indexes behave the same before
+        and after a restart. The timestamps added by the service are stored
+        as ISO strings whatever the model declares, and are kept as they are.
+        """
+        resource = {**record, **self.model.model_validate(record).model_dump()}
+        for field in ("created_at", "updated_at"):
+            if field in record:
+                resource[field] = record[field]
+        return resource
+
+    @staticmethod
+    def _snapshot_items(
+        storage: MutableMapping[str, Dict[str, Any]],
+        resource_ids: List[Optional[str]],
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield (ID, resource) pairs in insertion order for a snapshot.
+
+        Resources still mapped from the previous snapshot are passed through
+        encoded, without being decoded.
+
+        Args:
+            storage: The stored resources
+            resource_ids: IDs in insertion order, copied before compacting
+        """
+        encoded = getattr(storage, "encoded", None)
+        for resource_id in resource_ids:
+            if resource_id is None:
+                continue
+            if encoded is not None:
+                yield resource_id, encoded(resource_id)
+            else:
+                yield resource_id, storage[resource_id]
+
+    def _put(self, resource_id: str, resource_data: Dict[str, Any], now: str) -> None:
+        """Create or replace a resource with a single storage lookup."""
+        existing = self._storage.get(resource_id)
+        resource_data["created_at"] = (
+            now if existing is None else existing.get("created_at")
+        )
+        resource_data["updated_at"] = now
+
+        self._storage[resource_id] = resource_data
+        if existing is None:
+            self._track(resource_id, resource_data)
+        else:
+            self._index_replace(resource_id, existing, resource_data)
+        if self._journal is not None:
+            self._journal.put(resource_id, resource_data)
+
+    def _track(self, resource_id: str, resource: Optional[Dict[str, Any]]) -> None:
+        """Record a new resource in the insertion order and indexes.
+
+        ``resource`` may be None when there are no secondary indexes.
+        """
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        self._sequence[resource_id] = sequence
+        self._order_sequences.append(sequence)
+        self._order_ids.append(resource_id)
+
+        for index in self._indexes.values():
+            index.add(resource_id, resource)
+
+    def _index_replace(
+        self, resource_id: str, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> None:
+        """Keep the secondary indexes in step with an updated resource."""
+        for index in self._indexes.values():
+            index.replace(resource_id, old, new)
+
+    def _untrack(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Drop a deleted resource from the insertion order and indexes.
+
+        Its slot in the insertion order is only blanked, since removing it
+        would shift every later slot; the arrays are compacted once
+        tombstones make up half of them.
+        """
+        sequence = self._sequence.pop(resource_id)
+        position = bisect_left(self._order_sequences, sequence)
+        self._order_ids[position] = None
+        self._tombstones += 1
+        if self._tombstones * 2 > len(self._order_ids):
+            self._compact_order()
+
+        for index in self._indexes.values():
+            index.remove(resource_id, resource)
+
+    def _compact_order(self) -> None:
+        """Drop the slots of deleted resources from the insertion order."""
+        sequences = self._order_sequences
+        ids = self._order_ids
+        live = [position for position, value in enumerate(ids) if value is not None]
+        self._order_sequences = array("q", [sequences[p] for p in live])
+        self._order_ids = [ids[p] for p in live]
+        self._tombstones = 0
+
+    def _index_candidate_ids(self, plan: BoundFilterPlan) -> Optional[List[str]]:
+        """Find candidate resource IDs for a filter plan using an index.
+
+        Every index is asked for a plan covering the filters it can serve
+        (exact match, ``__gte``/``__lte`` ranges, ``__contains``), and the one
+        with the fewest candidates is used. The candidates still have to be
+        checked against the filters, since other filters may apply.
+
+        Args:
+            plan: Compiled filter plan
+
+        Returns:
+            Candidate IDs in insertion order, or None if no index applies
+        """
+        if not self._indexes or not plan:
+            return None
+
+        best = None
+        for index in self._indexes.values():
+            index_plan = index.plan(plan)
+            if index_plan is not None and (best is None or index_plan[0] < best[0]):
+                best = index_plan
 
-            if match:
-                filtered.append(resource)
+        if best is None:
+            return None
 
-        return filtered
+        ids = best[1]()
+        ids.sort(key=self._sequence.__getitem__)
+        return ids
 
 
 def create_resource_router(resource_name: str, model: Type[BaseModel]):
@@ -261,10 +885,10 @@ def create_resource_router(resource_name: str, model: Type[BaseModel]):
     async def read_resource(resource_id: str = Path(...)):
         return await service.read(resource_id)
 
-    # Update (PUT)
+    # Create or replace (PUT)
     @router.put(f"/{resource_name}/{{resource_id}}", response_model=model)
     async def update_resource(resource_id: str = Path(...), data: model = ...):
-        return await service.update(resource_id, data.model_dump(), partial=False)
+        return await service.upsert(resource_id, data.model_dump())
 
     # Update (PATCH)
     @router.patch(f"/{resource_name}/{{resource_id}}", response_model=model)
@@ -0,0 +1,165 @@
+"""Compiled filter plans shared by the resource services.
+
+List filters arrive as a flat dict of query parameters where the key suffix
+selects the operator (``price__gte``, ``name__contains``, plain ``status`` for
+exact match). Parsing the suffixes is done once per filter *signature* (the
+tuple of keys) and cached; each request only binds its values to the cached
+plan.
+"""
+
+import operator
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+
+PAGINATION_PARAMS = frozenset({"limit", "offset"})
+
+
+class FilterOperator(Enum):
+    """Operators supported in list filters."""
+
+    EQ = "eq"
+    GTE = "gte"
+    LTE = "lte"
+    CONTAINS = "contains"
+
+
+_SUFFIXES = (
+    ("__gte", FilterOperator.GTE),
+    ("__lte", FilterOperator.LTE),
+    ("__contains", FilterOperator.CONTAINS),
+)
+
+
+def _gte(actual: Any, expected: Any) -> bool:
+    try:
+        return not actual < expected
+    except TypeError:
+        return False
+
+
+def _lte(actual: Any, expected: Any) -> bool:
+    try:
+        return not actual > expected
+    except TypeError:
+        return False
+
+
+def _contains(actual: Any, expected: Any) -> bool:
+    return expected in str(actual)
+
+
+# In-memory predicates: (stored value, filter value) -> matches
+_PREDICATES: Dict[FilterOperator, Callable[[Any, Any], bool]] = {
+    FilterOperator.EQ: operator.eq,
+    FilterOperator.GTE: _gte,
+    FilterOperator.LTE: _lte,
+    FilterOperator.CONTAINS: _contains,
+}
+
+# SQL expression builders: (column, filter value) -> condition
+_SQL_CONDITIONS: Dict[FilterOperator, Callable[[Any, Any], Any]] = {
+    FilterOperator.EQ: operator.eq,
+    FilterOperator.GTE: operator.ge,
+    FilterOperator.LTE: operator.le,
+    FilterOperator.CONTAINS: lambda column, value: column.contains(value),
+}
+
+
+@dataclass(frozen=True)
+class FilterClause:
+    """A single parsed filter: ``key`` is the original query parameter."""
+
+    key: str
+    field: str
+    operator: FilterOperator
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """The value-independent shape of a filter dict."""
+
+    clauses: Tuple[FilterClause, ...]
+
+    def bind(self, filters: Dict[str, Any]) -> "BoundFilterPlan":
+        """Attach the filter values of one request to this plan."""
+        return BoundFilterPlan(self, filters)
+
+
+class BoundFilterPlan:
+    """A filter plan together with the values of one request."""
+
+    def __init__(self, plan: FilterPlan, filters: Dict[str, Any]):
+        self.plan = plan
+        self.clauses: List[Tuple[FilterClause, Any]] = [
+            (clause, filters[clause.key]) for clause in plan.clauses
+        ]
+        self._checks = [
+            (clause.field, _PREDICATES[clause.operator], value)
+            for clause, value in self.clauses
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self.clauses)
+
+    def values_for(self, filter_operator: FilterOperator) -> Dict[str, Any]:
+        """Return ``{field: value}`` for every clause using an operator."""
+        return {
+            clause.field: value
+            for clause, value in self.clauses
+            if clause.operator is filter_operator
+        }
+
+    def matches(self, resource: Dict[str, Any]) -> bool:
+        """Check a stored resource against every clause.
+
+        Fields the resource doesn't have are not constrained.
+        """
+        for field, predicate, value in self._checks:
+            if field in resource and not predicate(resource[field], value):
+                return False
+        return True
+
+    def sql_conditions(self, model: Any) -> List[Any]:
+        """Build SQL conditions for the clauses on fields the model defines."""
+        conditions = []
+        for clause, value in self.clauses:
+            if hasattr(model, clause.field):
+                column = getattr(model, clause.field)
+                conditions.append(_SQL_CONDITIONS[clause.operator](column, value))
+        return conditions
+
+
+@lru_cache(maxsize=512)
+def _compile_signature(keys: Tuple[str, ...]) -> FilterPlan:
+    """Parse a filter signature into a plan (cached)."""
+    clauses = []
+    for key in keys:
+        if key in PAGINATION_PARAMS:
+            continue
+        for suffix, filter_operator in _SUFFIXES:
+            if key.endswith(suffix):
+                clauses.append(FilterClause(key, key[: -len(suffix)], filter_operator))
+                break
+        else:
+            clauses.append(FilterClause(key, key, FilterOperator.EQ))
+    return FilterPlan(tuple(clauses))
+
+
+def compile_filters(
+    filters: Union[Dict[str, Any], BoundFilterPlan, None],
+) -> BoundFilterPlan:
+    """Compile a filter dict into a bound plan, reusing cached plan shapes.
+
+    Args:
+        filters: Filter parameters, or an already compiled plan
+
+    Returns:
+        The bound filter plan
+    """
+    if isinstance(filters, BoundFilterPlan):
+        return filters
+    filters = filters or {}
+    return _compile_signature(tuple(filters)).bind(filters)
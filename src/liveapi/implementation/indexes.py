@@ -0,0 +1,514 @@
+"""Secondary indexes for the in-memory resource service."""
+
+import sys
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .filters import BoundFilterPlan, FilterOperator
+
+
+INDEX_EXTENSION = "x-liveapi-index"
+UNIQUE_EXTENSION = "x-liveapi-unique"
+
+# Marker for records whose indexed value can't be used as a bucket key
+UNINDEXED = object()
+
+# An index's answer to a query: estimated candidate count and a fetch callback
+IndexPlan = Tuple[int, Callable[[], List[str]]]
+
+
+class IndexType(Enum):
+    """Kinds of secondary index a resource can declare."""
+
+    HASH = "hash"
+    SORTED = "sorted"
+    TRIGRAM = "trigram"
+
+
+@dataclass
+class IndexDefinition:
+    """Declaration of a secondary index over one or more resource fields.
+
+    ``unique`` indexes are enforced by the SQL backends; the in-memory
+    backend uses them for lookups only.
+    """
+
+    fields: List[str]
+    type: IndexType = IndexType.HASH
+    name: Optional[str] = None
+    unique: bool = False
+
+    def __post_init__(self):
+        if not self.fields:
+            raise ValueError("An index must cover at least one field")
+        if self.type == IndexType.TRIGRAM and len(self.fields) != 1:
+            raise ValueError("A trigram index must cover exactly one field")
+        if self.type == IndexType.TRIGRAM and self.unique:
+            raise ValueError("A trigram index can't be unique")
+        if self.name is None:
+            prefix = "ux_" if self.unique else "ix_"
+            self.name = prefix + "_".join(self.fields)
+
+
+def parse_index_definitions(schema: Dict[str, Any]) -> List[IndexDefinition]:
+    """Read index declarations from an OpenAPI object schema.
+
+    Indexes are declared with the ``x-liveapi-index`` vendor extension, either
+    on the schema itself or on individual properties:
+
+        x-liveapi-index:
+          - owner_id                       # single-field hash index
+          - [owner_id, status]             # composite hash index
+          - {fields: [status], type: hash}
+          - {fields: [created_at], type: sorted}   # range index
+        properties:
+          email: {type: string, x-liveapi-index: true}
+          price: {type: number, x-liveapi-index: sorted}
+          description: {type: string, x-liveapi-index: trigram}
+
+    Unique indexes are declared the same way with ``x-liveapi-unique``, or
+    with ``unique: true`` in an ``x-liveapi-index`` mapping:
+
+        x-liveapi-unique:
+          - [owner_id, slug]               # composite unique index
+        properties:
+          email: {type: string, x-liveapi-unique: true}
+
+    Args:
+        schema: OpenAPI object schema
+
+    Returns:
+        List of index definitions, de-duplicated by name
+
+    Raises:
+        ValueError: If a declaration is malformed
+    """
+    declarations: List[Any] = list(schema.get(INDEX_EXTENSION) or [])
+
+    for field_name, field_schema in schema.get("properties", {}).items():
+        declared = field_schema.get(INDEX_EXTENSION)
+        if declared is True:
+            declarations.append(field_name)
+        elif isinstance(declared, str):
+            declarations.append({"fields": [field_name], "type": declared})
+        elif isinstance(declared, dict):
+            declarations.append({"fields": [field_name], **declared})
+
+    for declaration in schema.get(UNIQUE_EXTENSION) or []:
+        if isinstance(declaration, str):
+            declaration = [declaration]
+        if isinstance(declaration, list):
+            declaration = {"fields": declaration}
+        if not isinstance(declaration, dict):
+            raise ValueError(f"Invalid {UNIQUE_EXTENSION} declaration: {declaration!r}")
+        declarations.append({**declaration, "unique": True})
+
+    for field_name, field_schema in schema.get("properties", {}).items():
+        if field_schema.get(UNIQUE_EXTENSION) is True:
+            declarations.append({"fields": [field_name], "unique": True})
+
+    definitions: Dict[str, IndexDefinition] = {}
+    for declaration in declarations:
+        definition = _parse_declaration(declaration)
+        definitions.setdefault(definition.name, definition)
+
+    return list(definitions.values())
+
+
+def _parse_declaration(declaration: Any) -> IndexDefinition:
+    """Convert a single ``x-liveapi-index`` entry to an IndexDefinition."""
+    if isinstance(declaration, str):
+        return IndexDefinition(fields=[declaration])
+    if isinstance(declaration, list):
+        return IndexDefinition(fields=[str(item) for item in declaration])
+    if isinstance(declaration, dict):
+        fields = declaration.get("fields") or declaration.get("field")
+        if isinstance(fields, str):
+            fields = [fields]
+        try:
+            index_type = IndexType(declaration.get("type", IndexType.HASH.value))
+        except ValueError:
+            raise ValueError(
+                f"Unknown index type {declaration.get('type')!r} in {INDEX_EXTENSION}"
+            )
+        return IndexDefinition(
+            fields=[str(item) for item in fields or []],
+            type=index_type,
+            name=declaration.get("name"),
+            unique=bool(declaration.get("unique", False)),
+        )
+    raise ValueError(f"Invalid {INDEX_EXTENSION} declaration: {declaration!r}")
+
+
+class HashIndex:
+    """Hash index mapping field values to the IDs of matching resources.
+
+    Records whose indexed value is missing or unhashable cannot be bucketed;
+    they are kept aside and returned with every lookup so that callers can
+    verify them with the regular filter logic.
+    """
+
+    def __init__(self, definition: IndexDefinition):
+        self.definition = definition
+        self.fields: Tuple[str, ...] = tuple(definition.fields)
+        self._buckets: Dict[Hashable, Dict[str, None]] = {}
+        self._unindexed: Dict[str, None] = {}
+
+    def key_for(self, resource: Dict[str, Any]) -> Any:
+        """Return the bucket key for a resource, or UNINDEXED."""
+        try:
+            values = tuple(resource[name] for name in self.fields)
+            hash(values)
+        except (KeyError, TypeError):
+            return UNINDEXED
+        return values[0] if len(values) == 1 else values
+
+    def add(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Index a resource."""
+        key = self.key_for(resource)
+        if key is UNINDEXED:
+            self._unindexed[resource_id] = None
+        else:
+            self._buckets.setdefault(key, {})[resource_id] = None
+
+    def remove(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Remove a previously indexed resource."""
+        key = self.key_for(resource)
+        if key is UNINDEXED:
+            self._unindexed.pop(resource_id, None)
+            return
+
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.pop(resource_id, None)
+            if not bucket:
+                del self._buckets[key]
+
+    def replace(
+        self, resource_id: str, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> None:
+        """Move a resource to the bucket matching its new values."""
+        if self.key_for(old) == self.key_for(new):
+            return
+        self.remove(resource_id, old)
+        self.add(resource_id, new)
+
+    def lookup(self, key: Any) -> Optional[List[str]]:
+        """Return candidate IDs for an exact-match lookup.
+
+        Returns None if the key is unhashable and the index can't be used.
+        """
+        try:
+            bucket = self._buckets.get(key, {})
+        except TypeError:
+            return None
+        return [*bucket, *self._unindexed]
+
+    def plan(self, filters: BoundFilterPlan) -> Optional[IndexPlan]:
+        """Plan a lookup for exact-match filters covering every indexed field."""
+        equals = filters.values_for(FilterOperator.EQ)
+        if not all(name in equals for name in self.fields):
+            return None
+        values = tuple(equals[name] for name in self.fields)
+        key = values[0] if len(values) == 1 else values
+        try:
+            bucket = self._buckets.get(key, {})
+        except TypeError:
+            return None
+        return len(bucket) + len(self._unindexed), lambda: self.lookup(key)
+
+    def clear(self) -> None:
+        """Drop all index entries."""
+        self._buckets.clear()
+        self._unindexed.clear()
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the index structures (not the IDs)."""
+        return (
+            sys.getsizeof(self._buckets)
+            + sys.getsizeof(self._unindexed)
+            + sum(
+                sys.getsizeof(key) + sys.getsizeof(bucket)
+                for key, bucket in self._buckets.items()
+            )
+        )
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values()) + len(
+            self._unindexed
+        )
+
+
+class _Top:
+    """Sentinel that sorts after every other value."""
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __gt__(self, other: Any) -> bool:
+        return other is not self
+
+
+_TOP = _Top()
+
+
+class SortedIndex:
+    """Ordered index over one or more fields, backed by a bisect-sorted list.
+
+    Entries are ``(*values, resource_id)`` tuples, so a query can fix a prefix
+    of the fields by equality and constrain the next field by a range, e.g.
+    ``owner_id=... & created_at__gte=...`` on an ``[owner_id, created_at]``
+    index. Lookups cost O(log N + k).
+
+    Records with a missing or None value, or with values that can't be
+    ordered against the rest of the index, are kept aside and returned with
+    every lookup for verification.
+    """
+
+    def __init__(self, definition: IndexDefinition):
+        self.definition = definition
+        self.fields: Tuple[str, ...] = tuple(definition.fields)
+        self._keys: List[Tuple[Any, ...]] = []
+        self._unindexed: Dict[str, None] = {}
+
+    def key_for(self, resource_id: str, resource: Dict[str, Any]) -> Any:
+        """Return the sort key for a resource, or UNINDEXED."""
+        try:
+            values = tuple(resource[name] for name in self.fields)
+        except KeyError:
+            return UNINDEXED
+        if any(value is None for value in values):
+            return UNINDEXED
+        return (*values, resource_id)
+
+    def add(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Index a resource."""
+        key = self.key_for(resource_id, resource)
+        if key is not UNINDEXED:
+            try:
+                insort(self._keys, key)
+                return
+            except TypeError:
+                pass
+        self._unindexed[resource_id] = None
+
+    def remove(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Remove a previously indexed resource."""
+        key = self.key_for(resource_id, resource)
+        if key is not UNINDEXED:
+            try:
+                position = bisect_left(self._keys, key)
+            except TypeError:
+                position = len(self._keys)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+                return
+        self._unindexed.pop(resource_id, None)
+
+    def replace(
+        self, resource_id: str, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> None:
+        """Move a resource to the position matching its new values."""
+        if self.key_for(resource_id, old) == self.key_for(resource_id, new):
+            return
+        self.remove(resource_id, old)
+        self.add(resource_id, new)
+
+    def span(
+        self, prefix: Tuple[Any, ...], low: Any = None, high: Any = None
+    ) -> Optional[Tuple[int, int]]:
+        """Locate the entries matching an equality prefix and optional range.
+
+        Args:
+            prefix: Values for the leading indexed fields
+            low: Inclusive lower bound for the field after the prefix
+            high: Inclusive upper bound for the field after the prefix
+
+        Returns:
+            Start and end positions in the index, or None if the bounds
+            can't be compared with the indexed values
+        """
+        start_key = prefix if low is None else (*prefix, low)
+        end_key = (*prefix, _TOP) if high is None else (*prefix, high, _TOP)
+        try:
+            start = bisect_left(self._keys, start_key)
+            end = bisect_right(self._keys, end_key, lo=start)
+        except TypeError:
+            return None
+        return start, end
+
+    def plan(self, filters: BoundFilterPlan) -> Optional[IndexPlan]:
+        """Plan a lookup for an equality prefix followed by a range."""
+        equals = filters.values_for(FilterOperator.EQ)
+        prefix = []
+        for name in self.fields:
+            if name not in equals:
+                break
+            prefix.append(equals[name])
+
+        low = high = None
+        if len(prefix) < len(self.fields):
+            name = self.fields[len(prefix)]
+            low = filters.values_for(FilterOperator.GTE).get(name)
+            high = filters.values_for(FilterOperator.LTE).get(name)
+        if not prefix and low is None and high is None:
+            return None
+
+        span = self.span(tuple(prefix), low, high)
+        if span is None:
+            return None
+        start, end = span
+
+        def fetch() -> List[str]:
+            return [key[-1] for key in self._keys[start:end]] + [*self._unindexed]
+
+        return end - start + len(self._unindexed), fetch
+
+    def clear(self) -> None:
+        """Drop all index entries."""
+        self._keys.clear()
+        self._unindexed.clear()
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the index structures (not the values)."""
+        return (
+            sys.getsizeof(self._keys)
+            + sys.getsizeof(self._unindexed)
+            + sum(sys.getsizeof(key) for key in self._keys)
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._unindexed)
+
+
+class TrigramIndex:
+    """Inverted index from character trigrams to resource IDs.
+
+    Serves ``__contains`` filters: every trigram of the search term must
+    occur in a matching value, so intersecting the posting sets of the
+    term's trigrams narrows the candidates before the substring check.
+    Terms shorter than three characters can't be narrowed and fall back to
+    a scan. Values are indexed as ``str(value)``, the same text the
+    ``__contains`` filter searches.
+    """
+
+    def __init__(self, definition: IndexDefinition):
+        self.definition = definition
+        self.fields: Tuple[str, ...] = tuple(definition.fields)
+        self._field = definition.fields[0]
+        self._postings: Dict[str, Set[str]] = {}
+        self._unindexed: Dict[str, None] = {}
+
+    @staticmethod
+    def trigrams(text: str) -> Set[str]:
+        """Return the set of trigrams in a string."""
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def _text_for(self, resource: Dict[str, Any]) -> Optional[str]:
+        if self._field not in resource:
+            return None
+        return str(resource[self._field])
+
+    def add(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Index a resource."""
+        text = self._text_for(resource)
+        if text is None:
+            self._unindexed[resource_id] = None
+            return
+        for gram in self.trigrams(text):
+            self._postings.setdefault(gram, set()).add(resource_id)
+
+    def remove(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Remove a previously indexed resource."""
+        text = self._text_for(resource)
+        if text is None:
+            self._unindexed.pop(resource_id, None)
+            return
+        for gram in self.trigrams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(resource_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def replace(
+        self, resource_id: str, old: Dict[str, Any], new: Dict[str, Any]
+    ) -> None:
+        """Re-index a resource whose text changed."""
+        if self._text_for(old) == self._text_for(new):
+            return
+        self.remove(resource_id, old)
+        self.add(resource_id, new)
+
+    def plan(self, filters: BoundFilterPlan) -> Optional[IndexPlan]:
+        """Plan a lookup for a ``__contains`` filter on the indexed field."""
+        term = filters.values_for(FilterOperator.CONTAINS).get(self._field)
+        if not isinstance(term, str) or len(term) < 3:
+            return None
+
+        postings = []
+        for gram in self.trigrams(term):
+            posting = self._postings.get(gram)
+            if posting is None:
+                postings = []
+                break
+            postings.append(posting)
+        postings.sort(key=len)
+
+        def fetch() -> List[str]:
+            matches = set.intersection(*postings) if postings else set()
+            return [*matches, *self._unindexed]
+
+        estimate = len(postings[0]) if postings else 0
+        return estimate + len(self._unindexed), fetch
+
+    def clear(self) -> None:
+        """Drop all index entries."""
+        self._postings.clear()
+        self._unindexed.clear()
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the index structures (not the IDs)."""
+        return (
+            sys.getsizeof(self._postings)
+            + sys.getsizeof(self._unindexed)
+            + sum(
+                sys.getsizeof(gram) + sys.getsizeof(posting)
+                for gram, posting in self._postings.items()
+            )
+        )
+
+    def __len__(self) -> int:
+        return sum(len(posting) for posting in self._postings.values()) + len(
+            self._unindexed
+        )
+
+
+Index = Union[HashIndex, SortedIndex, TrigramIndex]
+
+_INDEX_CLASSES = {
+    IndexType.HASH: HashIndex,
+    IndexType.SORTED: SortedIndex,
+    IndexType.TRIGRAM: TrigramIndex,
+}
+
+
+def build_indexes(definitions: Iterable[IndexDefinition]) -> Dict[str, Index]:
+    """Instantiate index structures for a set of definitions, keyed by name."""
+    return {
+        definition.name: _INDEX_CLASSES[definition.type](definition)
+        for definition in definitions
+    }
@@ -1,16 +1,29 @@
 """LiveAPI router that maps CRUD+ resources to standard handlers."""
 
-from typing import Dict, Any, List, Type, Union
+from typing import Dict, Any, List, Optional, Type, Union
 from pathlib import Path
-from fastapi import APIRouter, FastAPI, Request, Depends
+from fastapi import APIRouter, Body, FastAPI, Query, Request, Response, Depends
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from sqlmodel import Session
 from .liveapi_parser import LiveAPIParser
 from .default_resource_service import DefaultResourceService
-from .exceptions import BusinessException
-from .database import get_db_session
+from .exceptions import BusinessException, ValidationError
+from .database import get_database_manager
+from .pagination import NEXT_CURSOR_HEADER
+from .serialization import FastJSONResponse
+from .streaming import StreamFormat, streaming_response
+from .persistence import ResourceJournal
+from .pydantic_generator import SQL_BACKENDS
+
+# List query parameters that select a page, which a streamed export doesn't
+PAGINATION_QUERY = frozenset({"limit", "offset", "cursor"})
+
+
+class BulkDeleteRequest(BaseModel):
+    """Body of a batch delete request."""
+
+    ids: List[str]
 
 
 def create_business_exception_handler():
@@ -67,10 +80,17 @@ class LiveAPIRouter:
     def __init__(self):
         self.routers: Dict[str, APIRouter] = {}
         self.handlers: Dict[str, Union[DefaultResourceService, Any]] = {}
+        self.config = self._load_project_config()
         self.backend_type = self._load_backend_config()
-
-    def _load_backend_config(self) -> str:
-        """Load backend configuration from project metadata."""
+        self.storage_engine = self.config.get("storage_engine", "dict")
+        self.data_dir = self.config.get("data_dir")
+        self.shared_storage = self.config.get("shared_storage", False)
+        self.fast_serialization = self.config.get("fast_serialization", False)
+        if self.shared_storage and not self.data_dir:
+            self.data_dir = str(Path.cwd() / ".liveapi" / "data")
+
+    def _load_project_config(self) -> Dict[str, Any]:
+        """Load the project configuration from project metadata."""
         try:
             project_root = Path.cwd()
             metadata_dir = project_root / ".liveapi"
@@ -80,30 +100,89 @@ class LiveAPIRouter:
                 import json
 
                 with open(config_file, "r") as f:
-                    config_data = json.load(f)
-                    return config_data.get("backend_type", "default")
+                    return json.load(f)
         except Exception:
             pass
-        return "default"
+        return {}
+
+    def _load_backend_config(self) -> str:
+        """Load backend configuration from project metadata."""
+        return self._load_project_config().get("backend_type", "default")
+
+    def _create_default_service(
+        self, model: Type[BaseModel], resource_name: str
+    ) -> DefaultResourceService:
+        """Create an in-memory service using the configured storage engine.
+
+        If a data directory is configured, each resource is persisted to its
+        own snapshot + write-ahead log in a subdirectory of it. With shared
+        storage the journal is shared by every worker process, so they all
+        serve the same data.
+        """
+        journal = None
+        if self.data_dir:
+            journal = ResourceJournal(
+                Path(self.data_dir) / resource_name, shared=self.shared_storage
+            )
+        return DefaultResourceService(
+            model=model,
+            resource_name=resource_name,
+            storage_engine=self.storage_engine,
+            journal=journal,
+        )
+
+    def _respond(
+        self,
+        content: Any,
+        response_type: Any,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Return a handler result, encoding it directly in fast mode.
+
+        With fast serialization enabled the result is shaped by the route's
+        response model and written to JSON bytes in one pydantic-core pass,
+        instead of going through FastAPI's response handling and
+        ``jsonable_encoder``. The body is the same either way.
+
+        Args:
+            content: Service output (a resource dict or list of them)
+            response_type: The route's ``response_model``
+            status_code: Status code for the fast-path response
+            headers: Extra headers for the fast-path response
+
+        Returns:
+            A FastJSONResponse in fast mode, otherwise ``content`` unchanged
+        """
+        if not self.fast_serialization:
+            return content
+        return FastJSONResponse(
+            content, response_type, status_code=status_code, headers=headers
+        )
 
     def _create_service_dependency(self, model: Type[BaseModel], resource_name: str):
         """Create a dependency factory for the appropriate service."""
-        if self.backend_type == "sqlmodel":
+        if self.backend_type == "sqlmodel_async":
+            from .database import get_async_unit_of_work
+
+            async def get_async_sql_service(unit=Depends(get_async_unit_of_work)):
+                return unit.service(model, resource_name)
+
+            return get_async_sql_service
+        elif self.backend_type == "sqlmodel":
             try:
-                from .sql_model_resource_service import SQLModelResourceService
+                from .database import get_unit_of_work
 
-                def get_sql_service(session: Session = Depends(get_db_session)):
-                    return SQLModelResourceService(
-                        model=model, resource_name=resource_name, session=session
-                    )
+                async def get_sql_service(unit=Depends(get_unit_of_work)):
+                    return unit.service(model, resource_name)
 
                 return get_sql_service
             except ImportError:
                 print("⚠️ SQLModel backend not available, falling back to default")
                 # Create a singleton service instance for default backend
                 if resource_name not in self.handlers:
-                    self.handlers[resource_name] = DefaultResourceService(
-                        model=model, resource_name=resource_name
+                    self.handlers[resource_name] = self._create_default_service(
+                        model, resource_name
                     )
 
                 def get_default_service():
@@ -113,8 +192,8 @@ class LiveAPIRouter:
         else:
             # Create a singleton service instance for default backend
             if resource_name not in self.handlers:
-                self.handlers[resource_name] = DefaultResourceService(
-                    model=model, resource_name=resource_name
+                self.handlers[resource_name] = self._create_default_service(
+                    model, resource_name
                 )
 
             def get_default_service():
@@ -204,14 +283,33 @@ class LiveAPIRouter:
             from .database import init_database
 
             init_database()
+        elif self.backend_type == "sqlmodel_async":
+            from .database import close_async_database, init_async_database
+
+            # Tables are created on the async engine once the event loop runs
+            app.router.on_startup.append(init_async_database)
+            app.router.on_shutdown.append(close_async_database)
 
         @app.get("/health")
         async def health_check():
-            return {
+            health = {
                 "status": "healthy",
                 "service": "liveapi.implementation",
                 "resources": list(resources.keys()),
             }
+            if self.backend_type in SQL_BACKENDS:
+                db_manager = get_database_manager()
+                health["database"] = db_manager.pool_status()
+                cache_stats = db_manager.cache_stats()
+                if cache_stats:
+                    health["cache"] = cache_stats
+                executor_stats = db_manager.executor_stats()
+                if executor_stats:
+                    health["executor"] = executor_stats
+                session_stats = db_manager.session_stats()
+                if session_stats:
+                    health["sessions"] = session_stats
+            return health
 
         return app
 
@@ -239,7 +337,9 @@ class LiveAPIRouter:
                 operation_id=op.get("operationId", f"create_{resource_name}"),
             )
             async def create_resource(data: model, service=Depends(service_dependency)):
-                return await service.create(data.model_dump())
+                return self._respond(
+                    await service.create(data.model_dump()), model, status_code=201
+                )
 
         if "read" in operations:
             op = operations["read"]["operation"]
@@ -252,7 +352,7 @@ class LiveAPIRouter:
                 operation_id=op.get("operationId", f"get_{resource_name}"),
             )
             async def read_resource(id: str, service=Depends(service_dependency)):
-                return await service.read(id)
+                return self._respond(await service.read(id), model)
 
         if "update" in operations:
             op = operations["update"]["operation"]
@@ -262,12 +362,14 @@ class LiveAPIRouter:
                 summary=op.get("summary", f"Update {resource_name}"),
                 description=op.get("description", ""),
                 response_model=model,
+                responses={200: {"description": "Resource created or replaced"}},
                 operation_id=op.get("operationId", f"update_{resource_name}"),
             )
             async def update_resource(
                 id: str, data: model, service=Depends(service_dependency)
             ):
-                return await service.update(id, data.model_dump(), partial=False)
+                # PUT creates the resource if it doesn't exist yet
+                return self._respond(await service.upsert(id, data.model_dump()), model)
 
         if "update_partial" in operations:
             op = operations["update_partial"]["operation"]
@@ -282,7 +384,9 @@ class LiveAPIRouter:
             async def patch_resource(
                 id: str, data: Dict[str, Any], service=Depends(service_dependency)
             ):
-                return await service.update(id, data, partial=True)
+                return self._respond(
+                    await service.update(id, data, partial=True), model
+                )
 
         if "delete" in operations:
             op = operations["delete"]["operation"]
@@ -309,12 +413,125 @@ class LiveAPIRouter:
                 operation_id=op.get("operationId", f"list_{resource_name}"),
             )
             async def list_resources(
-                limit: int = 100, offset: int = 0, service=Depends(service_dependency)
+                request: Request,
+                response: Response,
+                limit: int = Query(100, ge=1, le=1000),
+                offset: int = Query(0, ge=0),
+                cursor: Optional[str] = None,
+                stream: Optional[StreamFormat] = None,
+                service=Depends(service_dependency),
             ):
-                return await service.list(limit=limit, offset=offset)
+                if stream is not None:
+                    # Export the whole collection without building the list
+                    paging = PAGINATION_QUERY.intersection(request.query_params)
+                    if paging:
+                        raise ValidationError(
+                            "stream exports the whole collection and can't be "
+                            f"combined with {', '.join(sorted(paging))}"
+                        )
+                    return streaming_response(service.stream(), stream, model)
+
+                if cursor is None:
+                    return self._respond(
+                        await service.list(limit=limit, offset=offset), List[model]
+                    )
+
+                # Keyset pagination: pass cursor= (empty) to start, then the
+                # value of the X-Next-Cursor header to fetch each next page
+                items, next_cursor = await service.list_page(
+                    limit=limit, cursor=cursor or None
+                )
+                headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+                response.headers.update(headers)
+                return self._respond(items, List[model], headers=headers)
+
+        self._add_batch_routes(
+            router,
+            resource_name,
+            f"{collection_path}:batch",
+            operations,
+            model,
+            service_dependency,
+        )
 
         return router
 
+    def _add_batch_routes(
+        self,
+        router: APIRouter,
+        resource_name: str,
+        batch_path: str,
+        operations: Dict[str, Any],
+        model: Type[BaseModel],
+        service_dependency,
+    ) -> None:
+        """Add batch endpoints for the resource's write operations.
+
+        Batch bodies are taken as raw JSON and validated by the service in a
+        single pass over the whole list, rather than item by item.
+        """
+        if "create" in operations:
+
+            @router.post(
+                batch_path,
+                summary=f"Create many {resource_name}",
+                response_model=List[model],
+                status_code=201,
+                operation_id=f"bulk_create_{resource_name}",
+            )
+            async def bulk_create_resources(
+                items: List[Dict[str, Any]] = Body(...),
+                service=Depends(service_dependency),
+            ):
+                return self._respond(
+                    await service.bulk_create(items), List[model], status_code=201
+                )
+
+        if "update" in operations:
+
+            @router.put(
+                batch_path,
+                summary=f"Create or replace many {resource_name}",
+                response_model=List[model],
+                responses={200: {"description": "Resources created or replaced"}},
+                operation_id=f"bulk_upsert_{resource_name}",
+            )
+            async def bulk_upsert_resources(
+                items: List[Dict[str, Any]] = Body(...),
+                service=Depends(service_dependency),
+            ):
+                return self._respond(await service.bulk_upsert(items), List[model])
+
+        if "update_partial" in operations:
+
+            @router.patch(
+                batch_path,
+                summary=f"Partially update many {resource_name}",
+                response_model=List[model],
+                operation_id=f"bulk_patch_{resource_name}",
+            )
+            async def bulk_patch_resources(
+                items: List[Dict[str, Any]] = Body(...),
+                service=Depends(service_dependency),
+            ):
+                return self._respond(
+                    await service.bulk_update(items, partial=True), List[model]
+                )
+
+        if "delete" in operations:
+
+            @router.delete(
+                batch_path,
+                summary=f"Delete many {resource_name}",
+                status_code=204,
+                operation_id=f"bulk_delete_{resource_name}",
+            )
+            async def bulk_delete_resources(
+                request: BulkDeleteRequest, service=Depends(service_dependency)
+            ):
+                await service.bulk_delete(request.ids)
+                return None
+
 
 def create_liveapi_app(spec_path: str) -> FastAPI:
     """Convenience function to create a LiveAPI app from a spec."""
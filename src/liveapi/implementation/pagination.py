@@ -0,0 +1,43 @@
+"""Opaque cursors for keyset pagination of list endpoints."""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+from .exceptions import ValidationError
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_key: Any) -> str:
+    """Encode the last seen sort key as an opaque, URL-safe cursor.
+
+    Args:
+        sort_key: JSON-serialisable sort key of the last item on a page
+
+    Returns:
+        Cursor string to pass back to get the next page
+    """
+    payload = json.dumps({"k": sort_key}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        The sort key of the last item on the previous page
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))["k"]
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise ValidationError(f"Invalid pagination cursor: {cursor!r}")
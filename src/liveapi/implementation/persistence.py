@@ -0,0 +1,530 @@
+"""Snapshot + write-ahead log persistence for the in-memory backend.
+
+Each resource gets a directory holding two files:
+
+- ``snapshot.bin``: every resource, in insertion order (see MappedSnapshot)
+- ``wal.jsonl``: one change per line since the snapshot was written
+
+Changes are appended to the log as they happen and made durable with a group
+commit: every writer waiting at the same time shares one ``fsync``. Once the
+log holds ``snapshot_interval`` entries it is compacted into a new snapshot.
+At startup the snapshot is memory-mapped and the log replayed on top of it.
+
+A journal can be shared by several processes serving the same data, such as
+uvicorn workers; see ``ResourceJournal``.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic_core import to_json
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+SNAPSHOT_FILE = "snapshot.bin"
+WAL_FILE = "wal.jsonl"
+LOCK_FILE = "journal.lock"
+
+# Snapshot layout: header, the JSON-encoded resources back to back, a table
+# of count + 1 little-endian uint64 record offsets, then a JSON array of IDs
+SNAPSHOT_MAGIC = b"LAPISNP1"
+_SNAPSHOT_HEADER = struct.Struct("<8sQQQ")  # magic, count, table, ids offsets
+
+# Log operations
+PUT = "put"
+DELETE = "delete"
+
+
+class MappedSnapshot(MutableMapping):
+    """Resources of a binary snapshot, decoded lazily from a memory map.
+
+    Opening a snapshot only reads its offset table and ID list; the JSON of a
+    resource is decoded (and passed through ``decode``, if given) the first
+    time it is read. Resources written
+    afterwards are kept in memory alongside the mapped ones, in insertion
+    order, like a dict.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        decode: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ):
+        """Map a snapshot file written by ``write_snapshot``.
+
+        Args:
+            path: Path of the snapshot file
+            decode: Converts a resource read back from JSON into the form it
+                was stored in (see ``ResourceJournal.load``)
+
+        Raises:
+            ValueError: If the file is not a snapshot
+        """
+        self._decode = decode
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _SNAPSHOT_HEADER.size:
+            raise ValueError(f"Not a LiveAPI snapshot: {path}")
+        magic, count, table_offset, ids_offset = _SNAPSHOT_HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"Not a LiveAPI snapshot: {path}")
+
+        self._offsets = array("Q")
+        self._offsets.frombytes(self._map[table_offset:ids_offset])
+        if sys.byteorder == "big":
+            self._offsets.byteswap()
+        ids = json.loads(self._map[ids_offset:])
+
+        # Each ID maps to its record number until decoded, then to the dict
+        self._entries: Dict[str, Union[int, Dict[str, Any]]] = dict(
+            zip(ids, range(count))
+        )
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        entry = self._entries[key]
+        if type(entry) is int:
+            entry = json.loads(self._record_bytes(entry))
+            if self._decode is not None:
+                entry = self._decode(entry)
+            self._entries[key] = entry
+        return entry
+
+    def __setitem__(self, key: str, resource: Dict[str, Any]) -> None:
+        self._entries[key] = resource
+
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def encoded(self, key: str) -> bytes:
+        """Return the JSON encoding of a resource without decoding it."""
+        entry = self._entries[key]
+        if type(entry) is int:
+            return self._record_bytes(entry)
+        return to_json(entry)
+
+    def decoded_count(self) -> int:
+        """Number of resources held as dicts rather than mapped bytes."""
+        return sum(1 for entry in self._entries.values() if type(entry) is not int)
+
+    def _record_bytes(self, number: int) -> bytes:
+        return self._map[self._offsets[number] : self._offsets[number + 1]]
+
+
+def write_snapshot(
+    path: Union[str, Path],
+    resources: Iterable[Tuple[str, Union[Dict[str, Any], bytes]]],
+) -> None:
+    """Write resources to a binary snapshot file and fsync it.
+
+    Args:
+        path: Path of the snapshot file
+        resources: (ID, resource) pairs in insertion order. A resource may be
+            given already JSON-encoded as bytes.
+    """
+    ids = []
+    offsets = array("Q", [_SNAPSHOT_HEADER.size])
+    with open(path, "wb") as snapshot:
+        snapshot.write(bytes(_SNAPSHOT_HEADER.size))
+        for resource_id, resource in resources:
+            data = resource if isinstance(resource, bytes) else to_json(resource)
+            snapshot.write(data)
+            offsets.append(offsets[-1] + len(data))
+            ids.append(resource_id)
+
+        table_offset = offsets[-1]
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        snapshot.write(offsets.tobytes())
+        ids_offset = table_offset + len(offsets) * offsets.itemsize
+        snapshot.write(to_json(ids))
+
+        snapshot.seek(0)
+        snapshot.write(
+            _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(ids), table_offset, ids_offset)
+        )
+        snapshot.flush()
+        os.fsync(snapshot.fileno())
+
+
+class ResourceJournal:
+    """Durable log of the changes made to one resource collection.
+
+    Log entries are idempotent (``put`` stores the whole resource, ``delete``
+    removes it if present), so replaying a log over a snapshot that already
+    includes some of its entries is safe.
+
+    In shared mode several processes (e.g. uvicorn workers) use the same
+    journal as their source of truth. Writers append under an exclusive file
+    lock after catching up with the log; readers catch up by reading entries
+    appended since they last looked, without taking any lock.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        snapshot_interval: int = 10000,
+        fsync: bool = True,
+        shared: bool = False,
+    ):
+        """Open (or create) the journal in a directory.
+
+        Args:
+            directory: Directory holding the snapshot and log files
+            snapshot_interval: Number of log entries after which the log is
+                compacted into a new snapshot
+            fsync: Whether commits wait for the log to reach disk. Without it
+                changes survive a process crash but not an OS crash.
+            shared: Whether other processes write to the same journal
+
+        Raises:
+            RuntimeError: If shared mode is requested on a platform without
+                ``fcntl`` file locks
+        """
+        if shared and fcntl is None:
+            raise RuntimeError("Shared journals require fcntl file locking")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_interval = snapshot_interval
+        self.fsync = fsync
+        self.shared = shared
+
+        self._log = None
+        self.log_entries = 0
+        self._written = 0
+        self._synced = 0
+        self._sync_task: Optional[asyncio.Task] = None
+        # Log files closed while a sync was fsyncing them, closed once it ends
+        self._syncing = False
+        self._retired: List[Any] = []
+        self._retire_lock = threading.Lock()
+
+        # Shared mode: lock file, and the log file and position read up to
+        self._lock_fd: Optional[int] = None
+        self._lock_depth = 0
+        self._reader_fd: Optional[int] = None
+        self._read_offset = 0
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.directory / SNAPSHOT_FILE
+
+    @property
+    def wal_path(self) -> Path:
+        return self.directory / WAL_FILE
+
+    def load(
+        self, decode: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> MutableMapping:
+        """Load the snapshot and replay the log on top of it.
+
+        The snapshot is memory-mapped rather than read, so resources that
+        aren't touched by the log stay undecoded until first accessed.
+
+        Args:
+            decode: Converts a resource read back from JSON into the form it
+                was stored in, e.g. by validating it against its model so
+                date-times aren't left as strings
+
+        Returns:
+            Mapping of resource ID to resource, in insertion order
+        """
+        with self.locked():
+            resources: MutableMapping = {}
+            if self.snapshot_path.exists():
+                resources = MappedSnapshot(self.snapshot_path, decode)
+
+            self.log_entries = 0
+            for entry in self._read_lines(self.wal_path):
+                op, resource_id, resource = self._parse_entry(entry)
+                if op == PUT:
+                    if decode is not None:
+                        resource = decode(resource)
+                    resources[resource_id] = resource
+                else:
+                    resources.pop(resource_id, None)
+                self.log_entries += 1
+
+            if self.shared:
+                self._close_log()
+                self._open_reader()
+                self._read_offset = os.fstat(self._reader_fd).st_size
+        return resources
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the journal's exclusive write lock (shared mode only).
+
+        Entries appended while the lock is held are flushed before it is
+        released, so other processes see them on their next catch-up. The
+        lock is re-entrant within a process and a no-op unless shared.
+        """
+        if not self.shared:
+            yield
+            return
+
+        if self._lock_depth == 0:
+            if self._lock_fd is None:
+                self._lock_fd = os.open(
+                    self.directory / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644
+                )
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        self._lock_depth += 1
+        written = self._written
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                try:
+                    if self._log is not None and self._written != written:
+                        self._log.flush()
+                        # Our own entries don't need to be read back
+                        self._read_offset = self._log.tell()
+                finally:
+                    fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def read_new(self) -> Optional[List[Tuple[str, str, Optional[Dict[str, Any]]]]]:
+        """Read entries other processes appended since the last read.
+
+        Only complete lines are consumed, so a concurrent append is picked up
+        on a later call rather than read half-written. No lock is taken.
+
+        Returns:
+            List of (operation, resource ID, resource) changes, empty when
+            not in shared mode, or None if the log was compacted by another
+            process and the journal must be loaded again
+        """
+        if not self.shared:
+            return []
+
+        try:
+            current = os.stat(self.wal_path)
+        except FileNotFoundError:
+            return None
+        if current.st_ino != os.fstat(self._reader_fd).st_ino:
+            return None
+        if current.st_size <= self._read_offset:
+            return []
+
+        data = os.pread(
+            self._reader_fd, current.st_size - self._read_offset, self._read_offset
+        )
+        complete = data.rfind(b"\n") + 1
+        self._read_offset += complete
+
+        changes = []
+        for line in data[:complete].splitlines():
+            if line.strip():
+                changes.append(self._parse_entry(json.loads(line)))
+        self.log_entries += len(changes)
+        return changes
+
+    def put(self, resource_id: str, resource: Dict[str, Any]) -> None:
+        """Append a create/update of a resource to the log.
+
+        The entry is buffered; await ``commit`` to make it durable.
+        """
+        self._append({"op": PUT, "id": resource_id, "data": resource})
+
+    def delete(self, resource_id: str) -> None:
+        """Append a deletion to the log.
+
+        The entry is buffered; await ``commit`` to make it durable.
+        """
+        self._append({"op": DELETE, "id": resource_id})
+
+    async def commit(self) -> None:
+        """Wait until every entry appended so far is durable.
+
+        Writers that call this while a sync is in flight are batched into the
+        next sync, so N concurrent writers cost far fewer than N fsyncs.
+        """
+        target = self._written
+        while self._synced < target:
+            if self._sync_task is None:
+                self._sync_task = asyncio.create_task(self._sync())
+            await asyncio.shield(self._sync_task)
+
+    async def wait_for_sync(self) -> None:
+        """Wait until no sync is in flight."""
+        while self._sync_task is not None:
+            await asyncio.shield(self._sync_task)
+
+    def needs_compaction(self) -> bool:
+        """Whether the log has grown past the snapshot interval."""
+        return self.log_entries >= self.snapshot_interval
+
+    def compact(
+        self, resources: Iterable[Tuple[str, Union[Dict[str, Any], bytes]]]
+    ) -> None:
+        """Write a new snapshot of all resources and start an empty log.
+
+        The snapshot and the new log are written to temporary files and
+        renamed into place, so a crash part-way leaves a loadable journal.
+        Must be called with no sync in flight (see ``wait_for_sync``) and, in
+        shared mode, while holding the lock with every entry applied.
+
+        Args:
+            resources: (ID, resource) pairs for every current resource, in
+                insertion order; see ``write_snapshot``
+        """
+        temp_path = self.snapshot_path.with_suffix(".tmp")
+        write_snapshot(temp_path, resources)
+        os.replace(temp_path, self.snapshot_path)
+
+        # Entries already in the snapshot no longer need to be kept. The log
+        # is replaced rather than truncated so that other processes notice.
+        self.close()
+        temp_path = self.wal_path.with_suffix(".tmp")
+        with open(temp_path, "wb"):
+            pass
+        os.replace(temp_path, self.wal_path)
+        self._sync_directory()
+
+        self.log_entries = 0
+        self._synced = self._written
+        if self.shared:
+            self._open_reader()
+            self._read_offset = 0
+
+    def close(self) -> None:
+        """Flush and close the log file."""
+        if self._log is not None:
+            self._log.flush()
+            if self.fsync:
+                os.fsync(self._log.fileno())
+            self._close_log()
+
+    def _close_log(self) -> None:
+        """Close the log file, or leave it to the sync fsyncing it to close.
+
+        Another process compacting the log makes us reopen it, which may
+        happen while a group commit is fsyncing the old file off the event
+        loop; closing it then would fail the fsync, or fsync a reused fd.
+        """
+        if self._log is None:
+            return
+        with self._retire_lock:
+            if self._syncing:
+                self._retired.append(self._log)
+            else:
+                self._log.close()
+        self._log = None
+
+    def _open_reader(self) -> None:
+        """(Re)open the log for catch-up reads, creating it if needed."""
+        if self._reader_fd is not None:
+            os.close(self._reader_fd)
+        self._reader_fd = os.open(self.wal_path, os.O_RDONLY | os.O_CREAT, 0o644)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        if self._log is None:
+            self._log = open(self.wal_path, "ab")
+        self._log.write(to_json(entry) + b"\n")
+        self._written += 1
+        self.log_entries += 1
+
+    async def _sync(self) -> None:
+        """Flush the log and fsync it off the event loop."""
+        try:
+            target = self._written
+            log = self._log
+            if log is not None:
+                log.flush()
+                if self.fsync:
+                    with self._retire_lock:
+                        self._syncing = True
+                    try:
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(None, os.fsync, log.fileno())
+                    finally:
+                        with self._retire_lock:
+                            self._syncing = False
+                            retired, self._retired = self._retired, []
+                        for retired_log in retired:
+                            retired_log.close()
+            self._synced = max(self._synced, target)
+        finally:
+            self._sync_task = None
+
+    def _sync_directory(self) -> None:
+        """Make a rename in the journal directory durable."""
+        if not self.fsync or not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _parse_entry(
+        entry: Dict[str, Any],
+    ) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+        op = entry.get("op")
+        if op not in (PUT, DELETE):
+            raise ValueError(f"Unknown journal operation: {op!r}")
+        return op, entry["id"], entry.get("data")
+
+    @staticmethod
+    def _read_lines(path: Path) -> Iterator[Dict[str, Any]]:
+        """Read JSON lines from a journal file.
+
+        A final line torn by a crash mid-write is dropped and truncated away,
+        so later appends start on a clean line.
+
+        Raises:
+            ValueError: If any other line is corrupt
+        """
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            lines = f.read().split(b"\n")
+
+        offset = 0
+        for number, line in enumerate(lines):
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    if number < len(lines) - 1:
+                        raise ValueError(f"Corrupt journal line {number + 1} in {path}")
+                    os.truncate(path, offset)
+                    return
+                yield entry
+            offset += len(line) + 1
@@ -3,6 +3,11 @@
 from typing import Dict, List, Any, Optional, Type, Union
 from pydantic import BaseModel, create_model, Field
 from datetime import datetime
+from .indexes import IndexDefinition, IndexType, parse_index_definitions
+
+
+# Backends that store resources in SQL tables and need SQLModel table models
+SQL_BACKENDS = ("sqlmodel", "sqlmodel_async")
 
 
 class PydanticGenerator:
@@ -12,15 +17,17 @@ class PydanticGenerator:
         """Initialize the generator.
 
         Args:
-            backend_type: Backend type - "default" for in-memory, "sqlmodel" for SQL
+            backend_type: Backend type - "default" for in-memory, "sqlmodel" or
+                "sqlmodel_async" for SQL
         """
         self.backend_type = backend_type
+        self._table_models = backend_type in SQL_BACKENDS
         self.generated_models: Dict[str, Type[Union[BaseModel, Any]]] = {}
         self._schema_cache: Dict[str, Dict[str, Any]] = {}
 
         # Import SQLModel only when needed
         self._sqlmodel_base = None
-        if backend_type == "sqlmodel":
+        if self._table_models:
             try:
                 from sqlmodel import SQLModel
 
@@ -70,7 +77,7 @@ class PydanticGenerator:
             field_type = self._schema_to_python_type(field_schema, field_name)
 
             # Handle SQLModel Field vs Pydantic Field
-            if self.backend_type == "sqlmodel":
+            if self._table_models:
                 from sqlmodel import Field as SQLField
 
                 # Determine if field is required and configure for SQLModel
@@ -102,7 +109,7 @@ class PydanticGenerator:
             field_definitions[field_name] = (field_type, field_info)
 
         # Choose base class and create model
-        if self.backend_type == "sqlmodel":
+        if self._table_models:
             # Create SQLModel table
             if not table_name:
                 table_name = model_name.lower() + "s"  # pluralize for table name
@@ -157,12 +164,64 @@ class PydanticGenerator:
             field_str = f" = Field({', '.join(field_args)})" if field_args else ""
             model_source += f"    {field_name}: {type_str}{field_str}\n"
 
+        # Secondary indexes declared with x-liveapi-index / x-liveapi-unique
+        model.index_definitions = parse_index_definitions(schema)
+        if self._table_models:
+            table_indexes = self._add_table_indexes(model, model.index_definitions)
+            if table_indexes:
+                model_source += "\n    __table_args__ = (\n"
+                for index in table_indexes:
+                    columns = ", ".join(repr(column.name) for column in index.columns)
+                    unique = ", unique=True" if index.unique else ""
+                    model_source += (
+                        f"        Index({index.name!r}, {columns}{unique}),\n"
+                    )
+                model_source += "    )\n"
+
         model.model_source = model_source
 
         # Cache the model
         self.generated_models[model_name] = model
         return model
 
+    def _add_table_indexes(
+        self, model: Type[Any], definitions: List[IndexDefinition]
+    ) -> List[Any]:
+        """Add SQL indexes for the declared index definitions to a table model.
+
+        Hash and sorted indexes both become B-tree indexes, which serve
+        equality and range filters alike. Trigram indexes are skipped, since
+        a B-tree can't serve substring search. Index names are prefixed with
+        the table name, as they must be unique across the database.
+
+        Returns:
+            The indexes added to the model's table
+
+        Raises:
+            ValueError: If an index refers to a field the model doesn't have
+        """
+        from sqlalchemy import Index
+
+        table = model.__table__
+        indexes = []
+        for definition in definitions:
+            if definition.type == IndexType.TRIGRAM:
+                continue
+            unknown = [name for name in definition.fields if name not in table.c]
+            if unknown:
+                raise ValueError(
+                    f"Index {definition.name} on {table.name} refers to unknown "
+                    f"fields: {', '.join(unknown)}"
+                )
+            indexes.append(
+                Index(
+                    f"{table.name}_{definition.name}",
+                    *(table.c[name] for name in definition.fields),
+                    unique=definition.unique,
+                )
+            )
+        return indexes
+
     def _schema_to_python_type(
         self, schema: Dict[str, Any], field_name: str = ""
     ) -> Any:
@@ -204,7 +263,7 @@ class PydanticGenerator:
 
     def _create_dict_model(self, model_name: str) -> Type[Union[BaseModel, Any]]:
         """Create a simple dict-based model."""
-        if self.backend_type == "sqlmodel":
+        if self._table_models:
             from sqlmodel import SQLModel
 
             # Create a SQLModel table class
@@ -233,7 +292,7 @@ class PydanticGenerator:
         else:
             root_type = self._schema_to_python_type(schema)
 
-        if self.backend_type == "sqlmodel":
+        if self._table_models:
             from sqlmodel import SQLModel
 
             # Create a SQLModel table class
@@ -0,0 +1,54 @@
+"""Fast-path JSON responses for service output."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+
+@lru_cache(maxsize=None)
+def response_adapter(response_type: Any) -> TypeAdapter:
+    """Return a cached TypeAdapter for a route's response model.
+
+    Args:
+        response_type: The route's ``response_model``, e.g. ``List[Item]``
+
+    Returns:
+        TypeAdapter for ``response_type``
+    """
+    return TypeAdapter(response_type)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded directly by pydantic-core.
+
+    Returning a Response from a route skips FastAPI's ``response_model``
+    handling and its ``jsonable_encoder`` pass. Given the route's response
+    type, content is still run through the model in one compiled pass, so
+    keys the model doesn't declare (such as the in-memory backend's
+    timestamps) are dropped exactly as ``response_model`` would drop them.
+    """
+
+    def __init__(self, content: Any, response_type: Optional[Any] = None, **kwargs):
+        """Initialize the response.
+
+        Args:
+            content: Service output to encode
+            response_type: Model (or e.g. ``List[Model]``) shaping the output;
+                without it content is encoded as is
+            **kwargs: Passed on to JSONResponse
+        """
+        self.adapter = (
+            None if response_type is None else response_adapter(response_type)
+        )
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        """Encode content to compact UTF-8 JSON."""
+        if self.adapter is None:
+            return to_json(content)
+        return self.adapter.dump_json(
+            self.adapter.validate_python(content), by_alias=True
+        )
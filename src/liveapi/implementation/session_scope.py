@@ -0,0 +1,127 @@
+"""Request-scoped units of work over pooled database sessions."""
+
+import inspect
+import threading
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from .threadpool import BlockingExecutor
+
+
+class UnitOfWork:
+    """The session and resource services shared by everything one request does.
+
+    Every resource a request touches gets its service from the same unit of
+    work, so they all run on one session and see each other's changes.
+    """
+
+    def __init__(self, session: Any, service_factory: Callable[..., Any]):
+        """Initialize the unit of work.
+
+        Args:
+            session: The session (sync or async) the services run on
+            service_factory: Called with ``(model, resource_name, session)``
+                to build the service for a resource the first time it's used
+        """
+        self.session = session
+        self._service_factory = service_factory
+        self._services: Dict[str, Any] = {}
+
+    def service(self, model: Type[Any], resource_name: str) -> Any:
+        """Return the service for a resource, bound to this unit's session.
+
+        Args:
+            model: SQLModel class for the resource
+            resource_name: Name of the resource (e.g., "users")
+
+        Returns:
+            The resource's service
+        """
+        service = self._services.get(resource_name)
+        if service is None:
+            service = self._service_factory(model, resource_name, self.session)
+            self._services[resource_name] = service
+        return service
+
+
+class SessionScopes:
+    """Pool of units of work handed out for the duration of a request.
+
+    Building a session and a service object for each resource on every
+    request costs more than the queries behind many of them. Released units
+    are closed, which rolls back anything left uncommitted, expunges every
+    instance and returns the connection to the engine's pool, and then kept
+    for the next request together with the services already built on them.
+    A unit is only ever used by one request at a time.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        service_factory: Callable[..., Any],
+        max_idle: int = 16,
+        executor: Optional[BlockingExecutor] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            session_factory: Creates a new (sync or async) session
+            service_factory: Builds a resource's service on a session (see
+                UnitOfWork)
+            max_idle: Number of released units kept for reuse
+            executor: If given, sync sessions are closed on this thread pool,
+                since closing may roll back over the network
+        """
+        if max_idle < 0:
+            raise ValueError("max_idle can't be negative")
+        self.session_factory = session_factory
+        self.service_factory = service_factory
+        self.max_idle = max_idle
+        self.executor = executor
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self._idle: List[UnitOfWork] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> UnitOfWork:
+        """Take an idle unit of work, or create one if none is left."""
+        with self._lock:
+            self.in_use += 1
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+            self.created += 1
+        return UnitOfWork(self.session_factory(), self.service_factory)
+
+    async def release(self, unit: UnitOfWork) -> None:
+        """Close a unit's session and keep the unit for reuse if there's room.
+
+        Args:
+            unit: A unit of work returned by ``acquire``
+        """
+        closed = False
+        try:
+            if self.executor is not None:
+                await self.executor.run(unit.session.close)
+            else:
+                result = unit.session.close()
+                if inspect.isawaitable(result):
+                    await result
+            closed = True
+        finally:
+            with self._lock:
+                self.in_use -= 1
+                # A session that failed to close isn't safe to hand out again
+                if closed and len(self._idle) < self.max_idle:
+                    self._idle.append(unit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return how many units were created and reused, and are in use."""
+        with self._lock:
+            return {
+                "in_use": self.in_use,
+                "idle": len(self._idle),
+                "max_idle": self.max_idle,
+                "created": self.created,
+                "reused": self.reused,
+            }
@@ -1,13 +1,46 @@
 """SQLModel-based resource service for database persistence."""
 
-from typing import Dict, Any, List, Type
+from collections import Counter
+from typing import (
+    Dict,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from datetime import datetime, timezone
 import uuid
 
-from sqlmodel import SQLModel, Session, select, and_
-from sqlalchemy.exc import IntegrityError
+from sqlmodel import SQLModel, Session, select, and_, delete, insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from pydantic_core import to_jsonable_python
 
-from .exceptions import NotFoundError, ValidationError, ConflictError
+from .caching import ResourceCache
+from .coalescing import WriteCoalescer
+from .exceptions import BusinessException, NotFoundError, ValidationError, ConflictError
+from .filters import BoundFilterPlan, compile_filters
+from .pagination import decode_cursor, encode_cursor
+from .threadpool import BlockingExecutor
+from .validation import validate_many
+
+
+T = TypeVar("T")
+
+# Keep IN (...) lists under the bound-parameter limits of every database
+_IN_CHUNK_SIZE = 500
+
+
+def _chunks(values: List[Any], size: int = _IN_CHUNK_SIZE) -> Iterator[List[Any]]:
+    """Split values into lists of at most ``size`` items."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
 
 
 class SQLModelResourceService:
@@ -17,21 +50,42 @@ class SQLModelResourceService:
     persists data to a SQL database using SQLModel.
     """
 
-    def __init__(self, model: Type[SQLModel], resource_name: str, session: Session):
+    def __init__(
+        self,
+        model: Type[SQLModel],
+        resource_name: str,
+        session: Session,
+        coalescer: Optional[WriteCoalescer] = None,
+        cache: Optional[ResourceCache] = None,
+        executor: Optional[BlockingExecutor] = None,
+    ):
         """Initialize the SQL resource service.
 
         Args:
             model: SQLModel class for the resource
             resource_name: Name of the resource (e.g., "users")
             session: The database session to use for operations.
+            coalescer: If given, single-resource writes are committed in
+                shared transactions with other requests' writes.
+            cache: If given, reads by ID are served through this cache and
+                writes through this service invalidate it.
+            executor: If given, queries and row serialization run on its
+                thread pool instead of blocking the event loop.
         """
         self.resource_name = resource_name
         self.model = model
         self.session = session
+        self.coalescer = coalescer
+        self.cache = cache
+        self.executor = executor
 
     async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new resource in the database.
 
+        The row is written with a single INSERT (with RETURNING where the
+        database supports it) and duplicates are detected by the primary-key
+        constraint, so a create costs one round trip plus the commit.
+
         Args:
             data: Resource data validated by SQLModel
 
@@ -42,48 +96,22 @@ class SQLModelResourceService:
             ConflictError: If resource with same ID already exists
             ValidationError: If data validation fails
         """
-        try:
-            # Create SQLModel instance for validation
-            resource_data = data.copy()
-
-            # Get or generate ID
-            resource_id = resource_data.get("id")
-            if not resource_id:
-                resource_id = str(uuid.uuid4())
-                resource_data["id"] = resource_id
-
-            # Add timestamps if the model supports them
-            now = datetime.now(timezone.utc)
-            if hasattr(self.model, "created_at"):
-                resource_data["created_at"] = now
-            if hasattr(self.model, "updated_at"):
-                resource_data["updated_at"] = now
+        resource_id, row = self._new_row(data)
 
-            # Create and validate the model instance
-            db_resource = self.model(**resource_data)
-
-            # Save to database
-            # Check for existing resource with same ID
-            existing = self.session.get(self.model, resource_id)
-            if existing:
+        try:
+            row = await self._write(lambda session: self._insert_row(session, row))
+            self._invalidate([resource_id])
+        except IntegrityError as e:
+            if await self._run(self._existing_ids, [resource_id]):
                 raise ConflictError(
                     f"{self.resource_name} with ID {resource_id} already exists"
                 )
-
-            self.session.add(db_resource)
-            self.session.commit()
-            self.session.refresh(db_resource)
-
-            # Convert to dict for return
-            return self._model_to_dict(db_resource)
-
-        except IntegrityError as e:
             raise ConflictError(f"Database constraint violation: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ConflictError, ValidationError)):
-                raise
+        except SQLAlchemyError as e:
             raise ValidationError(f"Invalid data: {str(e)}")
 
+        return to_jsonable_python(row)
+
     async def read(self, resource_id: str) -> Dict[str, Any]:
         """Read a single resource by ID from the database.
 
@@ -96,11 +124,15 @@ class SQLModelResourceService:
         Raises:
             NotFoundError: If resource doesn't exist
         """
-        db_resource = self.session.get(self.model, resource_id)
-        if not db_resource:
+        cached, version = self._cache_lookup(resource_id)
+        if cached is not None:
+            return cached
+
+        resource = await self._run(self._load, resource_id)
+        if resource is None:
             raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
 
-        return self._model_to_dict(db_resource)
+        return self._cache_store(resource_id, resource, version)
 
     async def update(
         self, resource_id: str, data: Dict[str, Any], partial: bool = False
@@ -117,64 +149,145 @@ class SQLModelResourceService:
 
         Raises:
             NotFoundError: If resource doesn't exist
+            ConflictError: If the update violates a unique index
             ValidationError: If data validation fails
         """
-        db_resource = self.session.get(self.model, resource_id)
-        if not db_resource:
-            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
-
         try:
-            update_data = data.copy()
+            return await self._write(
+                lambda session: self._update_row(session, resource_id, data, partial)
+            )
+        except BusinessException:
+            raise
+        except IntegrityError as e:
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except Exception as e:
+            raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate([resource_id])
 
-            if partial:
-                # PATCH: Update only provided fields
-                for key, value in update_data.items():
-                    if hasattr(db_resource, key):
-                        setattr(db_resource, key, value)
-            else:
-                # PUT: Replace entire resource (except system fields)
-                # Get current values for system fields
-                existing_dict = self._model_to_dict(db_resource)
+    async def delete(self, resource_id: str) -> None:
+        """Delete a resource from the database.
 
-                # Preserve system fields
-                update_data["id"] = resource_id
-                if "created_at" in existing_dict:
-                    update_data["created_at"] = existing_dict["created_at"]
+        Args:
+            resource_id: The ID of the resource
 
-                # Create new instance to validate all fields
-                for key, value in update_data.items():
-                    if hasattr(db_resource, key):
-                        setattr(db_resource, key, value)
+        Raises:
+            NotFoundError: If resource doesn't exist
+        """
+        try:
+            await self._write(lambda session: self._delete_row(session, resource_id))
+        finally:
+            self._invalidate([resource_id])
 
-            # Update timestamp
-            if hasattr(db_resource, "updated_at"):
-                db_resource.updated_at = datetime.now(timezone.utc)
+    async def upsert(self, resource_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a resource with the given ID, or replace it if it exists.
 
-            self.session.add(db_resource)
-            self.session.commit()
-            self.session.refresh(db_resource)
+        The row is written with a single INSERT ... ON CONFLICT DO UPDATE on
+        SQLite and PostgreSQL, so an upsert costs one round trip plus the
+        commit, without checking first whether the resource exists. A
+        replaced resource keeps its ``created_at``.
 
-            return self._model_to_dict(db_resource)
+        Args:
+            resource_id: The ID of the resource
+            data: Resource data validated by SQLModel
 
-        except Exception as e:
-            self.session.rollback()
+        Returns:
+            The resource as stored
+
+        Raises:
+            ConflictError: If the write violates a unique index
+            ValidationError: If data validation fails
+        """
+        _, row = self._new_row({**data, "id": resource_id})
+
+        try:
+            resources = await self._write(
+                lambda session: self._upsert_rows(session, [row])
+            )
+        except IntegrityError as e:
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except SQLAlchemyError as e:
             raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate([resource_id])
 
-    async def delete(self, resource_id: str) -> None:
-        """Delete a resource from the database.
+        return resources[0]
+
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create many resources in one transaction.
+
+        All items are validated in a single pass and inserted with one
+        executemany INSERT; either all are created or none are.
 
         Args:
-            resource_id: The ID of the resource
+            items: Resource data for each new resource
+
+        Returns:
+            Created resources, in the order given
 
         Raises:
-            NotFoundError: If resource doesn't exist
+            ConflictError: If an ID already exists or is repeated in the batch
+            ValidationError: If any item is invalid
         """
-        db_resource = self.session.get(self.model, resource_id)
-        if not db_resource:
-            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+        return await self._run(self._bulk_create, items)
 
-        self.session.delete(db_resource)
-        self.session.commit()
+    async def bulk_update(
+        self, items: List[Dict[str, Any]], partial: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Update many resources in one transaction.
+
+        Each item carries the ``id`` of the resource to update. The targets
+        are loaded with batched IN queries, all results are validated in one
+        pass and committed together; either all updates are applied or none
+        are.
+
+        Args:
+            items: Updated data for each resource, including its ``id``
+            partial: If True, merge each item into the existing resource
+                (PATCH); otherwise replace it (PUT)
+
+        Returns:
+            Updated resources, in the order given
+
+        Raises:
+            NotFoundError: If any resource doesn't exist
+            ConflictError: If an update violates a unique index
+            ValidationError: If an item has no ``id`` or any result is invalid
+        """
+        return await self._run(self._bulk_update, items, partial)
+
+    async def bulk_delete(self, resource_ids: List[str]) -> None:
+        """Delete many resources in one transaction.
+
+        Either all resources are deleted or, if any doesn't exist, none are.
+
+        Args:
+            resource_ids: IDs of the resources to delete
+
+        Raises:
+            NotFoundError: If any resource doesn't exist
+        """
+        await self._run(self._bulk_delete, resource_ids)
+
+    async def bulk_upsert(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create or replace many resources in one transaction.
+
+        Each item carries the ``id`` of its resource. All items are
+        validated in a single pass and written with batched INSERT ... ON
+        CONFLICT DO UPDATE statements; either all are written or none are.
+
+        Args:
+            items: Resource data for each resource, including its ``id``
+
+        Returns:
+            The resources as stored, in the order given
+
+        Raises:
+            ConflictError: If an ID is repeated in the batch or a write
+                violates a unique index
+            ValidationError: If an item has no ``id`` or any item is invalid
+        """
+        return await self._run(self._bulk_upsert, items)
 
     async def list(
         self,
@@ -193,7 +306,7 @@ class SQLModelResourceService:
             List of resources matching the filters
         """
         # Start with base query
-        query = select(self.model)
+        query = self._select_rows()
 
         # Apply filters
         if filters:
@@ -202,51 +315,613 @@ class SQLModelResourceService:
         # Apply pagination
         query = query.offset(offset).limit(limit)
 
-        # Execute query
-        results = self.session.exec(query).all()
+        # Execute query and convert rows to dicts
+        return await self._run(self._fetch_all, self.session, query)
+
+    async def list_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """List one page of resources using keyset (cursor) pagination.
+
+        Pages are ordered by primary key and the cursor encodes the last key
+        seen, so the database seeks straight to the next page through the
+        primary key index instead of scanning and discarding offset rows.
+
+        Args:
+            limit: Maximum number of results
+            cursor: Cursor returned with the previous page, or None to start
+            **filters: Additional filter parameters
+
+        Returns:
+            The page of resources and the cursor for the next page, or None
+            if this is the last page
+
+        Raises:
+            ValidationError: If the cursor or limit is invalid
+        """
+        if limit < 1:
+            raise ValidationError("Invalid limit: must be at least 1")
+        primary_key = self._primary_key()
+        query = self._select_rows()
+
+        if filters:
+            query = self._apply_filters(query, filters)
+        if cursor:
+            query = query.where(primary_key > self._cursor_key(cursor))
+
+        # Fetch one extra row to know whether another page follows
+        query = query.order_by(primary_key).limit(limit + 1)
+        return await self._run(self._fetch_page, query, limit)
+
+    async def stream(
+        self, batch_size: int = 1000, **filters: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every resource matching the filters, in primary key order.
+
+        The query runs once, over the table's columns rather than ORM
+        entities, on a dedicated connection (a streamed response outlives the
+        request's session). Rows are read through a server-side cursor where
+        the driver has one, ``batch_size`` at a time, and converted straight
+        to dicts without an identity map, so memory use stays constant
+        however many rows are exported.
+
+        Args:
+            batch_size: Number of rows fetched from the cursor at a time
+            **filters: Filter parameters
+
+        Yields:
+            Matching resources
+        """
+        query = self._stream_query(filters)
+        connection = await self._run(self.session.get_bind().connect)
+        try:
+            result = await self._run(
+                connection.execution_options(
+                    stream_results=True, yield_per=batch_size
+                ).execute,
+                query,
+            )
+            keys = list(result.keys())
+            partitions = result.partitions()
+            while True:
+                rows = await self._run(next, partitions, None)
+                if rows is None:
+                    return
+                for resource in self._rows_to_dicts(keys, rows):
+                    yield resource
+        finally:
+            connection.close()
+
+    async def _write(self, operation: Callable[[Session], T]) -> T:
+        """Run a single-resource write and commit it.
+
+        With a coalescer the write joins the next shared transaction;
+        otherwise it runs and commits on the request's session.
+
+        Args:
+            operation: Function performing the write on a session, without
+                committing
+
+        Returns:
+            The operation's result
+
+        Raises:
+            Exception: Whatever the operation or the commit raised
+        """
+        if self.coalescer is not None:
+            return await self.coalescer.submit(operation)
+        return await self._run(self._commit, operation)
+
+    def _commit(self, operation: Callable[[Session], T]) -> T:
+        """Run a write on the request's session and commit it."""
+        try:
+            result = operation(self.session)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return result
+
+    async def _run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run blocking database work on the executor, if there is one."""
+        if self.executor is None:
+            return function(*args)
+        return await self.executor.run(function, *args)
+
+    def _load(self, resource_id: str) -> Optional[Dict[str, Any]]:
+        """Load a resource by ID, or return None if it doesn't exist."""
+        resources = self._fetch_all(self.session, self._select_by_id(resource_id))
+        return resources[0] if resources else None
+
+    def _fetch_all(self, session: Session, query: Any) -> List[Dict[str, Any]]:
+        """Run a query over the table's columns and convert the rows."""
+        result = session.execute(query)
+        return self._rows_to_dicts(result.keys(), result.all())
+
+    def _insert_row(self, session: Session, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a new row, returning it as stored where supported."""
+        statement, returning = self._insert_statement(row)
+        result = session.execute(statement)
+        return dict(result.mappings().one()) if returning else row
+
+    def _update_row(
+        self,
+        session: Session,
+        resource_id: str,
+        data: Dict[str, Any],
+        partial: bool,
+    ) -> Dict[str, Any]:
+        """Apply an update to a stored resource and flush it.
+
+        Raises:
+            NotFoundError: If resource doesn't exist
+        """
+        db_resource = session.get(self.model, resource_id)
+        if not db_resource:
+            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+
+        update_data = data.copy()
+        if not partial:
+            # PUT: Replace entire resource (except system fields)
+            update_data["id"] = resource_id
+            existing_dict = self._model_to_dict(db_resource)
+            if "created_at" in existing_dict:
+                update_data["created_at"] = existing_dict["created_at"]
+
+        for key, value in update_data.items():
+            if hasattr(db_resource, key):
+                setattr(db_resource, key, value)
+
+        # Update timestamp
+        if hasattr(db_resource, "updated_at"):
+            db_resource.updated_at = datetime.now(timezone.utc)
+
+        session.add(db_resource)
+        session.flush()
+        session.refresh(db_resource)
+        return self._model_to_dict(db_resource)
+
+    def _delete_row(self, session: Session, resource_id: str) -> None:
+        """Delete a stored resource.
+
+        Raises:
+            NotFoundError: If resource doesn't exist
+        """
+        db_resource = session.get(self.model, resource_id)
+        if not db_resource:
+            raise NotFoundError(f"{self.resource_name} with ID {resource_id} not found")
+
+        session.delete(db_resource)
+        session.flush()
+
+    def _bulk_create(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate and insert a batch of new resources (see bulk_create)."""
+        rows = self._new_rows(items)
+        ids = Counter(row["id"] for row in rows)
+        self._check_conflicts(ids, self._existing_ids(list(ids)))
+
+        try:
+            if rows:
+                self.session.execute(insert(self.model), rows)
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        self._invalidate(ids)
+
+        return [to_jsonable_python(row) for row in rows]
+
+    def _bulk_update(
+        self, items: List[Dict[str, Any]], partial: bool
+    ) -> List[Dict[str, Any]]:
+        """Load, validate and update a batch of resources (see bulk_update)."""
+        ids = [item.get("id") for item in items]
+        if not all(ids):
+            raise ValidationError("Invalid data: every item needs an id")
+
+        primary_key = self._primary_key()
+        db_resources = {}
+        for chunk in _chunks(ids):
+            for resource in self.session.exec(
+                select(self.model).where(primary_key.in_(chunk))
+            ).all():
+                db_resources[getattr(resource, primary_key.key)] = resource
+        missing = [rid for rid in ids if rid not in db_resources]
+        if missing:
+            raise NotFoundError(
+                f"{self.resource_name} with IDs {', '.join(map(str, missing))} not found"
+            )
+
+        rows = self._merge_updates(items, db_resources, partial)
+        try:
+            results = self._apply_updates(rows, db_resources)
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except Exception as e:
+            self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate(ids)
+
+        return results
+
+    def _bulk_delete(self, resource_ids: List[str]) -> None:
+        """Delete a batch of resources if all exist (see bulk_delete)."""
+        found = self._existing_ids(resource_ids)
+        missing = [rid for rid in resource_ids if rid not in found]
+        if missing:
+            raise NotFoundError(
+                f"{self.resource_name} with IDs {', '.join(map(str, missing))} not found"
+            )
+
+        primary_key = self._primary_key()
+        try:
+            for chunk in _chunks(resource_ids):
+                self.session.execute(delete(self.model).where(primary_key.in_(chunk)))
+            self.session.commit()
+        finally:
+            self._invalidate(resource_ids)
+
+    def _bulk_upsert(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate and write a batch of upserts (see bulk_upsert)."""
+        rows = self._new_upsert_rows(items)
+
+        try:
+            resources = self._upsert_rows(self.session, rows)
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ConflictError(f"Database constraint violation: {str(e)}")
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            raise ValidationError(f"Invalid data: {str(e)}")
+        finally:
+            self._invalidate(row["id"] for row in rows)
+
+        return resources
+
+    def _upsert_rows(
+        self, session: Session, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Insert or replace rows, returning the resources as stored."""
+        ids = [row["id"] for row in rows]
+        statement, returning = self._upsert_statement(session.get_bind().dialect)
+        if statement is None:
+            self._merge_rows(session, rows)
+        elif rows:
+            result = session.execute(statement, rows)
+            if returning:
+                resources = self._rows_to_dicts(result.keys(), result.all())
+                return self._in_order(resources, ids)
+
+        primary_key = self._primary_key()
+        resources = []
+        for chunk in _chunks(ids):
+            query = self._select_rows().where(primary_key.in_(chunk))
+            resources.extend(self._fetch_all(session, query))
+        return self._in_order(resources, ids)
+
+    def _merge_rows(self, session: Session, rows: List[Dict[str, Any]]) -> None:
+        """Upsert rows where the database has no ON CONFLICT clause.
+
+        The existing rows are found first, then the others are inserted and
+        those are updated.
+        """
+        primary_key = self._primary_key()
+        existing = set()
+        for chunk in _chunks([row["id"] for row in rows]):
+            existing.update(
+                session.exec(select(primary_key).where(primary_key.in_(chunk)))
+            )
+
+        new_rows = [row for row in rows if row["id"] not in existing]
+        if new_rows:
+            session.execute(insert(self.model), new_rows)
+        for row in rows:
+            if row["id"] in existing:
+                values = {k: v for k, v in row.items() if k != "created_at"}
+                session.execute(
+                    self.model.__table__.update()
+                    .where(primary_key == row["id"])
+                    .values(values)
+                )
+
+    def _fetch_page(
+        self, query: Any, limit: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Run a page query fetching ``limit + 1`` rows (see list_page)."""
+        primary_key = self._primary_key()
+        result = self.session.execute(query)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(getattr(rows[-1], primary_key.key))
+
+        return self._rows_to_dicts(result.keys(), rows), next_cursor
+
+    def _stream_query(self, filters: Dict[str, Any]) -> Any:
+        """Build the Core query over the table's columns used by stream."""
+        query = self._select_rows()
+        if filters:
+            query = self._apply_filters(query, filters)
+        return query.order_by(self._primary_key())
+
+    def _select_rows(self) -> Any:
+        """Return a Core query selecting the table's columns.
+
+        Read paths select plain rows rather than model instances, so results
+        skip ORM hydration and the session's identity map.
+        """
+        return self.model.__table__.select()
+
+    def _select_by_id(self, resource_id: str) -> Any:
+        """Return a Core query selecting the row of one resource."""
+        return self._select_rows().where(self._primary_key() == resource_id)
+
+    def _rows_to_dicts(
+        self, keys: Iterable[str], rows: Iterable[Any]
+    ) -> List[Dict[str, Any]]:
+        """Convert rows to the JSON-compatible dicts services return.
+
+        Produces the same output as ``_model_to_dict`` on the loaded models.
+        Rows are converted one at a time rather than in one call, so a large
+        page doesn't hold the GIL (and stall the event loop) until it's done.
+        """
+        keys = list(keys)
+        return [to_jsonable_python(dict(zip(keys, row))) for row in rows]
 
-        # Convert to dicts
-        return [self._model_to_dict(resource) for resource in results]
+    def _cache_lookup(
+        self, resource_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        """Look a resource up in the read cache.
 
-    def _apply_filters(self, query, filters: Dict[str, Any]):
+        Returns:
+            The cached resource or None, and the cache version to store the
+            resource with once it has been read from the database
+        """
+        if self.cache is None:
+            return None, None
+        return self.cache.get(str(resource_id)), self.cache.version()
+
+    def _cache_store(
+        self, resource_id: str, resource: Dict[str, Any], version: Optional[int]
+    ) -> Dict[str, Any]:
+        """Store a resource read from the database in the read cache."""
+        if self.cache is not None:
+            self.cache.set(str(resource_id), resource, version)
+        return resource
+
+    def _invalidate(self, resource_ids: Iterable[Any]) -> None:
+        """Drop written resources from the read cache."""
+        if self.cache is not None:
+            self.cache.invalidate([str(rid) for rid in resource_ids])
+
+    def _new_row(self, data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Build the row for a new resource, with its ID and timestamps.
+
+        Raises:
+            ValidationError: If data validation fails
+        """
+        try:
+            # Create SQLModel instance for validation
+            resource_data = data.copy()
+
+            # Get or generate ID
+            resource_id = resource_data.get("id")
+            if not resource_id:
+                resource_id = str(uuid.uuid4())
+                resource_data["id"] = resource_id
+
+            # Add timestamps if the model supports them
+            now = datetime.now(timezone.utc)
+            if hasattr(self.model, "created_at"):
+                resource_data["created_at"] = now
+            if hasattr(self.model, "updated_at"):
+                resource_data["updated_at"] = now
+
+            # Create and validate the model instance
+            return resource_id, self.model(**resource_data).model_dump()
+        except Exception as e:
+            raise ValidationError(f"Invalid data: {str(e)}")
+
+    def _new_rows(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate a batch of new resources and add IDs and timestamps."""
+        rows = validate_many(self.model, items)
+
+        now = datetime.now(timezone.utc)
+        for row in rows:
+            if not row.get("id"):
+                row["id"] = str(uuid.uuid4())
+            if hasattr(self.model, "created_at"):
+                row["created_at"] = now
+            if hasattr(self.model, "updated_at"):
+                row["updated_at"] = now
+        return rows
+
+    def _new_upsert_rows(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate a batch of upserts, each naming its resource by ``id``.
+
+        Raises:
+            ConflictError: If an ID is repeated in the batch
+            ValidationError: If an item has no ``id`` or any item is invalid
+        """
+        if not all(item.get("id") for item in items):
+            raise ValidationError("Invalid data: every item needs an id")
+        ids = Counter(str(item["id"]) for item in items)
+        repeated = sorted(rid for rid, count in ids.items() if count > 1)
+        if repeated:
+            raise ConflictError(
+                f"{self.resource_name} with IDs {', '.join(repeated)} "
+                "repeated in the batch"
+            )
+        return self._new_rows(items)
+
+    def _check_conflicts(self, ids: Counter, existing: set) -> None:
+        """Reject a batch whose IDs repeat or already exist.
+
+        Raises:
+            ConflictError: If any ID is repeated or already exists
+        """
+        duplicates = {rid for rid, count in ids.items() if count > 1}
+        conflicts = sorted(duplicates.union(existing))
+        if conflicts:
+            raise ConflictError(
+                f"{self.resource_name} with IDs {', '.join(conflicts)} already exist"
+            )
+
+    def _insert_statement(self, row: Dict[str, Any]) -> Tuple[Any, bool]:
+        """Build a single-row INSERT, with RETURNING where supported.
+
+        Returns:
+            The statement and whether it returns the inserted row
+        """
+        statement = insert(self.model).values(row)
+        returning = self.session.get_bind().dialect.insert_returning
+        if returning:
+            statement = statement.returning(*self.model.__table__.columns)
+        return statement, returning
+
+    def _upsert_statement(self, dialect: Any) -> Tuple[Optional[Any], bool]:
+        """Build the INSERT ... ON CONFLICT DO UPDATE used by upserts.
+
+        Rows whose primary key exists replace the stored row, except for
+        its ``created_at``. Executed with many rows, the statement is sent
+        as multi-row INSERTs.
+
+        Returns:
+            The statement, or None if the database has no ON CONFLICT
+            clause, and whether it returns the written rows
+        """
+        if dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            return None, False
+
+        table = self.model.__table__
+        statement = dialect_insert(table)
+        keys = list(table.primary_key.columns)
+        replaced = {
+            column.name: statement.excluded[column.name]
+            for column in table.columns
+            if not column.primary_key and column.name != "created_at"
+        }
+        # With nothing else to replace, setting the key to itself still
+        # makes the conflict an update, so the stored row is returned
+        statement = statement.on_conflict_do_update(
+            index_elements=keys,
+            set_=replaced or {key.name: statement.excluded[key.name] for key in keys},
+        )
+
+        returning = dialect.insert_executemany_returning
+        if returning:
+            statement = statement.returning(*table.columns)
+        return statement, returning
+
+    def _in_order(
+        self, resources: List[Dict[str, Any]], ids: List[Any]
+    ) -> List[Dict[str, Any]]:
+        """Order resources to match the IDs they were written with."""
+        by_id = {str(resource["id"]): resource for resource in resources}
+        return [by_id[str(rid)] for rid in ids]
+
+    def _merge_updates(
+        self,
+        items: List[Dict[str, Any]],
+        db_resources: Dict[Any, SQLModel],
+        partial: bool,
+    ) -> List[Dict[str, Any]]:
+        """Merge a batch of updates into the loaded rows and validate them.
+
+        Raises:
+            ValidationError: If any result is invalid
+        """
+        merged = []
+        for item in items:
+            existing = self._model_to_dict(db_resources[item["id"]])
+            if partial:
+                merged.append({**existing, **item})
+            else:
+                merged.append({**item, "created_at": existing.get("created_at")})
+        return validate_many(self.model, merged)
+
+    def _apply_updates(
+        self, rows: List[Dict[str, Any]], db_resources: Dict[Any, SQLModel]
+    ) -> List[Dict[str, Any]]:
+        """Apply validated rows to the loaded instances.
+
+        Returns:
+            The updated resources, serialised before the commit expires the
+            instances rather than reloading each one afterwards
+        """
+        now = datetime.now(timezone.utc)
+        for row in rows:
+            db_resource = db_resources[row["id"]]
+            for key, value in row.items():
+                setattr(db_resource, key, value)
+            if hasattr(db_resource, "updated_at"):
+                db_resource.updated_at = now
+        return [self._model_to_dict(db_resources[row["id"]]) for row in rows]
+
+    def _existing_ids(self, resource_ids: List[Any]) -> set:
+        """Return which of the given primary keys exist in the table."""
+        primary_key = self._primary_key()
+        found = set()
+        for chunk in _chunks(resource_ids):
+            found.update(
+                self.session.exec(select(primary_key).where(primary_key.in_(chunk)))
+            )
+        return found
+
+    def _primary_key(self):
+        """Return the model attribute mapped to the primary key column."""
+        column = next(iter(self.model.__table__.primary_key.columns))
+        return getattr(self.model, column.key)
+
+    def _cursor_key(self, cursor: str) -> Any:
+        """Decode a pagination cursor holding a primary key value.
+
+        A cursor can decode cleanly and still hold something other than a
+        key (an object, a list, a number for a text key), which would fail
+        in the driver rather than as a bad request.
+
+        Raises:
+            ValidationError: If the cursor is malformed or isn't a key
+        """
+        key = decode_cursor(cursor)
+        column = next(iter(self.model.__table__.primary_key.columns))
+        # Type decorators such as SQLModel's AutoString defer to their impl
+        column_type = getattr(column.type, "impl_instance", column.type)
+        try:
+            key_type = column_type.python_type
+        except NotImplementedError:
+            key_type = (str, int, float)
+        if isinstance(key, bool) or not isinstance(key, key_type):
+            raise ValidationError(f"Invalid pagination cursor: {cursor!r}")
+        return key
+
+    def _apply_filters(self, query, filters: Union[Dict[str, Any], BoundFilterPlan]):
         """Apply filters to SQLModel query.
 
         Args:
             query: SQLModel select query
-            filters: Filter parameters
+            filters: Filter parameters or a compiled filter plan
 
         Returns:
             Filtered query
         """
-        conditions = []
-
-        for key, value in filters.items():
-            # Skip pagination parameters
-            if key in ("limit", "offset"):
-                continue
-
-            # Get the field from the model
-            field_name = key
-            if key.endswith("__gte"):
-                field_name = key[:-5]
-                if hasattr(self.model, field_name):
-                    field = getattr(self.model, field_name)
-                    conditions.append(field >= value)
-            elif key.endswith("__lte"):
-                field_name = key[:-5]
-                if hasattr(self.model, field_name):
-                    field = getattr(self.model, field_name)
-                    conditions.append(field <= value)
-            elif key.endswith("__contains"):
-                field_name = key[:-10]
-                if hasattr(self.model, field_name):
-                    field = getattr(self.model, field_name)
-                    conditions.append(field.contains(value))
-            else:
-                # Exact match
-                if hasattr(self.model, field_name):
-                    field = getattr(self.model, field_name)
-                    conditions.append(field == value)
+        conditions = compile_filters(filters).sql_conditions(self.model)
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -0,0 +1,308 @@
+"""Storage engines for the in-memory resource service.
+
+DefaultResourceService keeps its records in a mapping of resource ID to
+record dict. The default engine is a plain ``dict``; ``ColumnarStorage`` is a
+drop-in compact alternative that stores each field in its own column and only
+materialises record dicts when they are read.
+"""
+
+import sys
+from array import array
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List
+
+
+STORAGE_ENGINES = ("dict", "columnar")
+
+# Per-row state of a column value
+_PRESENT = 0
+_NULL = 1
+_ABSENT = 2
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class _Column:
+    """A single field stored for every row.
+
+    Values are kept in ``values``; ``states`` records per row whether the
+    value is present, None, or absent from the record. Values the column's
+    encoding can't represent exactly are kept in ``overflow``.
+    """
+
+    def __init__(self, rows: int):
+        self.values = self._empty(rows)
+        self.states = bytearray([_ABSENT]) * rows
+        self.overflow: Dict[int, Any] = {}
+
+    def _empty(self, rows: int):
+        return [None] * rows
+
+    def _encode(self, value: Any) -> Any:
+        """Encode a value for storage, raising ValueError if not representable."""
+        return value
+
+    def _decode(self, stored: Any) -> Any:
+        return stored
+
+    def _blank(self) -> Any:
+        return None
+
+    def append_row(self) -> None:
+        self.values.append(self._blank())
+        self.states.append(_ABSENT)
+
+    def set(self, row: int, value: Any) -> None:
+        self.overflow.pop(row, None)
+        if value is None:
+            self.values[row] = self._blank()
+            self.states[row] = _NULL
+            return
+        try:
+            self.values[row] = self._encode(value)
+        except (ValueError, TypeError, OverflowError):
+            self.values[row] = self._blank()
+            self.overflow[row] = value
+        self.states[row] = _PRESENT
+
+    def clear(self, row: int) -> None:
+        self.overflow.pop(row, None)
+        self.values[row] = self._blank()
+        self.states[row] = _ABSENT
+
+    def get(self, row: int) -> Any:
+        state = self.states[row]
+        if state == _NULL:
+            return None
+        if row in self.overflow:
+            return self.overflow[row]
+        return self._decode(self.values[row])
+
+    def memory_usage(self) -> int:
+        return (
+            sys.getsizeof(self.values)
+            + sys.getsizeof(self.states)
+            + sys.getsizeof(self.overflow)
+        )
+
+
+class _ObjectColumn(_Column):
+    """Column of arbitrary Python objects.
+
+    Repeated strings are deduplicated through a per-column pool, so
+    low-cardinality fields (statuses, owners, ...) hold one string object per
+    distinct value. The pool stops growing at ``POOL_LIMIT`` entries so
+    unique values such as IDs aren't retained twice.
+    """
+
+    POOL_LIMIT = 1024
+
+    def __init__(self, rows: int):
+        super().__init__(rows)
+        self.pool: Dict[str, str] = {}
+
+    def _encode(self, value: Any) -> Any:
+        if type(value) is not str:
+            return value
+        pooled = self.pool.get(value)
+        if pooled is not None:
+            return pooled
+        if len(self.pool) < self.POOL_LIMIT:
+            self.pool[value] = value
+        return value
+
+    def memory_usage(self) -> int:
+        seen = set()
+        total = super().memory_usage() + sys.getsizeof(self.pool)
+        for value in self.values:
+            if value is not None and id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+        return total
+
+
+class _ArrayColumn(_Column):
+    """Column of fixed-width numbers in a typed array."""
+
+    typecode = "q"
+    python_type: type = int
+
+    def _empty(self, rows: int):
+        return array(self.typecode, bytes(array(self.typecode).itemsize * rows))
+
+    def _blank(self) -> Any:
+        return self.python_type()
+
+    def _encode(self, value: Any) -> Any:
+        if type(value) is not self.python_type:
+            raise TypeError(value)
+        return value
+
+    def _decode(self, stored: Any) -> Any:
+        return self.python_type(stored)
+
+
+class _IntColumn(_ArrayColumn):
+    typecode = "q"
+    python_type = int
+
+
+class _FloatColumn(_ArrayColumn):
+    typecode = "d"
+    python_type = float
+
+
+class _BoolColumn(_ArrayColumn):
+    typecode = "b"
+    python_type = bool
+
+    def _blank(self) -> Any:
+        return 0
+
+    def _encode(self, value: Any) -> Any:
+        if type(value) is not bool:
+            raise TypeError(value)
+        return int(value)
+
+
+class _TimestampColumn(_ArrayColumn):
+    """ISO-8601 UTC timestamp strings stored as epoch microseconds.
+
+    Only strings that ``datetime.isoformat`` reproduces exactly are encoded,
+    so reads return the original text; anything else overflows.
+    """
+
+    typecode = "q"
+    python_type = str
+
+    def _blank(self) -> Any:
+        return 0
+
+    def _encode(self, value: Any) -> Any:
+        if type(value) is not str:
+            raise TypeError(value)
+        parsed = datetime.fromisoformat(value)
+        if parsed.utcoffset() != timedelta(0) or parsed.isoformat() != value:
+            raise ValueError(value)
+        return (parsed - _EPOCH) // timedelta(microseconds=1)
+
+    def _decode(self, stored: Any) -> Any:
+        return (_EPOCH + timedelta(microseconds=stored)).isoformat()
+
+
+def _column_for(value: Any, rows: int) -> _Column:
+    """Pick a column type for a field based on its first non-null value."""
+    if type(value) is bool:
+        return _BoolColumn(rows)
+    if type(value) is int:
+        return _IntColumn(rows)
+    if type(value) is float:
+        return _FloatColumn(rows)
+    if type(value) is str:
+        try:
+            _TimestampColumn(0)._encode(value)
+            return _TimestampColumn(rows)
+        except (ValueError, TypeError):
+            pass
+    return _ObjectColumn(rows)
+
+
+class ColumnarStorage(MutableMapping):
+    """Compact record storage that keeps each field in its own column.
+
+    Integers, floats and booleans live in typed arrays, UTC timestamp strings
+    are packed into 64-bit integers and repeated strings are deduplicated, so
+    field names and repeated values are stored once rather than in every
+    record dict.
+    Reading a record materialises a new dict; mutating that dict does not
+    change the stored record.
+
+    Rows of deleted records are reused by later inserts.
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, _Column] = {}
+        self._free: List[int] = []
+        self._row_count = 0
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        row = self._rows[key]
+        return {
+            name: column.get(row)
+            for name, column in self._columns.items()
+            if column.states[row] != _ABSENT
+        }
+
+    def __setitem__(self, key: str, record: Dict[str, Any]) -> None:
+        row = self._rows.get(key)
+        if row is None:
+            row = self._allocate_row()
+            self._rows[key] = row
+
+        for name, column in self._columns.items():
+            if name not in record:
+                column.clear(row)
+
+        for name, value in record.items():
+            column = self._columns.get(name)
+            if column is None:
+                if value is None:
+                    column = _ObjectColumn(self._row_count)
+                else:
+                    column = _column_for(value, self._row_count)
+                self._columns[sys.intern(name)] = column
+            column.set(row, value)
+
+    def __delitem__(self, key: str) -> None:
+        row = self._rows.pop(key)
+        for column in self._columns.values():
+            column.clear(row)
+        self._free.append(row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def _allocate_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        for column in self._columns.values():
+            column.append_row()
+        self._row_count += 1
+        return self._row_count - 1
+
+    def memory_usage(self) -> int:
+        """Estimate the bytes held by the storage, including stored values."""
+        return (
+            sys.getsizeof(self._rows)
+            + sys.getsizeof(self._free)
+            + sum(column.memory_usage() for column in self._columns.values())
+        )
+
+
+def create_storage(engine: str = "dict") -> MutableMapping:
+    """Create an empty record store for a storage engine name.
+
+    Args:
+        engine: "dict" for plain dict storage or "columnar" for ColumnarStorage
+
+    Returns:
+        Mapping of resource ID to record
+
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    if engine == "dict":
+        return {}
+    if engine == "columnar":
+        return ColumnarStorage()
+    raise ValueError(
+        f"Unknown storage engine {engine!r}; expected one of {STORAGE_ENGINES}"
+    )
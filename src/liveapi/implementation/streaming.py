@@ -0,0 +1,127 @@
+"""Streaming encoders for exporting whole collections."""
+
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from .serialization import response_adapter
+
+# Encodes one resource to JSON bytes
+Encoder = Callable[[Dict[str, Any]], bytes]
+
+
+# Resources encoded per chunk written to the client
+STREAM_CHUNK_SIZE = 100
+
+
+class StreamFormat(str, Enum):
+    """Wire formats for streamed list responses."""
+
+    NDJSON = "ndjson"  # One JSON document per line
+    JSON = "json"  # A JSON array, written incrementally
+
+
+MEDIA_TYPES = {
+    StreamFormat.NDJSON: "application/x-ndjson",
+    StreamFormat.JSON: "application/json",
+}
+
+
+async def ndjson_chunks(
+    resources: AsyncIterator[Dict[str, Any]],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    encode: Encoder = to_json,
+) -> AsyncIterator[bytes]:
+    """Encode resources as newline-delimited JSON.
+
+    Args:
+        resources: Resources to encode
+        chunk_size: Number of resources per yielded chunk
+        encode: Encodes one resource to JSON bytes
+
+    Yields:
+        Chunks of NDJSON bytes
+    """
+    lines = []
+    async for resource in resources:
+        lines.append(encode(resource))
+        if len(lines) >= chunk_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def json_array_chunks(
+    resources: AsyncIterator[Dict[str, Any]],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    encode: Encoder = to_json,
+) -> AsyncIterator[bytes]:
+    """Encode resources as a JSON array, a chunk at a time.
+
+    Args:
+        resources: Resources to encode
+        chunk_size: Number of resources per yielded chunk
+        encode: Encodes one resource to JSON bytes
+
+    Yields:
+        Chunks that together form one JSON array
+    """
+    separator = b"["
+    items = []
+    async for resource in resources:
+        items.append(encode(resource))
+        if len(items) >= chunk_size:
+            yield separator + b",".join(items)
+            separator = b","
+            items = []
+    if items:
+        yield separator + b",".join(items)
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def model_encoder(model: Any) -> Encoder:
+    """Return an encoder that shapes each resource by a response model.
+
+    Keys the model doesn't declare are dropped, so streamed resources look
+    exactly like the items of a regular list response.
+
+    Args:
+        model: The resource's response model
+
+    Returns:
+        Encoder validating a resource against ``model`` and dumping it
+    """
+    adapter = response_adapter(model)
+
+    def encode(resource: Dict[str, Any]) -> bytes:
+        return adapter.dump_json(adapter.validate_python(resource), by_alias=True)
+
+    return encode
+
+
+def streaming_response(
+    resources: AsyncIterator[Dict[str, Any]],
+    stream_format: StreamFormat,
+    model: Optional[Any] = None,
+) -> StreamingResponse:
+    """Create a response that streams resources in the given format.
+
+    Args:
+        resources: Resources to stream, typically from a service's ``stream``
+        stream_format: Wire format
+        model: Response model shaping each resource; without it resources
+            are encoded as they are
+
+    Returns:
+        StreamingResponse with the matching media type
+    """
+    encode = to_json if model is None else model_encoder(model)
+    if stream_format == StreamFormat.NDJSON:
+        body = ndjson_chunks(resources, encode=encode)
+    else:
+        body = json_array_chunks(resources, encode=encode)
+    return StreamingResponse(body, media_type=MEDIA_TYPES[stream_format])
@@ -0,0 +1,134 @@
+"""Bounded thread pool for blocking database work."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """Run blocking calls on a bounded thread pool, off the event loop.
+
+    At most ``max_workers`` calls run at once and up to ``max_queue`` more
+    wait for a thread. Callers beyond that wait on the event loop for room
+    in the queue, so a burst of slow requests applies backpressure instead
+    of piling up unbounded work. Queue depth and wait times are tracked for
+    sizing the pool.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 64):
+        """Start the thread pool.
+
+        Args:
+            max_workers: Number of threads running blocking calls
+            max_queue: Number of calls allowed to wait for a thread
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue can't be negative")
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.submitted = 0
+        self.completed = 0
+        self.active = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.total_queue_time = 0.0
+        self.max_queue_time = 0.0
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="liveapi-db"
+        )
+        self._lock = threading.Lock()
+        self._room: Optional[asyncio.Semaphore] = None
+        self._room_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call on the pool and wait for its result.
+
+        Args:
+            function: The blocking callable
+            *args: Positional arguments for it
+
+        Returns:
+            The call's result
+
+        Raises:
+            Exception: Whatever the call raised
+        """
+        loop = asyncio.get_running_loop()
+        room = self._semaphore(loop)
+        if room.locked():
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+            try:
+                await room.acquire()
+            finally:
+                self.waiting -= 1
+        else:
+            await room.acquire()
+
+        try:
+            with self._lock:
+                self.submitted += 1
+                self.queued += 1
+                self.peak_queued = max(self.peak_queued, self.queued)
+            return await loop.run_in_executor(
+                self._pool, self._call, time.perf_counter(), function, args
+            )
+        finally:
+            room.release()
+
+    def _call(self, enqueued: float, function: Callable[..., T], args: tuple) -> T:
+        """Run a call on a pool thread, recording its time in the queue."""
+        queue_time = time.perf_counter() - enqueued
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.total_queue_time += queue_time
+            self.max_queue_time = max(self.max_queue_time, queue_time)
+        try:
+            return function(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Return the semaphore bounding in-flight calls on this event loop."""
+        if self._room is None or self._room_loop is not loop:
+            self._room = asyncio.Semaphore(self.max_workers + self.max_queue)
+            self._room_loop = loop
+        return self._room
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool size, queue depth and queue wait statistics."""
+        with self._lock:
+            started = self.submitted - self.queued
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self.active,
+                "queued": self.queued,
+                "peak_queued": self.peak_queued,
+                "waiting": self.waiting,
+                "peak_waiting": self.peak_waiting,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "avg_queue_ms": (
+                    round(self.total_queue_time * 1000 / started, 3)
+                    if started
+                    else None
+                ),
+                "max_queue_ms": round(self.max_queue_time * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        """Wait for running calls and stop the pool's threads."""
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,146 @@
+"""Shared validators for resource models."""
+
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from .exceptions import ValidationError
+
+
+@lru_cache(maxsize=None)
+def validation_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """Return a model that validates the same fields as ``model``.
+
+    SQLModel table models skip validation when built through their core
+    validator, so they are mirrored as a plain Pydantic model with the same
+    fields. Other models are returned unchanged.
+
+    Args:
+        model: Pydantic or SQLModel resource model
+
+    Returns:
+        A model whose validator enforces every field of ``model``
+    """
+    if not model.model_config.get("table"):
+        return model
+    fields = {
+        name: (field.annotation, field) for name, field in model.model_fields.items()
+    }
+    return create_model(model.__name__, **fields)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached TypeAdapter that validates a list of resources.
+
+    Args:
+        model: Pydantic or SQLModel resource model
+
+    Returns:
+        TypeAdapter for ``List[model]``
+    """
+    return TypeAdapter(List[validation_model(model)])
+
+
+def validate_many(
+    model: Type[BaseModel], items: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Validate a batch of resources in a single pass.
+
+    Args:
+        model: Pydantic or SQLModel resource model
+        items: Resource data to validate
+
+    Returns:
+        Validated resource data, one dict per item
+
+    Raises:
+        ValidationError: If any item is invalid; the message gives the
+            position of each invalid item
+    """
+    try:
+        validated = list_adapter(model).validate_python(items)
+    except Exception as e:
+        raise ValidationError(f"Invalid data: {str(e)}")
+    return [instance.model_dump() for instance in validated]
+
+
+@lru_cache(maxsize=None)
+def field_adapters(model: Type[BaseModel]) -> Optional[Dict[str, TypeAdapter]]:
+    """Return a cached TypeAdapter per field of ``model``.
+
+    Each adapter enforces the field's type and constraints on its own, so a
+    changed field can be validated without the rest of the record. Models
+    whose validation involves more than one field at a time (field or model
+    validators), that keep or forbid extra fields, or whose dump differs from
+    their fields' (serializers, computed fields) can't be split this way.
+
+    Args:
+        model: Pydantic or SQLModel resource model
+
+    Returns:
+        Adapters keyed by field name, or None if the model must be validated
+        as a whole
+    """
+    target = validation_model(model)
+    decorators = target.__pydantic_decorators__
+    if (
+        decorators.field_validators
+        or decorators.model_validators
+        or decorators.field_serializers
+        or decorators.model_serializers
+        or decorators.computed_fields
+        or target.model_config.get("extra") in ("allow", "forbid")
+    ):
+        return None
+    return {
+        name: TypeAdapter(
+            Annotated[field.annotation, field], config=target.model_config
+        )
+        for name, field in target.model_fields.items()
+    }
+
+
+def validate_partial(
+    model: Type[BaseModel], existing: Dict[str, Any], changes: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Validate a partial update, re-checking only the changed fields.
+
+    The cost depends on the size of the patch rather than the width of the
+    record. Unknown fields are ignored. Models that can't be validated field
+    by field (see field_adapters) fall back to validating the merged record.
+
+    Args:
+        model: Pydantic or SQLModel resource model
+        existing: The stored resource
+        changes: Fields to change
+
+    Returns:
+        A new dict with the existing resource and the validated changes
+
+    Raises:
+        ValidationError: If a changed field is invalid
+    """
+    adapters = field_adapters(model)
+    if adapters is None:
+        # Keys the service adds (e.g. timestamps) aren't model fields; keep
+        # them aside so only the changes are checked against extra="forbid"
+        target = validation_model(model)
+        fields = {k: v for k, v in existing.items() if k in target.model_fields}
+        kept = {k: v for k, v in existing.items() if k not in target.model_fields}
+        try:
+            return {**kept, **target(**{**fields, **changes}).model_dump()}
+        except Exception as e:
+            raise ValidationError(f"Invalid data: {str(e)}")
+
+    resource_data = existing.copy()
+    for name, value in changes.items():
+        adapter = adapters.get(name)
+        if adapter is None:
+            continue
+        try:
+            resource_data[name] = adapter.dump_python(adapter.validate_python(value))
+        except Exception as e:
+            raise ValidationError(f"Invalid data: {name}: {str(e)}")
+    return resource_data
@@ -1,6 +1,6 @@
 """Data models for liveapi project metadata."""
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 
@@ -38,4 +38,9 @@ class ProjectConfig:
     git_repository: Optional[str] = None
     api_base_url: Optional[str] = None
     auto_sync: bool = True
-    backend_type: str = "default"  # "default" for in-memory, "sqlmodel" for SQL
+    backend_type: str = "default"  # "default", "sqlmodel" or "sqlmodel_async"
+    storage_engine: str = "dict"  # "dict" or "columnar" for the in-memory backend
+    data_dir: Optional[str] = None  # Persist the in-memory backend to this directory
+    shared_storage: bool = False  # Share in-memory data between worker processes
+    fast_serialization: bool = False  # Send service output without re-validation
+    database: Optional[Dict[str, Any]] = None  # Pool/engine settings (SQL backends)
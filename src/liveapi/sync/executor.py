@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Dict, Any
 from jinja2 import Environment, FileSystemLoader
 
+from ..implementation.pydantic_generator import SQL_BACKENDS
 from .models import SyncPlan
 from .plan import preview_sync_plan
 
@@ -91,7 +92,7 @@ def _generate_implementation_file(
         env = Environment(loader=FileSystemLoader(template_dir))
 
         # Choose template based on backend type
-        if backend_type == "sqlmodel":
+        if backend_type in SQL_BACKENDS:
             template = env.get_template("sql_model_service.py.j2")
         else:
             template = env.get_template("implementation.py.j2")
@@ -116,6 +117,7 @@ def _generate_implementation_file(
             resource_name=resource_name,
             class_name=class_name,
             model_name=model_name,
+            async_session=backend_type == "sqlmodel_async",
         )
 
         # Write the implementation file
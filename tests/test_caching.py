@@ -0,0 +1,178 @@
+"""Tests for the read-through resource caches."""
+
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine
+
+from src.liveapi.implementation.caching import LRUCache, SharedCache
+from src.liveapi.implementation.database import DatabaseConfig, DatabaseManager
+from src.liveapi.implementation.exceptions import NotFoundError
+from src.liveapi.implementation.sql_model_resource_service import (
+    SQLModelResourceService,
+)
+
+
+class CachedArtwork(SQLModel, table=True):
+    """Table model for the read-through tests."""
+
+    __tablename__ = "test_cached_artworks"
+    id: str = Field(primary_key=True)
+    title: str
+
+
+class TestLRUCache:
+    """Test LRUCache eviction, expiry and invalidation."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LRUCache(max_entries=2)
+        cache.set("a", {"id": "a"})
+        cache.set("b", {"id": "b"})
+        assert cache.get("a") == {"id": "a"}
+        cache.set("c", {"id": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+        assert cache.get("c") == {"id": "c"}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 1, 1)
+        assert stats["entries"] == 2
+        assert stats["hit_ratio"] == 0.75
+
+    def test_ttl(self):
+        """Test that expired entries are misses."""
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", {"id": "a"})
+        assert cache.get("a") == {"id": "a"}
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidation_discards_racing_reads(self):
+        """Test that a value read before an invalidation isn't stored."""
+        cache = LRUCache()
+        version = cache.version()
+        cache.invalidate(["a"])
+        cache.set("a", {"id": "a", "title": "old"}, version)
+        assert cache.get("a") is None
+
+        cache.set("a", {"id": "a", "title": "new"}, cache.version())
+        assert cache.get("a") == {"id": "a", "title": "new"}
+
+    def test_returns_copies(self):
+        """Test that changing a returned resource doesn't change the cache."""
+        cache = LRUCache()
+        cache.set("a", {"id": "a"})
+        cache.get("a")["id"] = "changed"
+        assert cache.get("a") == {"id": "a"}
+
+
+class TestSharedCache:
+    """Test SharedCache across processes sharing one file."""
+
+    def test_shared_between_instances(self):
+        """Test that entries and invalidations are seen by every worker."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.db"
+            worker_a = SharedCache(path, "artworks")
+            worker_b = SharedCache(path, "artworks")
+            other_type = SharedCache(path, "users")
+
+            worker_a.set("1", {"id": "1", "tags": ["oil"]})
+            assert worker_b.get("1") == {"id": "1", "tags": ["oil"]}
+            assert other_type.get("1") is None
+
+            worker_b.invalidate(["1"])
+            assert worker_a.get("1") is None
+            assert worker_a.stats()["hits"] == 0
+            assert worker_b.stats()["hits"] == 1
+
+            for cache in (worker_a, worker_b, other_type):
+                cache.close()
+
+    def test_size_limit(self):
+        """Test that the oldest entries are evicted beyond the size limit."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SharedCache(Path(temp_dir) / "cache.db", "artworks", 50)
+            for i in range(SharedCache.TRIM_INTERVAL):
+                cache.set(f"{i:03d}", {"id": i})
+            assert len(cache) == 50
+            assert cache.stats()["evictions"] == 50
+            assert cache.get("000") is None
+            assert cache.get("099") == {"id": 99}
+            cache.close()
+
+
+class TestReadThroughService:
+    """Test SQLModelResourceService reads through a cache."""
+
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        """Set up a service with a cache over an in-memory database."""
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine, tables=[CachedArtwork.__table__])
+        self.session = Session(engine)
+        self.cache = LRUCache()
+        self.service = SQLModelResourceService(
+            CachedArtwork, "artworks", self.session, cache=self.cache
+        )
+        yield
+        self.session.close()
+        engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_reads_are_cached(self):
+        """Test that repeated reads are served from the cache."""
+        await self.service.create({"id": "a", "title": "Sunflowers"})
+        assert await self.service.read("a") == {"id": "a", "title": "Sunflowers"}
+        assert await self.service.read("a") == {"id": "a", "title": "Sunflowers"}
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+        with pytest.raises(NotFoundError):
+            await self.service.read("missing")
+        assert len(self.cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate(self):
+        """Test that updates and deletes through the service invalidate."""
+        await self.service.bulk_create(
+            [{"id": "a", "title": "Irises"}, {"id": "b", "title": "Starry Night"}]
+        )
+        await self.service.read("a")
+        await self.service.read("b")
+
+        await self.service.update("a", {"title": "Almond Blossoms"}, partial=True)
+        assert (await self.service.read("a"))["title"] == "Almond Blossoms"
+
+        await self.service.bulk_update([{"id": "b", "title": "The Bedroom"}])
+        assert (await self.service.read("b"))["title"] == "The Bedroom"
+
+        await self.service.delete("a")
+        with pytest.raises(NotFoundError):
+            await self.service.read("a")
+        await self.service.bulk_delete(["b"])
+        with pytest.raises(NotFoundError):
+            await self.service.read("b")
+        assert self.cache.hits == 0
+
+    def test_manager_builds_caches_from_config(self):
+        """Test that read caching is configured per resource type."""
+        assert DatabaseManager("sqlite://").get_read_cache("artworks") is None
+
+        config = DatabaseConfig(read_cache_size=100, read_cache_ttl=30)
+        db_manager = DatabaseManager("sqlite://", config=config)
+        cache = db_manager.get_read_cache("artworks")
+        assert isinstance(cache, LRUCache)
+        assert db_manager.get_read_cache("artworks") is cache
+        assert db_manager.get_read_cache("users") is not cache
+        assert set(db_manager.cache_stats()) == {"artworks", "users"}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config.read_cache_path = str(Path(temp_dir) / "cache.db")
+            shared = DatabaseManager("sqlite://", config=config)
+            assert isinstance(shared.get_read_cache("artworks"), SharedCache)
+            shared.close()
+            assert shared.cache_stats() == {}
@@ -1,5 +1,6 @@
 """Tests for database integration features."""
 
+import asyncio
 import pytest
 import tempfile
 import json
@@ -58,6 +59,100 @@ class TestDatabaseManager:
         assert db_manager._initialized is False
 
 
+class TestDatabaseConfig:
+    """Test pool and engine configuration for the SQL backends."""
+
+    def test_load_from_project_config_and_environment(self):
+        """Test that environment variables override the project config."""
+        from src.liveapi.implementation.database import DatabaseConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / ".liveapi").mkdir()
+            config_file = temp_path / ".liveapi" / "config.json"
+            config_file.write_text(
+                json.dumps(
+                    {
+                        "backend_type": "sqlmodel",
+                        "database": {"pool_size": 3, "sqlite_journal_mode": "WAL"},
+                    }
+                )
+            )
+
+            with patch.dict(
+                "os.environ",
+                {"DATABASE_POOL_SIZE": "7", "DATABASE_POOL_PRE_PING": "true"},
+            ):
+                config = DatabaseConfig.load(temp_path)
+            assert config.pool_size == 7
+            assert config.pool_pre_ping is True
+            assert config.sqlite_journal_mode == "WAL"
+            assert config.max_overflow == 10
+
+            config_file.write_text(json.dumps({"database": {"pool_sise": 3}}))
+            with pytest.raises(ValueError, match="pool_sise"):
+                DatabaseConfig.load(temp_path)
+
+    def test_pool_settings_and_status(self):
+        """Test that pool settings reach the engine and are reported."""
+        from src.liveapi.implementation.database import DatabaseConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = DatabaseConfig(pool_size=2, max_overflow=1, pool_timeout=5)
+            db_manager = DatabaseManager(
+                f"sqlite:///{Path(temp_dir) / 'pool.db'}", config=config
+            )
+            engine = db_manager.get_engine()
+            assert engine.pool.size() == 2
+            assert engine.pool.timeout() == 5
+
+            with engine.connect(), engine.connect():
+                status = db_manager.pool_status()["sync"]
+                assert status["checked_out"] == 2
+            status = db_manager.pool_status()["sync"]
+            assert status["checkouts"] == 2
+            assert status["peak_checked_out"] == 2
+            assert status["checked_out"] == 0
+            assert status["size"] == 2
+            db_manager.close()
+            assert db_manager.pool_status() == {}
+
+        # In-memory SQLite has no queue pool to size
+        memory = DatabaseManager("sqlite://", config=config)
+        memory.get_engine()
+        assert "size" not in memory.pool_status()["sync"]
+        memory.close()
+
+    def test_sqlite_pragmas(self):
+        """Test that SQLite pragmas are applied to every connection."""
+        from sqlalchemy import text
+        from src.liveapi.implementation.database import DatabaseConfig
+
+        config = DatabaseConfig(
+            sqlite_journal_mode="WAL",
+            sqlite_synchronous="NORMAL",
+            sqlite_mmap_size=1 << 20,
+            sqlite_cache_size=-4000,
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_manager = DatabaseManager(
+                f"sqlite:///{Path(temp_dir) / 'pragmas.db'}", config=config
+            )
+            with db_manager.get_engine().connect() as connection:
+
+                def pragma(name):
+                    return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+                assert pragma("journal_mode") == "wal"
+                assert pragma("synchronous") == 1  # NORMAL
+                assert pragma("mmap_size") == 1 << 20
+                assert pragma("cache_size") == -4000
+            db_manager.close()
+
+        with pytest.raises(ValueError):
+            DatabaseConfig(sqlite_journal_mode="WAL; DROP TABLE x").sqlite_pragmas()
+
+
 class TestPydanticGeneratorWithBackends:
     """Test PydanticGenerator with different backends."""
 
@@ -173,17 +268,16 @@ class TestLiveAPIRouterBackendSelection:
                     SQLModelForDependencyTest, "test"
                 )
 
-                # Mock the session dependency
-                mock_session = MagicMock(spec=Session)
-
-                # We need to inject the dependency manually for testing
-                service = service_dependency(session=mock_session)
+                # Inject the request's unit of work manually for testing
+                unit = DatabaseManager("sqlite://").get_session_scopes().acquire()
+                service = asyncio.run(service_dependency(unit=unit))
 
                 from src.liveapi.implementation.sql_model_resource_service import (
                     SQLModelResourceService,
                 )
 
                 assert isinstance(service, SQLModelResourceService)
+                assert service.session is unit.session
 
 
 class TestInteractiveGeneratorWithBackends:
@@ -293,6 +387,833 @@ class TestSQLModelIntegration:
         # This would require actual SQLModel setup and would be more complex
         pass
 
+    @pytest.mark.asyncio
+    async def test_sqlmodel_cursor_pagination(self):
+        """Test keyset pagination ordered by primary key."""
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+        from src.liveapi.implementation.exceptions import ValidationError
+        from src.liveapi.implementation.pagination import encode_cursor
+        from sqlmodel import SQLModel, Field, create_engine
+
+        class SQLModelForCursorTest(SQLModel, table=True):
+            __tablename__ = "test_model_cursor"
+            id: str = Field(primary_key=True)
+            name: str
+
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine, tables=[SQLModelForCursorTest.__table__])
+
+        with Session(engine) as session:
+            service = SQLModelResourceService(
+                SQLModelForCursorTest, "test", session=session
+            )
+            for i in range(5):
+                await service.create({"id": f"id-{i}", "name": f"name {i % 2}"})
+
+            page, cursor = await service.list_page(limit=2)
+            assert [r["id"] for r in page] == ["id-0", "id-1"]
+            page, cursor = await service.list_page(limit=2, cursor=cursor)
+            assert [r["id"] for r in page] == ["id-2", "id-3"]
+            page, cursor = await service.list_page(limit=2, cursor=cursor)
+            assert [r["id"] for r in page] == ["id-4"]
+            assert cursor is None
+
+            page, cursor = await service.list_page(limit=1, name="name 1")
+            page, cursor = await service.list_page(
+                limit=1, cursor=cursor, name="name 1"
+            )
+            assert [r["id"] for r in page] == ["id-3"]
+
+            # Cursors that decode but don't hold a key are bad requests
+            for key in ({"a": 1}, [1], 1, True):
+                with pytest.raises(ValidationError):
+                    await service.list_page(cursor=encode_cursor(key))
+            for limit in (0, -1):
+                with pytest.raises(ValidationError, match="limit"):
+                    await service.list_page(limit=limit, cursor=encode_cursor("id-0"))
+
+    @pytest.mark.asyncio
+    async def test_sqlmodel_create_single_statement(self):
+        """Test that create issues one INSERT and maps duplicates to conflicts."""
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+        from src.liveapi.implementation.exceptions import (
+            ConflictError,
+            ValidationError,
+        )
+        from sqlmodel import SQLModel, Field, create_engine
+        from sqlalchemy import event
+        from sqlalchemy.exc import DataError
+        from sqlalchemy.pool import StaticPool
+
+        class SQLModelForCreateTest(SQLModel, table=True):
+            __tablename__ = "test_model_create"
+            id: str = Field(primary_key=True)
+            name: str
+
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine, tables=[SQLModelForCreateTest.__table__])
+
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        with Session(engine) as session:
+            service = SQLModelResourceService(
+                SQLModelForCreateTest, "test", session=session
+            )
+            created = await service.create({"id": "a", "name": "first"})
+            assert created == {"id": "a", "name": "first"}
+            assert len(statements) == 1
+            assert statements[0].startswith("INSERT")
+
+            with pytest.raises(ConflictError, match="already exists"):
+                await service.create({"id": "a", "name": "again"})
+
+            # The session is still usable after the failed insert
+            assert (await service.create({"name": "second"}))["name"] == "second"
+            assert (await service.read("a"))["name"] == "first"
+
+            # Other database errors are reported as invalid data
+            with patch.object(
+                service,
+                "_insert_row",
+                side_effect=DataError("INSERT", {}, Exception("value too long")),
+            ):
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.create({"id": "b", "name": "x" * 300})
+            assert (await service.create({"id": "b", "name": "third"}))["id"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_sqlmodel_bulk_operations(self):
+        """Test batch create/update/delete in single transactions."""
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+        from src.liveapi.implementation.exceptions import (
+            ConflictError,
+            NotFoundError,
+            ValidationError,
+        )
+        from sqlmodel import SQLModel, Field, create_engine
+        from sqlalchemy.exc import DataError
+
+        class SQLModelForBulkTest(SQLModel, table=True):
+            __tablename__ = "test_model_bulk"
+            id: str = Field(primary_key=True)
+            name: str
+            count: int = 0
+
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine, tables=[SQLModelForBulkTest.__table__])
+
+        with Session(engine) as session:
+            service = SQLModelResourceService(
+                SQLModelForBulkTest, "test", session=session
+            )
+            created = await service.bulk_create(
+                [
+                    {"id": f"id-{i}", "name": f"name {i}", "count": str(i)}
+                    for i in range(3)
+                ]
+            )
+            assert [r["count"] for r in created] == [0, 1, 2]
+
+            with pytest.raises(ValidationError):
+                await service.bulk_create([{"id": "id-9", "name": "n", "count": "x"}])
+            with pytest.raises(ConflictError, match="id-1"):
+                await service.bulk_create(
+                    [{"id": "id-8", "name": "n"}, {"id": "id-1", "name": "n"}]
+                )
+            with patch.object(
+                session,
+                "commit",
+                side_effect=DataError("INSERT", {}, Exception("value too long")),
+            ):
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.bulk_create([{"id": "id-8", "name": "n"}])
+            assert len(await service.list()) == 3
+
+            updated = await service.bulk_update(
+                [{"id": "id-0", "count": 10}, {"id": "id-2", "name": "renamed"}]
+            )
+            assert updated[0]["count"] == 10 and updated[1]["name"] == "renamed"
+            with pytest.raises(NotFoundError):
+                await service.bulk_update([{"id": "nope", "count": 1}])
+            with pytest.raises(NotFoundError, match="7 not found"):
+                await service.bulk_update([{"id": 7, "count": 1}])
+
+            await service.bulk_delete(["id-0", "id-1"])
+            assert [r["id"] for r in await service.list()] == ["id-2"]
+            with pytest.raises(NotFoundError):
+                await service.bulk_delete(["id-2", "gone"])
+            with pytest.raises(NotFoundError, match="IDs 7, 8 not found"):
+                await service.bulk_delete([7, 8])
+
+    @pytest.mark.asyncio
+    async def test_sqlmodel_stream(self):
+        """Test streaming rows after the request's session has closed."""
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+        from sqlmodel import SQLModel, Field, create_engine
+        from sqlalchemy.pool import StaticPool
+
+        class SQLModelForStreamTest(SQLModel, table=True):
+            __tablename__ = "test_model_stream"
+            id: str = Field(primary_key=True)
+            name: str
+
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine, tables=[SQLModelForStreamTest.__table__])
+
+        with Session(engine) as session:
+            service = SQLModelResourceService(
+                SQLModelForStreamTest, "test", session=session
+            )
+            await service.bulk_create(
+                [{"id": f"id-{i:02}", "name": f"name {i % 2}"} for i in range(25)]
+            )
+            stream = service.stream(batch_size=10, name="name 1")
+
+        ids = [resource["id"] async for resource in stream]
+        assert ids == [f"id-{i:02}" for i in range(1, 25, 2)]
+
+    @pytest.mark.asyncio
+    async def test_sqlmodel_reads_skip_orm_hydration(self):
+        """Test that reads return rows as dicts without loading model instances."""
+        from datetime import datetime
+        from typing import Optional
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+        from sqlmodel import SQLModel, Field, create_engine, select
+
+        class SQLModelForReadTest(SQLModel, table=True):
+            __tablename__ = "test_model_read"
+            id: str = Field(primary_key=True)
+            name: str
+            score: Optional[float] = None
+            created_at: Optional[datetime] = None
+
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine, tables=[SQLModelForReadTest.__table__])
+
+        with Session(engine) as session:
+            service = SQLModelResourceService(
+                SQLModelForReadTest, "test", session=session
+            )
+            await service.bulk_create(
+                [
+                    {"id": f"id-{i}", "name": f"name {i}", "score": i / 2}
+                    for i in range(3)
+                ]
+            )
+            await service.create({"id": "id-3", "name": "no score"})
+            session.expunge_all()
+
+            listed = await service.list()
+            page, _ = await service.list_page(limit=10)
+            read = await service.read("id-3")
+            assert len(session.identity_map) == 0
+
+            expected = [
+                resource.model_dump(mode="json")
+                for resource in session.exec(select(SQLModelForReadTest))
+            ]
+            assert listed == page == expected
+            assert read == expected[-1]
+            assert isinstance(read["created_at"], str) and read["score"] is None
+
+    @pytest.mark.asyncio
+    async def test_sqlmodel_upsert(self):
+        """Test that upserts write each batch with INSERT ... ON CONFLICT."""
+        from datetime import datetime
+        from typing import Optional
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+        from src.liveapi.implementation.exceptions import (
+            ConflictError,
+            ValidationError,
+        )
+        from sqlmodel import SQLModel, Field, create_engine
+        from sqlalchemy import event
+        from sqlalchemy.exc import DataError
+        from sqlalchemy.pool import StaticPool
+
+        class SQLModelForUpsertTest(SQLModel, table=True):
+            __tablename__ = "test_model_upsert"
+            id: str = Field(primary_key=True)
+            name: str
+            email: Optional[str] = Field(default=None, unique=True)
+            created_at: Optional[datetime] = None
+            updated_at: Optional[datetime] = None
+
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        SQLModel.metadata.create_all(engine, tables=[SQLModelForUpsertTest.__table__])
+
+        statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        with Session(engine) as session:
+            service = SQLModelResourceService(
+                SQLModelForUpsertTest, "test", session=session
+            )
+            created = await service.upsert("a", {"name": "first"})
+            replaced = await service.upsert("a", {"name": "second"})
+            assert len(statements) == 2
+            assert all("ON CONFLICT" in statement for statement in statements)
+            assert replaced["name"] == "second"
+            assert replaced["created_at"] == created["created_at"]
+            assert replaced["updated_at"] > created["updated_at"]
+
+            statements.clear()
+            written = await service.bulk_upsert(
+                [{"id": f"b{i}", "name": f"name {i}"} for i in range(50)]
+                + [{"id": "a", "name": "third"}]
+            )
+            assert len(statements) == 1
+            assert [r["id"] for r in written][-2:] == ["b49", "a"]
+            assert written[-1]["created_at"] == created["created_at"]
+            assert len(await service.list()) == 51
+
+            with pytest.raises(ConflictError, match="repeated"):
+                await service.bulk_upsert([{"id": "c", "name": "c"}] * 2)
+            with pytest.raises(ValidationError, match="needs an id"):
+                await service.bulk_upsert([{"name": "no id"}])
+
+            await service.upsert("b0", {"name": "n", "email": "taken@example.com"})
+            with pytest.raises(ConflictError):
+                await service.upsert("b1", {"name": "n", "email": "taken@example.com"})
+            with pytest.raises(ConflictError):
+                await service.bulk_upsert(
+                    [
+                        {"id": "c", "name": "c"},
+                        {"id": "b2", "name": "n", "email": "taken@example.com"},
+                    ]
+                )
+            assert len(await service.list()) == 51
+
+            # Other database errors are reported as invalid data
+            with patch.object(
+                session,
+                "commit",
+                side_effect=DataError("INSERT", {}, Exception("value too long")),
+            ):
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.upsert("e", {"name": "e"})
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.bulk_upsert([{"id": "e", "name": "e"}])
+            assert len(await service.list()) == 51
+
+            # Databases without ON CONFLICT insert and update separately
+            service._upsert_statement = lambda dialect: (None, False)
+            written = await service.bulk_upsert(
+                [{"id": "d", "name": "merged"}, {"id": "a", "name": "fourth"}]
+            )
+            assert [r["name"] for r in written] == ["merged", "fourth"]
+            assert written[1]["created_at"] == created["created_at"]
+
+
+class TestSQLIndexes:
+    """Tests for SQL indexes generated from x-liveapi-index / x-liveapi-unique."""
+
+    schema = {
+        "type": "object",
+        "x-liveapi-index": [["owner", "status"]],
+        "x-liveapi-unique": [["owner", "slug"]],
+        "properties": {
+            "id": {"type": "string"},
+            "owner": {"type": "string", "x-liveapi-index": True},
+            "status": {"type": "string"},
+            "slug": {"type": "string"},
+            "email": {"type": "string", "x-liveapi-unique": True},
+            "rank": {"type": "integer", "x-liveapi-index": "sorted"},
+            "body": {"type": "string", "x-liveapi-index": "trigram"},
+        },
+        "required": ["owner"],
+    }
+
+    @pytest.mark.asyncio
+    async def test_indexes_are_created_and_used(self):
+        """Test that generated indexes exist and serve pushed-down filters."""
+        from sqlalchemy import inspect
+        from sqlmodel import select
+        from src.liveapi.implementation.exceptions import ConflictError
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+
+        model = PydanticGenerator("sqlmodel").generate_model_from_schema(
+            self.schema, "IndexedNote"
+        )
+        indexes = {index.name: index for index in model.__table__.indexes}
+        assert sorted(indexes) == [
+            "indexednote_ix_owner",
+            "indexednote_ix_owner_status",
+            "indexednote_ix_rank",
+            "indexednote_ux_email",
+            "indexednote_ux_owner_slug",
+        ]
+        assert indexes["indexednote_ux_owner_slug"].unique
+        assert "unique=True" in model.model_source
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_manager = DatabaseManager(f"sqlite:///{Path(temp_dir) / 'notes.db'}")
+            db_manager.create_db_and_tables()
+            engine = db_manager.get_engine()
+
+            # Indexes missing from an existing table are added on startup
+            with engine.begin() as connection:
+                connection.exec_driver_sql("DROP INDEX indexednote_ix_rank")
+            db_manager._initialized = False
+            db_manager.create_db_and_tables()
+            created = {ix["name"] for ix in inspect(engine).get_indexes("indexednote")}
+            assert set(indexes) <= created
+
+            with Session(engine) as session:
+                service = SQLModelResourceService(model, "notes", session)
+
+                def query_plan(**filters):
+                    query = service._apply_filters(select(model), filters)
+                    sql = query.compile(engine, compile_kwargs={"literal_binds": True})
+                    rows = session.connection().exec_driver_sql(
+                        f"EXPLAIN QUERY PLAN {sql}"
+                    )
+                    return " ".join(row[-1] for row in rows)
+
+                assert "indexednote_ix_owner_status" in query_plan(
+                    owner="ann", status="open"
+                )
+                assert "indexednote_ix_rank" in query_plan(rank__gte=3)
+                assert "USING INDEX" in query_plan(owner="ann")
+                assert "INDEX" not in query_plan(body__contains="x")
+
+                await service.create({"id": "a", "owner": "ann", "slug": "s"})
+                await service.create({"id": "b", "owner": "bob", "slug": "s"})
+                with pytest.raises(ConflictError):
+                    await service.create({"id": "c", "owner": "ann", "slug": "s"})
+                with pytest.raises(ConflictError):
+                    await service.update("b", {"owner": "ann"}, partial=True)
+            db_manager.close()
+
+    def test_unknown_index_field(self):
+        """Test that indexes on fields the schema doesn't have are rejected."""
+        schema = {
+            "type": "object",
+            "x-liveapi-index": ["missing"],
+            "properties": {"id": {"type": "string"}},
+        }
+        with pytest.raises(ValueError, match="unknown fields: missing"):
+            PydanticGenerator("sqlmodel").generate_model_from_schema(
+                schema, "BadIndexNote"
+            )
+
+
+class TestQueryOffloading:
+    """Tests for running the sync SQL backend's queries on a thread pool."""
+
+    @pytest.mark.asyncio
+    async def test_queries_run_on_executor_threads(self):
+        """Test that service queries run off the event loop thread."""
+        import threading
+        from sqlalchemy import event
+        from sqlmodel import SQLModel, Field
+        from src.liveapi.implementation.database import DatabaseConfig
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+
+        class SQLModelForOffloadTest(SQLModel, table=True):
+            __tablename__ = "test_model_offload"
+            id: str = Field(primary_key=True)
+            name: str
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_manager = DatabaseManager(
+                f"sqlite:///{Path(temp_dir) / 'offload.db'}",
+                config=DatabaseConfig(executor_threads=2),
+            )
+            engine = db_manager.get_engine()
+            SQLModel.metadata.create_all(
+                engine, tables=[SQLModelForOffloadTest.__table__]
+            )
+            threads = set()
+            event.listen(
+                engine,
+                "before_cursor_execute",
+                lambda *args: threads.add(threading.current_thread().name),
+            )
+
+            executor = db_manager.get_executor()
+            with Session(engine) as session:
+                service = SQLModelResourceService(
+                    SQLModelForOffloadTest, "test", session, executor=executor
+                )
+                await service.bulk_create(
+                    [{"id": f"id-{i}", "name": f"name {i}"} for i in range(5)]
+                )
+                await service.create({"id": "id-5", "name": "name 5"})
+                await service.update("id-5", {"name": "renamed"}, partial=True)
+                assert (await service.read("id-5"))["name"] == "renamed"
+                assert len(await service.list(limit=10)) == 6
+                page, cursor = await service.list_page(limit=4)
+                assert len(page) == 4 and cursor
+                assert len([r async for r in service.stream(batch_size=4)]) == 6
+                await service.delete("id-5")
+
+            assert threads and all(name.startswith("liveapi-db") for name in threads)
+            assert executor.stats()["completed"] >= 9
+            db_manager.close()
+
+        # In-memory SQLite has a database per thread, so it stays on the loop
+        assert DatabaseManager("sqlite://").get_executor() is None
+
+
+class TestWriteCoalescing:
+    """Tests for committing concurrent SQL writes in shared transactions."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_a_commit(self):
+        """Test that a batch commits once and each caller gets its own result."""
+        import asyncio
+        from sqlalchemy import event
+        from sqlmodel import SQLModel, Field, create_engine
+        from src.liveapi.implementation.coalescing import WriteCoalescer
+        from src.liveapi.implementation.exceptions import (
+            ConflictError,
+            NotFoundError,
+        )
+        from src.liveapi.implementation.sql_model_resource_service import (
+            SQLModelResourceService,
+        )
+
+        class SQLModelForCoalescingTest(SQLModel, table=True):
+            __tablename__ = "test_model_coalescing"
+            id: str = Field(primary_key=True)
+            name: str
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            engine = create_engine(f"sqlite:///{Path(temp_dir) / 'batch.db'}")
+            SQLModel.metadata.create_all(
+                engine, tables=[SQLModelForCoalescingTest.__table__]
+            )
+            commits = []
+            event.listen(engine, "commit", lambda connection: commits.append(1))
+            coalescer = WriteCoalescer(engine, window=0.01)
+
+            def service(session):
+                return SQLModelResourceService(
+                    SQLModelForCoalescingTest,
+                    "test",
+                    session=session,
+                    coalescer=coalescer,
+                )
+
+            with Session(engine) as session:
+                await service(session).create({"id": "a", "name": "first"})
+                commits.clear()
+
+                # One session per request, as the router hands out
+                sessions = [Session(engine) for _ in range(5)]
+                results = await asyncio.gather(
+                    service(sessions[0]).create({"id": "b", "name": "second"}),
+                    service(sessions[1]).create({"id": "a", "name": "again"}),
+                    service(sessions[2]).update("a", {"name": "renamed"}, True),
+                    service(sessions[3]).delete("missing"),
+                    service(sessions[4]).create({"id": "c", "name": "third"}),
+                    return_exceptions=True,
+                )
+                for request_session in sessions:
+                    request_session.close()
+
+                assert results[0] == {"id": "b", "name": "second"}
+                assert isinstance(results[1], ConflictError)
+                assert results[2] == {"id": "a", "name": "renamed"}
+                assert isinstance(results[3], NotFoundError)
+                assert results[4] == {"id": "c", "name": "third"}
+                assert len(commits) == 1
+                assert coalescer.batches == 2
+                assert coalescer.operations == 6
+
+                rows = await service(session).list()
+                assert sorted((r["id"], r["name"]) for r in rows) == [
+                    ("a", "renamed"),
+                    ("b", "second"),
+                    ("c", "third"),
+                ]
+            engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_coalescer_fails_waiters_if_a_flush_breaks(self):
+        """Test that callers get an error rather than hang forever."""
+        import asyncio
+        from sqlmodel import create_engine
+        from src.liveapi.implementation.coalescing import WriteCoalescer
+
+        engine = create_engine("sqlite://")
+        coalescer = WriteCoalescer(engine, window=0.01)
+        with patch.object(
+            coalescer,
+            "_run_batch",
+            side_effect=RuntimeError("cannot schedule new futures after shutdown"),
+        ):
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(coalescer.submit(lambda session: None) for _ in range(3)),
+                    return_exceptions=True,
+                ),
+                timeout=5,
+            )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        waiters = [
+            asyncio.ensure_future(coalescer.submit(lambda session: None))
+            for _ in range(2)
+        ]
+        # Cancel the flush while it waits for the batch to fill
+        await asyncio.sleep(0.001)
+        coalescer._flush_task.cancel()
+        await asyncio.wait(waiters, timeout=5)
+        assert all(waiter.cancelled() for waiter in waiters)
+        assert coalescer._flush_task is None and coalescer._pending == []
+        engine.dispose()
+
+    def test_coalescer_is_configurable(self):
+        """Test that the manager only coalesces writes when enabled."""
+        from src.liveapi.implementation.database import DatabaseConfig
+
+        assert DatabaseManager("sqlite://").get_write_coalescer() is None
+
+        config = DatabaseConfig(
+            write_coalescing=True, write_batch_window=0.01, write_batch_size=20
+        )
+        db_manager = DatabaseManager("sqlite://", config=config)
+        coalescer = db_manager.get_write_coalescer()
+        assert coalescer is db_manager.get_write_coalescer()
+        assert coalescer.window == 0.01
+        assert coalescer.max_batch == 20
+        db_manager.close()
+
+
+class TestAsyncSQLModelBackend:
+    """Tests for the sqlmodel_async backend."""
+
+    def test_async_database_url(self):
+        """Test that database URLs get their async driver."""
+        assert (
+            DatabaseManager("sqlite:///./app.db").get_async_database_url()
+            == "sqlite+aiosqlite:///./app.db"
+        )
+        assert (
+            DatabaseManager("postgresql://user:pass@db/app").get_async_database_url()
+            == "postgresql+asyncpg://user:pass@db/app"
+        )
+        assert (
+            DatabaseManager("postgresql+psycopg://db/app").get_async_database_url()
+            == "postgresql+psycopg://db/app"
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_service_operations(self):
+        """Test the async service against an aiosqlite engine."""
+        pytest.importorskip("aiosqlite")
+        from src.liveapi.implementation.async_sql_model_resource_service import (
+            AsyncSQLModelResourceService,
+        )
+        from src.liveapi.implementation.exceptions import (
+            ConflictError,
+            NotFoundError,
+            ValidationError,
+        )
+        from src.liveapi.implementation.pagination import encode_cursor
+        from sqlalchemy.exc import DataError
+        from sqlmodel import SQLModel, Field
+        from sqlmodel.ext.asyncio.session import AsyncSession
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        class SQLModelForAsyncTest(SQLModel, table=True):
+            __tablename__ = "test_model_async"
+            id: str = Field(primary_key=True)
+            name: str
+
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                SQLModel.metadata.create_all, tables=[SQLModelForAsyncTest.__table__]
+            )
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            service = AsyncSQLModelResourceService(
+                SQLModelForAsyncTest, "test", session=session
+            )
+            assert await service.create({"id": "a", "name": "first"}) == {
+                "id": "a",
+                "name": "first",
+            }
+            with pytest.raises(ConflictError):
+                await service.create({"id": "a", "name": "again"})
+            with patch.object(
+                session,
+                "exec",
+                side_effect=DataError("INSERT", {}, Exception("value too long")),
+            ):
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.create({"id": "z", "name": "x"})
+
+            with patch.object(
+                session,
+                "commit",
+                side_effect=DataError("INSERT", {}, Exception("value too long")),
+            ):
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.bulk_create([{"id": "b0", "name": "x"}])
+
+            await service.bulk_create(
+                [{"id": f"b{i}", "name": f"name {i}"} for i in range(5)]
+            )
+            updated = await service.update("a", {"name": "renamed"}, partial=True)
+            assert updated["name"] == "renamed"
+            await service.bulk_update([{"id": "b1", "name": "changed"}])
+            assert (await service.read("b1"))["name"] == "changed"
+            with pytest.raises(NotFoundError, match="7 not found"):
+                await service.bulk_update([{"id": 7, "name": "x"}])
+
+            page, next_cursor = await service.list_page(limit=4)
+            assert [r["id"] for r in page] == ["a", "b0", "b1", "b2"]
+            page, next_cursor = await service.list_page(limit=4, cursor=next_cursor)
+            assert [r["id"] for r in page] == ["b3", "b4"]
+            assert next_cursor is None
+            with pytest.raises(ValidationError):
+                await service.list_page(cursor=encode_cursor({"a": 1}))
+            with pytest.raises(ValidationError, match="limit"):
+                await service.list_page(limit=0, cursor=encode_cursor("a"))
+            assert len(await service.list(name="changed")) == 1
+
+            await service.delete("a")
+            await service.bulk_delete(["b0", "b2"])
+            with pytest.raises(NotFoundError, match="IDs 7, 8 not found"):
+                await service.bulk_delete([7, 8])
+            with pytest.raises(NotFoundError):
+                await service.read("a")
+            streamed = [r["id"] async for r in service.stream(batch_size=2)]
+            assert streamed == ["b1", "b3", "b4"]
+
+            assert (await service.upsert("b1", {"name": "upserted"}))["name"] == (
+                "upserted"
+            )
+            with patch.object(
+                session,
+                "commit",
+                side_effect=DataError("INSERT", {}, Exception("value too long")),
+            ):
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.upsert("d", {"name": "d"})
+                with pytest.raises(ValidationError, match="value too long"):
+                    await service.bulk_upsert([{"id": "d", "name": "d"}])
+            written = await service.bulk_upsert(
+                [{"id": "c", "name": "new"}, {"id": "b3", "name": "replaced"}]
+            )
+            assert [r["id"] for r in written] == ["c", "b3"]
+            assert len(await service.list()) == 4
+
+        await engine.dispose()
+
+    def test_async_backend_app(self):
+        """Test the generated endpoints with backend_type sqlmodel_async."""
+        pytest.importorskip("aiosqlite")
+        import os
+        import yaml
+        from fastapi.testclient import TestClient
+        from src.liveapi.implementation.app import create_app
+        import src.liveapi.implementation.database as db_module
+
+        gadget_schema = {
+            "type": "object",
+            "properties": {"id": {"type": "string"}, "name": {"type": "string"}},
+            "required": ["name"],
+        }
+        json_gadget = {
+            "application/json": {"schema": {"$ref": "#/components/schemas/Gadget"}}
+        }
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Gadgets API", "version": "1.0.0"},
+            "components": {"schemas": {"Gadget": gadget_schema}},
+            "paths": {
+                "/gadgets": {
+                    "get": {
+                        "operationId": "list_gadgets",
+                        "responses": {"200": {"description": "Gadgets"}},
+                    },
+                    "post": {
+                        "operationId": "create_gadget",
+                        "requestBody": {"required": True, "content": json_gadget},
+                        "responses": {"201": {"description": "Created"}},
+                    },
+                },
+                "/gadgets/{id}": {
+                    "parameters": [
+                        {
+                            "name": "id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "get": {
+                        "operationId": "get_gadget",
+                        "responses": {"200": {"description": "Gadget"}},
+                    },
+                },
+            },
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / ".liveapi").mkdir()
+            (temp_path / ".liveapi" / "config.json").write_text(
+                json.dumps({"backend_type": "sqlmodel_async"})
+            )
+            spec_path = temp_path / "gadgets.yaml"
+            spec_path.write_text(yaml.dump(spec))
+            database_url = f"sqlite:///{temp_path / 'gadgets.db'}"
+
+            db_module._db_manager = None
+            try:
+                with patch.dict(os.environ, {"DATABASE_URL": database_url}), patch(
+                    "pathlib.Path.cwd", return_value=temp_path
+                ):
+                    app = create_app(spec_path)
+                    with TestClient(app) as client:
+                        created = client.post("/gadgets", json={"name": "lamp"})
+                        assert created.status_code == 201
+                        gadget_id = created.json()["id"]
+                        assert client.get(f"/gadgets/{gadget_id}").json()["name"] == (
+                            "lamp"
+                        )
+                        assert len(client.get("/gadgets").json()) == 1
+                        assert client.get("/gadgets/missing").status_code == 404
+                        health = client.get("/health").json()
+                        assert health["database"]["async"]["checkouts"] >= 3
+                        # Sequential requests keep reusing one unit of work
+                        sessions = health["sessions"]["async"]
+                        assert sessions["created"] == 1
+                        assert sessions["reused"] == 3
+            finally:
+                db_module._db_manager = None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -15,6 +15,13 @@ from src.liveapi.implementation.exceptions import (
     ValidationError,
     ConflictError,
 )
+from src.liveapi.implementation.indexes import (
+    IndexDefinition,
+    IndexType,
+    parse_index_definitions,
+)
+from src.liveapi.implementation.filters import compile_filters
+from src.liveapi.implementation.pagination import encode_cursor
 
 
 class UserModel(BaseModel):
@@ -118,6 +125,25 @@ class TestDefaultResourceService:
         with pytest.raises(ValidationError):
             await self.service.update(created["id"], {"name": "T"})
 
+    @pytest.mark.asyncio
+    async def test_upsert_creates_then_replaces(self, user_data: Dict[str, Any]):
+        """Test that upsert creates a missing resource and replaces it after."""
+        created = await self.service.upsert("u1", user_data)
+        assert created["id"] == "u1"
+        assert created["created_at"] == created["updated_at"]
+
+        replaced = await self.service.upsert(
+            "u1", {"name": "Replaced", "email": "new@example.com"}
+        )
+        assert replaced["name"] == "Replaced"
+        assert replaced["created_at"] == created["created_at"]
+        assert await self.service.read("u1") == replaced
+        assert [r["id"] for r in await self.service.list()] == ["u1"]
+
+        with pytest.raises(ValidationError):
+            await self.service.upsert("u1", {"name": "X", "email": "x@e.com"})
+        assert (await self.service.read("u1"))["name"] == "Replaced"
+
     @pytest.mark.asyncio
     async def test_delete_success(self, user_data: Dict[str, Any]):
         """Test successful resource deletion."""
@@ -164,58 +190,634 @@ class TestDefaultResourceService:
         assert resources[0]["name"] == "User 2"
 
     @pytest.mark.asyncio
-    async def test_apply_filters_no_filters(self):
-        """Test that _apply_filters returns all resources if no filters are provided."""
+    async def test_list_pages_follow_insertion_order_after_deletes(self):
+        """Test unfiltered pagination after deleting resources."""
+        created = [
+            await self.service.create({"name": f"User {i}", "email": f"{i}@x.com"})
+            for i in range(6)
+        ]
+        await self.service.delete(created[1]["id"])
+        await self.service.delete(created[4]["id"])
+
+        page = await self.service.list(limit=2, offset=1)
+        assert [r["id"] for r in page] == [created[2]["id"], created[3]["id"]]
+        assert await self.service.list(offset=10) == []
+
+    @pytest.mark.asyncio
+    async def test_deletes_leave_tombstones_until_compacted(self):
+        """Test that deleted slots are skipped and compacted lazily."""
+        created = [
+            await self.service.create({"name": f"User {i}", "email": f"{i % 2}@x.com"})
+            for i in range(8)
+        ]
+        for i in (0, 3, 5):
+            await self.service.delete(created[i]["id"])
+        assert self.service._order_ids.count(None) == 3
+        remaining = [r["id"] for i, r in enumerate(created) if i not in (0, 3, 5)]
+
+        page, cursor = await self.service.list_page(limit=2)
+        assert [r["id"] for r in page] == remaining[:2]
+        page, _ = await self.service.list_page(limit=10, cursor=cursor)
+        assert [r["id"] for r in page] == remaining[2:]
+        assert [r["id"] async for r in self.service.stream(batch_size=2)] == remaining
+        assert [r["id"] for r in await self.service.list(email="1@x.com")] == [
+            created[1]["id"],
+            created[7]["id"],
+        ]
+
+        # A positional slice compacts first, as does a majority of tombstones
+        assert [r["id"] for r in await self.service.list(offset=1)] == remaining[1:]
+        assert None not in self.service._order_ids
+        for resource_id in remaining[:3]:
+            await self.service.delete(resource_id)
+        assert len(self.service._order_ids) == 2
+        assert [r["id"] for r in await self.service.list()] == remaining[3:]
+
+    @pytest.mark.asyncio
+    async def test_filtered_list_stops_after_page(self):
+        """Test that filtered listing doesn't evaluate resources past the page."""
+
+        class Untouchable(dict):
+            def __contains__(self, key):
+                raise AssertionError("resource past the page was evaluated")
+
+        for i in range(5):
+            await self.service.create({"name": f"User {i}", "email": "same@x.com"})
+        last_id = next(reversed(self.service._storage))
+        self.service._storage[last_id] = Untouchable(self.service._storage[last_id])
+
+        page = await self.service.list(limit=2, offset=1, email="same@x.com")
+        assert [r["name"] for r in page] == ["User 1", "User 2"]
+
+    @pytest.mark.asyncio
+    async def test_list_page_cursor(self):
+        """Test keyset pagination with and without filters."""
+        created = [
+            await self.service.create({"name": f"User {i}", "email": f"{i % 2}@x.com"})
+            for i in range(7)
+        ]
+        await self.service.delete(created[2]["id"])
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await self.service.list_page(limit=2, cursor=cursor)
+            seen.extend(r["id"] for r in page)
+            if cursor is None:
+                break
+        assert seen == [r["id"] for i, r in enumerate(created) if i != 2]
+
+        page, cursor = await self.service.list_page(limit=2, email="1@x.com")
+        assert [r["name"] for r in page] == ["User 1", "User 3"]
+        page, cursor = await self.service.list_page(
+            limit=2, cursor=cursor, email="1@x.com"
+        )
+        assert [r["name"] for r in page] == ["User 5"]
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_list_page_invalid_cursor(self):
+        """Test that malformed cursors raise ValidationError."""
+        with pytest.raises(ValidationError):
+            await self.service.list_page(cursor="!!!")
+        for key in (True, "1", {"a": 1}, [1]):
+            with pytest.raises(ValidationError):
+                await self.service.list_page(cursor=encode_cursor(key))
+
+    @pytest.mark.asyncio
+    async def test_list_page_non_positive_limit(self, user_data):
+        """Test that a page needs a limit of at least 1."""
+        await self.service.create(user_data)
+        for limit in (0, -1):
+            with pytest.raises(ValidationError, match="limit"):
+                await self.service.list_page(limit=limit, cursor=encode_cursor(0))
+
+    def store(self, resources):
+        """Replace the stored resources, in order."""
+        self.service._storage = {r["id"]: r for r in resources}
+        self.service.rebuild_indexes()
+
+    @pytest.mark.asyncio
+    async def test_list_filters_no_filters(self):
+        """Test that list returns all resources if no filters are provided."""
         all_resources = [{"id": "1", "value": 10}, {"id": "2", "value": 20}]
-        self.service._storage = {r["id"]: r for r in all_resources}
-        filtered = self.service._apply_filters(all_resources, {})
+        self.store(all_resources)
+        filtered = await self.service.list()
         assert filtered == all_resources
 
     @pytest.mark.asyncio
-    async def test_apply_filters_exact_match(self):
+    async def test_list_filters_exact_match(self):
         """Test exact match filtering."""
         all_resources = [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}]
-        self.service._storage = {r["id"]: r for r in all_resources}
-        filtered = self.service._apply_filters(all_resources, {"name": "A"})
+        self.store(all_resources)
+        filtered = await self.service.list(name="A")
         assert len(filtered) == 1
         assert filtered[0]["name"] == "A"
 
     @pytest.mark.asyncio
-    async def test_apply_filters_gte(self):
+    async def test_list_filters_gte(self):
         """Test greater than or equal filtering."""
         all_resources = [{"id": "1", "value": 10}, {"id": "2", "value": 20}]
-        self.service._storage = {r["id"]: r for r in all_resources}
-        filtered = self.service._apply_filters(all_resources, {"value__gte": 15})
+        self.store(all_resources)
+        filtered = await self.service.list(value__gte=15)
         assert len(filtered) == 1
         assert filtered[0]["value"] == 20
 
     @pytest.mark.asyncio
-    async def test_apply_filters_lte(self):
+    async def test_list_filters_lte(self):
         """Test less than or equal filtering."""
         all_resources = [{"id": "1", "value": 10}, {"id": "2", "value": 20}]
-        self.service._storage = {r["id"]: r for r in all_resources}
-        filtered = self.service._apply_filters(all_resources, {"value__lte": 15})
+        self.store(all_resources)
+        filtered = await self.service.list(value__lte=15)
         assert len(filtered) == 1
         assert filtered[0]["value"] == 10
 
     @pytest.mark.asyncio
-    async def test_apply_filters_contains(self):
+    async def test_list_filters_contains(self):
         """Test 'contains' filtering for strings."""
         all_resources = [{"id": "1", "name": "Test"}, {"id": "2", "name": "Another"}]
-        self.service._storage = {r["id"]: r for r in all_resources}
-        filtered = self.service._apply_filters(all_resources, {"name__contains": "est"})
+        self.store(all_resources)
+        filtered = await self.service.list(name__contains="est")
         assert len(filtered) == 1
         assert filtered[0]["name"] == "Test"
 
     @pytest.mark.asyncio
-    async def test_apply_filters_skip_pagination(self):
+    async def test_filters_skip_pagination(self):
         """Test that pagination parameters are skipped during filtering."""
         all_resources = [{"id": "1", "name": "A"}]
-        self.service._storage = {r["id"]: r for r in all_resources}
-        filtered = self.service._apply_filters(all_resources, {"limit": 1, "offset": 0})
+        self.store(all_resources)
+        filtered = [r async for r in self.service.stream(limit=1, offset=0)]
         assert len(filtered) == 1
 
 
+async def scan(service, **filters):
+    """List through a service holding the same resources but no indexes."""
+    unindexed = DefaultResourceService(service.model, service.resource_name, indexes=[])
+    unindexed._storage.update(service._storage)
+    unindexed.rebuild_indexes()
+    return await unindexed.list(limit=len(service._storage) + 1, **filters)
+
+
+def candidate_ids(service, **filters):
+    """Return the IDs an index narrows the filters to, or None."""
+    return service._index_candidate_ids(compile_filters(filters))
+
+
+class TestSecondaryIndexes:
+    """Test exact-match filtering through secondary hash indexes."""
+
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        """Set up an indexed service."""
+        self.service = DefaultResourceService(
+            UserModel,
+            "users",
+            indexes=[
+                IndexDefinition(fields=["email"]),
+                IndexDefinition(fields=["name", "email"]),
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_index_lookup_matches_scan(self):
+        """Test that indexed filtering returns the same results as a scan."""
+        for i in range(10):
+            await self.service.create(
+                {"name": f"User {i % 3}", "email": f"user{i % 2}@example.com"}
+            )
+
+        indexed = await self.service.list(email="user1@example.com")
+        scanned = await scan(self.service, email="user1@example.com")
+        assert indexed == scanned
+        assert len(indexed) == 5
+
+    @pytest.mark.asyncio
+    async def test_composite_index_lookup(self):
+        """Test filtering on all fields of a composite index."""
+        await self.service.create({"name": "Alice", "email": "a@example.com"})
+        await self.service.create({"name": "Alice", "email": "b@example.com"})
+        await self.service.create({"name": "Bob", "email": "a@example.com"})
+
+        resources = await self.service.list(name="Alice", email="a@example.com")
+        assert len(resources) == 1
+        assert candidate_ids(self.service, name="Alice", email="a@example.com") == [
+            resources[0]["id"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_index_follows_update_and_delete(self):
+        """Test that indexes are kept in step with writes."""
+        created = await self.service.create({"name": "Alice", "email": "a@x.com"})
+        other = await self.service.create({"name": "Bob", "email": "b@x.com"})
+
+        await self.service.update(created["id"], {"email": "b@x.com"}, partial=True)
+        assert await self.service.list(email="a@x.com") == []
+        # Results keep insertion order even though the record moved buckets
+        assert [r["id"] for r in await self.service.list(email="b@x.com")] == [
+            created["id"],
+            other["id"],
+        ]
+
+        await self.service.delete(created["id"])
+        assert [r["id"] for r in await self.service.list(email="b@x.com")] == [
+            other["id"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_page_through_index(self):
+        """Test that cursors seek within index candidates."""
+        for i in range(6):
+            await self.service.create({"name": f"User {i}", "email": f"{i % 2}@x.com"})
+
+        page, cursor = await self.service.list_page(limit=2, email="0@x.com")
+        assert [r["name"] for r in page] == ["User 0", "User 2"]
+        page, cursor = await self.service.list_page(
+            limit=2, cursor=cursor, email="0@x.com"
+        )
+        assert [r["name"] for r in page] == ["User 4"]
+        assert cursor is None
+
+    @pytest.mark.asyncio
+    async def test_unindexed_filters_fall_back_to_scan(self):
+        """Test that filters without a usable index still work."""
+        await self.service.create({"name": "Alice", "email": "a@x.com"})
+        assert candidate_ids(self.service, name="Alice") is None
+        assert len(await self.service.list(name="Alice")) == 1
+
+    @pytest.mark.asyncio
+    async def test_sorted_index_range_matches_scan(self):
+        """Test that range filters through a sorted index match a scan."""
+        service = DefaultResourceService(
+            UserModel,
+            "users",
+            indexes=[IndexDefinition(fields=["created_at"], type=IndexType.SORTED)],
+        )
+        created = [
+            await service.create({"name": f"User {i}", "email": f"{i}@x.com"})
+            for i in range(20)
+        ]
+        low, high = created[5]["created_at"], created[14]["created_at"]
+        filters = {"created_at__gte": low, "created_at__lte": high}
+
+        assert candidate_ids(service, **filters) is not None
+        resources = await service.list(**filters)
+        scanned = await scan(service, **filters)
+        assert resources == scanned
+        assert {r["id"] for r in created[5:15]} <= {r["id"] for r in resources}
+
+    @pytest.mark.asyncio
+    async def test_composite_sorted_index_equality_and_range(self):
+        """Test an equality prefix combined with a range on the next field."""
+        service = DefaultResourceService(
+            UserModel,
+            "users",
+            indexes=[IndexDefinition(fields=["email", "name"], type=IndexType.SORTED)],
+        )
+        for i in range(10):
+            await service.create({"name": f"User {i}", "email": f"{i % 2}@x.com"})
+
+        filters = {"email": "0@x.com", "name__gte": "User 3", "name__lte": "User 7"}
+        resources = await service.list(**filters)
+        assert [r["name"] for r in resources] == ["User 4", "User 6"]
+        assert candidate_ids(service, **filters) == [r["id"] for r in resources]
+
+    @pytest.mark.asyncio
+    async def test_sorted_index_follows_writes(self):
+        """Test that sorted indexes are kept in step with updates and deletes."""
+        service = DefaultResourceService(
+            UserModel,
+            "users",
+            indexes=[IndexDefinition(fields=["name"], type=IndexType.SORTED)],
+        )
+        alice = await service.create({"name": "Alice", "email": "a@x.com"})
+        bob = await service.create({"name": "Bob", "email": "b@x.com"})
+
+        await service.update(alice["id"], {"name": "Zed"}, partial=True)
+        assert [r["id"] for r in await service.list(name__lte="Carl")] == [bob["id"]]
+
+        await service.delete(bob["id"])
+        assert await service.list(name__lte="Carl") == []
+        assert len(service._indexes["ix_name"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_trigram_index_contains_matches_scan(self):
+        """Test that __contains through a trigram index matches a scan."""
+        service = DefaultResourceService(
+            UserModel,
+            "users",
+            indexes=[IndexDefinition(fields=["name"], type=IndexType.TRIGRAM)],
+        )
+        for name in ["Mary Cassatt", "Edgar Degas", "Berthe Morisot", "Degas Jr"]:
+            await service.create({"name": name, "email": "x@x.com"})
+
+        for term in ["Degas", "sat", "Morisot", "xyz"]:
+            filters = {"name__contains": term}
+            assert candidate_ids(service, **filters) is not None
+            scanned = await scan(service, **filters)
+            assert await service.list(**filters) == scanned
+
+        # Short terms can't be narrowed and fall back to a scan
+        assert candidate_ids(service, name__contains="De") is None
+        assert len(await service.list(name__contains="De")) == 2
+
+    @pytest.mark.asyncio
+    async def test_trigram_index_follows_writes(self):
+        """Test that the trigram index is maintained incrementally."""
+        service = DefaultResourceService(
+            UserModel,
+            "users",
+            indexes=[IndexDefinition(fields=["name"], type=IndexType.TRIGRAM)],
+        )
+        created = await service.create({"name": "Winslow Homer", "email": "w@x.com"})
+        await service.update(created["id"], {"name": "John Singer"}, partial=True)
+        assert await service.list(name__contains="Homer") == []
+        assert len(await service.list(name__contains="Singer")) == 1
+
+        await service.delete(created["id"])
+        assert len(service._indexes["ix_name"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_index_stats(self):
+        """Test that index memory accounting is reported."""
+        await self.service.create({"name": "Alice", "email": "a@x.com"})
+        stats = self.service.index_stats()
+        assert set(stats) == {"ix_email", "ix_name_email"}
+        assert stats["ix_email"]["type"] == "hash"
+        assert stats["ix_email"]["entries"] == 1
+        assert stats["ix_email"]["memory_bytes"] > 0
+
+    def test_trigram_index_requires_single_field(self):
+        """Test that composite trigram indexes are rejected."""
+        with pytest.raises(ValueError, match="exactly one field"):
+            IndexDefinition(fields=["a", "b"], type=IndexType.TRIGRAM)
+
+    def test_parse_index_definitions(self):
+        """Test reading x-liveapi-index declarations from a schema."""
+        schema = {
+            "type": "object",
+            "x-liveapi-index": ["owner", ["owner", "status"]],
+            "properties": {
+                "owner": {"type": "string", "x-liveapi-index": True},
+                "status": {"type": "string"},
+                "email": {"type": "string", "x-liveapi-index": "hash"},
+                "price": {"type": "number", "x-liveapi-index": "sorted"},
+            },
+        }
+        definitions = parse_index_definitions(schema)
+        assert [d.fields for d in definitions] == [
+            ["owner"],
+            ["owner", "status"],
+            ["email"],
+            ["price"],
+        ]
+        assert definitions[-1].type == IndexType.SORTED
+
+    def test_parse_unique_definitions(self):
+        """Test reading x-liveapi-unique declarations from a schema."""
+        schema = {
+            "x-liveapi-unique": [["owner", "slug"]],
+            "x-liveapi-index": [{"fields": ["code"], "unique": True}],
+            "properties": {
+                "email": {"type": "string", "x-liveapi-unique": True},
+                "owner": {"type": "string", "x-liveapi-index": True},
+            },
+        }
+        definitions = parse_index_definitions(schema)
+        assert [(d.name, d.unique) for d in definitions] == [
+            ("ux_code", True),
+            ("ix_owner", False),
+            ("ux_owner_slug", True),
+            ("ux_email", True),
+        ]
+        with pytest.raises(ValueError, match="can't be unique"):
+            IndexDefinition(fields=["a"], type=IndexType.TRIGRAM, unique=True)
+
+    def test_parse_index_definitions_unknown_type(self):
+        """Test that unknown index types are rejected."""
+        with pytest.raises(ValueError, match="Unknown index type"):
+            parse_index_definitions({"x-liveapi-index": [{"field": "a", "type": "?"}]})
+
+
+class TestBulkOperations:
+    """Test batch create/update/delete on DefaultResourceService."""
+
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        """Set up test fixtures."""
+        self.service = DefaultResourceService(UserModel, "users")
+
+    @pytest.mark.asyncio
+    async def test_bulk_create(self):
+        """Test creating a batch of resources."""
+        created = await self.service.bulk_create(
+            [
+                {"name": "Ann", "email": "ann@example.com"},
+                {"id": "bob", "name": "Bob", "email": "bob@example.com"},
+            ]
+        )
+        assert [r["name"] for r in created] == ["Ann", "Bob"]
+        assert created[1]["id"] == "bob"
+        assert await self.service.read(created[0]["id"]) == created[0]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_is_all_or_nothing(self):
+        """Test that one invalid or conflicting item rejects the batch."""
+        await self.service.create({"id": "x", "name": "Xia", "email": "x@e.com"})
+        with pytest.raises(ValidationError, match="1.name"):
+            await self.service.bulk_create(
+                [{"name": "Ann", "email": "a@e.com"}, {"name": "B", "email": "b"}]
+            )
+        with pytest.raises(ConflictError):
+            await self.service.bulk_create(
+                [{"name": "Ann", "email": "a@e.com"}, {"id": "x", **user_fields()}]
+            )
+        with pytest.raises(ConflictError):
+            await self.service.bulk_create(
+                [{"id": "y", **user_fields()}, {"id": "y", **user_fields()}]
+            )
+        assert len(await self.service.list()) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_update(self):
+        """Test patching a batch of resources."""
+        created = await self.service.bulk_create([user_fields(), user_fields()])
+        updated = await self.service.bulk_update(
+            [{"id": created[0]["id"], "name": "New"}, {"id": created[1]["id"]}]
+        )
+        assert [r["name"] for r in updated] == ["New", "Test User"]
+
+        with pytest.raises(NotFoundError):
+            await self.service.bulk_update(
+                [{"id": created[0]["id"], "name": "Newer"}, {"id": "missing"}]
+            )
+        with pytest.raises(ValidationError):
+            await self.service.bulk_update([{"id": created[0]["id"], "name": "N"}])
+        assert (await self.service.read(created[0]["id"]))["name"] == "New"
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete(self):
+        """Test deleting a batch of resources."""
+        created = await self.service.bulk_create([user_fields() for _ in range(3)])
+        ids = [r["id"] for r in created]
+
+        with pytest.raises(NotFoundError, match="missing"):
+            await self.service.bulk_delete([ids[0], "missing"])
+        with pytest.raises(NotFoundError, match="IDs 7, 8 not found"):
+            await self.service.bulk_delete([7, 8])
+        assert len(await self.service.list()) == 3
+
+        await self.service.bulk_delete(ids[:2])
+        assert [r["id"] for r in await self.service.list()] == ids[2:]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert(self):
+        """Test creating and replacing a batch of resources together."""
+        existing = await self.service.create({"id": "a", **user_fields()})
+        written = await self.service.bulk_upsert(
+            [
+                {"id": "b", "name": "Bea", "email": "b@e.com"},
+                {"id": "a", "name": "Ann", "email": "a@e.com"},
+            ]
+        )
+        assert [r["id"] for r in written] == ["b", "a"]
+        assert written[1]["created_at"] == existing["created_at"]
+        assert (await self.service.read("a"))["name"] == "Ann"
+        assert [r["id"] for r in await self.service.list()] == ["a", "b"]
+
+        with pytest.raises(ConflictError, match="repeated"):
+            await self.service.bulk_upsert(
+                [{"id": "c", **user_fields()}, {"id": "c", **user_fields()}]
+            )
+        with pytest.raises(ValidationError, match="needs an id"):
+            await self.service.bulk_upsert([user_fields()])
+        with pytest.raises(ValidationError):
+            await self.service.bulk_upsert(
+                [{"id": "c", **user_fields()}, {"id": "a", "name": "A", "email": ""}]
+            )
+        assert len(await self.service.list()) == 2
+
+
+class TestPartialValidation:
+    """Test that PATCH validates only the fields it changes."""
+
+    @pytest.mark.asyncio
+    async def test_patch_validates_changed_fields(self, user_data):
+        """Test coercion, constraints and unknown fields on PATCH."""
+
+        class Address(BaseModel):
+            city: str
+
+        class Customer(UserModel):
+            age: int = 0
+            address: Address | None = None
+
+        service = DefaultResourceService(Customer, "customers")
+        created = await service.create(user_data)
+
+        updated = await service.update(
+            created["id"], {"age": "42", "address": {"city": "Oslo"}}, partial=True
+        )
+        assert updated["age"] == 42
+        assert updated["address"] == {"city": "Oslo"}
+        assert updated["name"] == user_data["name"]
+        assert updated["created_at"] == created["created_at"]
+
+        updated = await service.update(created["id"], {"unknown": 1}, partial=True)
+        assert "unknown" not in updated
+
+        for invalid in ({"name": "x"}, {"email": None}, {"address": {"zip": 1}}):
+            with pytest.raises(ValidationError):
+                await service.update(created["id"], invalid, partial=True)
+        assert (await service.read(created["id"]))["age"] == 42
+
+    @pytest.mark.asyncio
+    async def test_patch_runs_model_validators(self, user_data):
+        """Test that models with cross-field validators are fully validated."""
+        from pydantic import model_validator
+
+        class Range(BaseModel):
+            id: str | None = None
+            low: int
+            high: int
+
+            @model_validator(mode="after")
+            def check_order(self):
+                if self.low > self.high:
+                    raise ValueError("low must not exceed high")
+                return self
+
+        service = DefaultResourceService(Range, "ranges")
+        created = await service.create({"low": 1, "high": 5})
+        assert (await service.update(created["id"], {"low": 3}, partial=True))[
+            "low"
+        ] == 3
+        with pytest.raises(ValidationError):
+            await service.update(created["id"], {"low": 9}, partial=True)
+
+    @pytest.mark.asyncio
+    async def test_patch_validates_like_the_whole_model(self):
+        """Test that extra="forbid" and computed fields are honoured."""
+        from pydantic import ConfigDict, computed_field
+
+        class Box(BaseModel):
+            model_config = ConfigDict(extra="forbid")
+
+            id: str | None = None
+            width: int
+            height: int
+
+            @computed_field
+            @property
+            def area(self) -> int:
+                return self.width * self.height
+
+        service = DefaultResourceService(Box, "boxes")
+        created = await service.create({"width": 2, "height": 3})
+        assert created["area"] == 6
+
+        updated = await service.update(created["id"], {"width": 5}, partial=True)
+        assert updated["area"] == 15
+        assert updated["created_at"] == created["created_at"]
+        with pytest.raises(ValidationError, match="unknown"):
+            await service.update(created["id"], {"unknown": 1}, partial=True)
+        assert "unknown" not in await service.read(created["id"])
+
+
+class TestStream:
+    """Test streaming resources out of DefaultResourceService."""
+
+    @pytest.mark.asyncio
+    async def test_stream_in_batches(self):
+        """Test that streaming yields every match across batches."""
+        service = DefaultResourceService(UserModel, "users")
+        created = await service.bulk_create([user_fields() for _ in range(7)])
+        await service.update(created[3]["id"], {"name": "Other"}, partial=True)
+
+        streamed = [r["id"] async for r in service.stream(batch_size=2)]
+        assert streamed == [r["id"] for r in created]
+
+        filtered = [r async for r in service.stream(batch_size=2, name="Other")]
+        assert [r["id"] for r in filtered] == [created[3]["id"]]
+
+    @pytest.mark.asyncio
+    async def test_stream_tolerates_writes(self):
+        """Test that deletes between batches don't skip resources."""
+        service = DefaultResourceService(UserModel, "users")
+        created = await service.bulk_create([user_fields() for _ in range(6)])
+        ids = [r["id"] for r in created]
+
+        streamed = []
+        async for resource in service.stream(batch_size=2):
+            streamed.append(resource["id"])
+            if len(streamed) == 2:
+                await service.bulk_delete(ids[:2])
+        assert streamed == ids
+
+
+def user_fields() -> Dict[str, Any]:
+    """Return fields for a valid user."""
+    return {"name": "Test User", "email": "test@example.com"}
+
+
 class TestDefaultResourceServiceIntegration:
     """Integration tests for the DefaultResourceService."""
 
@@ -0,0 +1,99 @@
+"""Tests for compiled filter plans."""
+
+import pytest
+from sqlmodel import SQLModel, Field, Session, create_engine, select
+
+from src.liveapi.implementation.filters import (
+    FilterOperator,
+    compile_filters,
+    _compile_signature,
+)
+from src.liveapi.implementation.sql_model_resource_service import (
+    SQLModelResourceService,
+)
+
+
+class FilterPlanItem(SQLModel, table=True):
+    """SQLModel table for filter tests."""
+
+    __tablename__ = "filter_plan_items"
+    id: str = Field(primary_key=True)
+    name: str
+    price: float
+
+
+class TestCompileFilters:
+    """Test filter compilation and matching."""
+
+    def test_operators_are_parsed_once_per_signature(self):
+        """Test that plans with the same keys share a cached shape."""
+        first = compile_filters({"price__gte": 1, "name": "a", "limit": 10})
+        second = compile_filters({"price__gte": 5, "name": "b", "limit": 20})
+        assert first.plan is second.plan
+        assert [clause.operator for clause in first.plan.clauses] == [
+            FilterOperator.GTE,
+            FilterOperator.EQ,
+        ]
+        assert _compile_signature.cache_info().hits >= 1
+
+    def test_values_for_operator(self):
+        """Test grouping bound values by operator."""
+        plan = compile_filters({"a": 1, "b__lte": 2, "c__gte": 3, "d__contains": "x"})
+        assert plan.values_for(FilterOperator.EQ) == {"a": 1}
+        assert plan.values_for(FilterOperator.LTE) == {"b": 2}
+        assert plan.values_for(FilterOperator.GTE) == {"c": 3}
+        assert plan.values_for(FilterOperator.CONTAINS) == {"d": "x"}
+
+    def test_matches(self):
+        """Test in-memory predicate evaluation."""
+        plan = compile_filters(
+            {"price__gte": 10, "price__lte": 20, "name__contains": "ar"}
+        )
+        assert plan.matches({"price": 15, "name": "chart"})
+        assert not plan.matches({"price": 25, "name": "chart"})
+        assert not plan.matches({"price": 15, "name": "chest"})
+        # Unknown fields are not constrained
+        assert plan.matches({"name": "art"})
+
+    def test_range_on_null_does_not_match(self):
+        """Test that range filters skip values that can't be compared."""
+        plan = compile_filters({"price__gte": 10})
+        assert not plan.matches({"price": None})
+
+    def test_empty_plan_is_falsy(self):
+        """Test that pagination-only filters compile to an empty plan."""
+        assert not compile_filters({"limit": 1, "offset": 0})
+        assert not compile_filters(None)
+
+    def test_compiled_plan_is_passed_through(self):
+        """Test that compiling a bound plan returns it unchanged."""
+        plan = compile_filters({"name": "a"})
+        assert compile_filters(plan) is plan
+
+
+class TestSQLFilters:
+    """Test compiled plans against a SQL backend."""
+
+    @pytest.fixture
+    def session(self):
+        """Create an in-memory SQLite session with sample rows."""
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine, tables=[FilterPlanItem.__table__])
+        with Session(engine) as session:
+            for i in range(5):
+                session.add(FilterPlanItem(id=str(i), name=f"item {i}", price=i * 10))
+            session.commit()
+            yield session
+
+    def test_sql_conditions(self, session):
+        """Test that SQL conditions match the in-memory semantics."""
+        service = SQLModelResourceService(FilterPlanItem, "items", session=session)
+        filters = {"price__gte": 10, "price__lte": 30, "name__contains": "item"}
+        query = service._apply_filters(select(FilterPlanItem), filters)
+        rows = session.exec(query).all()
+        assert sorted(row.id for row in rows) == ["1", "2", "3"]
+
+    def test_unknown_fields_are_ignored(self, session):
+        """Test that filters on fields the model lacks are skipped."""
+        plan = compile_filters({"missing": 1, "name": "item 0"})
+        assert len(plan.sql_conditions(FilterPlanItem)) == 1
@@ -0,0 +1,300 @@
+"""Tests for the endpoints generated by LiveAPIRouter."""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from src.liveapi.implementation.app import create_app
+
+
+@pytest.fixture
+def items_spec():
+    """Write a CRUD+ spec for an items resource and return its path."""
+    item_schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string"},
+            "name": {"type": "string"},
+            "owner": {"type": "string"},
+        },
+        "required": ["name"],
+    }
+    item_ref = {"$ref": "#/components/schemas/Item"}
+    json_item = {"application/json": {"schema": item_ref}}
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "Items API", "version": "1.0.0"},
+        "components": {"schemas": {"Item": item_schema}},
+        "paths": {
+            "/items": {
+                "get": {
+                    "operationId": "list_items",
+                    "responses": {
+                        "200": {
+                            "description": "Items",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"type": "array", "items": item_ref}
+                                }
+                            },
+                        }
+                    },
+                },
+                "post": {
+                    "operationId": "create_item",
+                    "requestBody": {"required": True, "content": json_item},
+                    "responses": {"201": {"description": "Created"}},
+                },
+            },
+            "/items/{id}": {
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "string"},
+                    }
+                ],
+                "get": {
+                    "operationId": "get_item",
+                    "responses": {"200": {"description": "Item"}},
+                },
+                "put": {
+                    "operationId": "update_item",
+                    "requestBody": {"required": True, "content": json_item},
+                    "responses": {"200": {"description": "Updated"}},
+                },
+                "patch": {
+                    "operationId": "patch_item",
+                    "responses": {"200": {"description": "Patched"}},
+                },
+                "delete": {
+                    "operationId": "delete_item",
+                    "responses": {"204": {"description": "Deleted"}},
+                },
+            },
+        },
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        spec_path = Path(temp_dir) / "items.yaml"
+        spec_path.write_text(yaml.dump(spec))
+        yield spec_path
+
+
+@pytest.fixture
+def client(items_spec):
+    """Test client for an app using the default in-memory backend."""
+    with patch("pathlib.Path.cwd", return_value=items_spec.parent):
+        app = create_app(items_spec)
+    return TestClient(app)
+
+
+class TestCursorPagination:
+    """Test keyset pagination on the list endpoint."""
+
+    def test_cursor_pages_cover_collection(self, client):
+        """Test walking the collection page by page with cursors."""
+        created = [
+            client.post("/items", json={"name": f"item {i}"}).json()["id"]
+            for i in range(7)
+        ]
+
+        seen = []
+        response = client.get("/items", params={"limit": 3, "cursor": ""})
+        while True:
+            assert response.status_code == 200
+            seen.extend(item["id"] for item in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            response = client.get("/items", params={"limit": 3, "cursor": next_cursor})
+
+        assert seen == created
+
+    def test_offset_mode_has_no_cursor(self, client):
+        """Test that plain offset listing is unchanged."""
+        client.post("/items", json={"name": "item"})
+        response = client.get("/items", params={"limit": 1})
+        assert response.status_code == 200
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_invalid_cursor(self, client):
+        """Test that a malformed cursor is rejected with 400."""
+        response = client.get("/items", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_non_positive_limit(self, client):
+        """Test that limits below 1 are rejected rather than crashing."""
+        client.post("/items", json={"name": "item"})
+        for limit in (0, -1):
+            for params in ({"cursor": ""}, {}):
+                response = client.get("/items", params={"limit": limit, **params})
+                assert response.status_code == 422
+        response = client.get("/items", params={"offset": -1})
+        assert response.status_code == 422
+
+
+class TestBatchEndpoints:
+    """Test the batch create/update/delete endpoints."""
+
+    def test_batch_lifecycle(self, client):
+        """Test creating, patching and deleting items in batches."""
+        response = client.post(
+            "/items:batch", json=[{"name": "a"}, {"name": "b", "owner": "me"}]
+        )
+        assert response.status_code == 201
+        ids = [item["id"] for item in response.json()]
+
+        response = client.patch(
+            "/items:batch", json=[{"id": ids[0], "owner": "you"}, {"id": ids[1]}]
+        )
+        assert response.status_code == 200
+        assert [item["owner"] for item in response.json()] == ["you", "me"]
+
+        response = client.request("DELETE", "/items:batch", json={"ids": ids})
+        assert response.status_code == 204
+        assert client.get("/items").json() == []
+
+    def test_put_creates_or_replaces(self, client):
+        """Test that PUT upserts single items and batches."""
+        response = client.put("/items/i1", json={"name": "first"})
+        assert response.status_code == 200
+        assert response.json()["id"] == "i1"
+        response = client.put("/items/i1", json={"name": "renamed"})
+        assert client.get("/items/i1").json()["name"] == "renamed"
+
+        response = client.put(
+            "/items:batch", json=[{"id": "i2", "name": "b"}, {"id": "i1", "name": "a"}]
+        )
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["b", "a"]
+        assert len(client.get("/items").json()) == 2
+
+        response = client.put("/items:batch", json=[{"name": "no id"}])
+        assert response.status_code == 400
+
+    def test_put_documents_created_or_replaced(self, client):
+        """Test that the spec documents PUT answering 200 when it creates."""
+        paths = client.get("/openapi.json").json()["paths"]
+        for path in ("/items/{id}", "/items:batch"):
+            responses = paths[path]["put"]["responses"]
+            assert responses["200"]["description"].endswith("created or replaced")
+            assert "201" not in responses
+
+    def test_batch_validation_error(self, client):
+        """Test that an invalid item rejects the whole batch."""
+        response = client.post("/items:batch", json=[{"name": "a"}, {"owner": "x"}])
+        assert response.status_code == 400
+        assert client.get("/items").json() == []
+
+
+class TestStreamingList:
+    """Test streamed exports from the list endpoint."""
+
+    def test_ndjson(self, client):
+        """Test streaming the collection as newline-delimited JSON."""
+        client.post("/items:batch", json=[{"name": f"item {i}"} for i in range(250)])
+        response = client.get("/items", params={"stream": "ndjson"})
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert [json.loads(line)["name"] for line in lines] == [
+            f"item {i}" for i in range(250)
+        ]
+
+    def test_json_array(self, client):
+        """Test streaming the collection as one JSON array."""
+        client.post("/items:batch", json=[{"name": f"item {i}"} for i in range(150)])
+        response = client.get("/items", params={"stream": "json"})
+        assert response.status_code == 200
+        assert len(response.json()) == 150
+
+    def test_empty_json_array(self, client):
+        """Test that an empty collection streams as a valid array."""
+        assert client.get("/items", params={"stream": "json"}).json() == []
+
+    def test_streamed_items_match_list(self, client):
+        """Test that streamed items have the shape of list items."""
+        client.post("/items:batch", json=[{"name": f"item {i}"} for i in range(3)])
+        listed = client.get("/items").json()
+        assert "created_at" not in listed[0]
+
+        assert client.get("/items", params={"stream": "json"}).json() == listed
+        response = client.get("/items", params={"stream": "ndjson"})
+        assert [json.loads(line) for line in response.text.splitlines()] == listed
+
+    def test_pagination_is_rejected(self, client):
+        """Test that page parameters can't be combined with a stream."""
+        for params in ({"limit": 10}, {"offset": 5}, {"cursor": ""}):
+            response = client.get("/items", params={"stream": "ndjson", **params})
+            assert response.status_code == 400
+
+    def test_unknown_format(self, client):
+        """Test that unknown stream formats are rejected."""
+        assert client.get("/items", params={"stream": "csv"}).status_code == 422
+
+
+class TestFastSerialization:
+    """Test endpoints with fast serialization enabled in the project config."""
+
+    @pytest.fixture
+    def fast_client(self, items_spec):
+        """Test client for an app with fast_serialization turned on."""
+        metadata_dir = items_spec.parent / ".liveapi"
+        metadata_dir.mkdir()
+        (metadata_dir / "config.json").write_text(
+            json.dumps({"fast_serialization": True})
+        )
+        with patch("pathlib.Path.cwd", return_value=items_spec.parent):
+            app = create_app(items_spec)
+        return TestClient(app)
+
+    def test_crud_responses(self, fast_client):
+        """Test that fast responses keep their status codes and bodies."""
+        response = fast_client.post("/items", json={"name": "widget"})
+        assert response.status_code == 201
+        assert response.headers["content-type"] == "application/json"
+        item = response.json()
+        assert item["name"] == "widget"
+
+        assert fast_client.get(f"/items/{item['id']}").json() == item
+        patched = fast_client.patch(f"/items/{item['id']}", json={"owner": "ann"})
+        assert patched.status_code == 200
+        assert patched.json()["owner"] == "ann"
+        assert fast_client.get(f"/items/{item['id']}").json()["owner"] == "ann"
+
+        created = fast_client.post("/items:batch", json=[{"name": "a"}, {"name": "b"}])
+        assert created.status_code == 201
+        assert len(fast_client.get("/items").json()) == 3
+
+        missing = fast_client.get("/items/missing")
+        assert missing.status_code == 404
+
+    def test_bodies_match_response_model(self, fast_client, items_spec, tmp_path):
+        """Test that fast bodies are exactly the regular ones."""
+        # A project without the config, so its responses take the regular path
+        spec_path = tmp_path / items_spec.name
+        spec_path.write_text(items_spec.read_text())
+        with patch("pathlib.Path.cwd", return_value=tmp_path):
+            client = TestClient(create_app(spec_path))
+
+        item = {"id": "w1", "name": "widget", "owner": "ann"}
+        for api in (fast_client, client):
+            api.post("/items", json=item)
+        for path in ("/items/w1", "/items"):
+            fast = fast_client.get(path).json()
+            assert fast == client.get(path).json()
+        # Stored keys outside the model (the service's timestamps) stay out
+        assert fast == [item]
+
+    def test_cursor_header(self, fast_client):
+        """Test that the next-cursor header survives the fast path."""
+        fast_client.post("/items:batch", json=[{"name": str(i)} for i in range(3)])
+        response = fast_client.get("/items", params={"cursor": "", "limit": 2})
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" in response.headers
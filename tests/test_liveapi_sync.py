@@ -511,3 +511,74 @@ class TestSyncManager:
 
         finally:
             os.chdir(original_cwd)
+
+    @pytest.mark.parametrize("backend_type", ["sqlmodel", "sqlmodel_async"])
+    def test_generate_sql_service(self, temp_project, backend_type):
+        """Test that both SQL backends get a SQL service for their session."""
+        from liveapi.sync.executor import _generate_implementation_file
+
+        # Table models are registered globally, so each backend gets its own
+        schema_name = f"{backend_type.title().replace('_', '')}Note"
+        ref = {"$ref": f"#/components/schemas/{schema_name}"}
+        body = {"content": {"application/json": {"schema": ref}}}
+        id_param = {"name": "id", "in": "path", "required": True}
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Notes API", "version": "1.0.0"},
+            "paths": {
+                "/notes": {
+                    "get": {"responses": {"200": {"description": "Success"}}},
+                    "post": {
+                        "requestBody": body,
+                        "responses": {"201": {"description": "Created", **body}},
+                    },
+                },
+                "/notes/{id}": {
+                    "get": {
+                        "parameters": [{**id_param, "schema": {"type": "string"}}],
+                        "responses": {"200": {"description": "Success", **body}},
+                    },
+                },
+            },
+            "components": {
+                "schemas": {
+                    schema_name: {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "title": {"type": "string"},
+                        },
+                        "required": ["id", "title"],
+                    }
+                }
+            },
+        }
+
+        metadata_manager = MetadataManager(temp_project)
+        config = metadata_manager.initialize_project("test")
+        config.backend_type = backend_type
+        metadata_manager.save_config(config)
+
+        spec_file = temp_project / "notes.yaml"
+        with open(spec_file, "w") as f:
+            yaml.dump(spec, f)
+        implementations_dir = temp_project / "implementations"
+        implementations_dir.mkdir()
+
+        from sqlmodel import SQLModel
+
+        tables = set(SQLModel.metadata.tables.values())
+        try:
+            assert _generate_implementation_file(
+                spec_file, implementations_dir, temp_project
+            )
+        finally:
+            for table in set(SQLModel.metadata.tables.values()) - tables:
+                SQLModel.metadata.remove(table)
+        (service_file,) = implementations_dir.glob("*_service.py")
+        source = service_file.read_text()
+        compile(source, str(service_file), "exec")
+        assert "self.session.exec(query)" in source
+        is_async = backend_type == "sqlmodel_async"
+        assert ("await self.session.commit()" in source) == is_async
+        assert ("AsyncSession" in source) == is_async
@@ -180,6 +180,1087 @@ async def test_crud_handlers_performance():
     assert max_time < 20, f"Maximum CRUD create time {max_time:.4f}ms exceeds 20ms"
 
 
+def test_columnar_storage_memory():
+    """Test that columnar storage holds records in a fraction of the memory."""
+    import tracemalloc
+    import uuid
+    from datetime import datetime, UTC
+    from liveapi.implementation.storage import create_storage
+
+    num_records = 20000
+    ids = [str(uuid.uuid4()) for _ in range(num_records)]
+
+    def make_record(i):
+        now = datetime.now(UTC).isoformat()
+        return {
+            "id": ids[i],
+            "customer": f"customer_{i % 50}",
+            "status": ["new", "paid", "shipped"][i % 3],
+            "quantity": i,
+            "price": i * 1.5,
+            "paid": i % 2 == 0,
+            "note": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    usage = {}
+    for engine in ("dict", "columnar"):
+        storage = create_storage(engine)
+        tracemalloc.start()
+        for i in range(num_records):
+            storage[ids[i]] = make_record(i)
+        usage[engine] = tracemalloc.get_traced_memory()[0] / num_records
+        tracemalloc.stop()
+        del storage
+
+    ratio = usage["dict"] / usage["columnar"]
+    print(
+        f"✅ Bytes per record - dict: {usage['dict']:.0f}, "
+        f"columnar: {usage['columnar']:.0f} ({ratio:.1f}x smaller)"
+    )
+
+    assert ratio >= 3, f"Columnar storage is only {ratio:.1f}x smaller than dicts"
+
+
+@pytest.mark.asyncio
+async def test_delete_cost_independent_of_size():
+    """Test that deleting doesn't get slower as the collection grows."""
+    from pydantic import BaseModel
+
+    class TestItem(BaseModel):
+        id: str | None = None
+        name: str
+
+    num_deletes = 5000
+
+    async def delete_oldest(num_records):
+        service = liveapi.DefaultResourceService(TestItem, "items")
+        await service.bulk_create(
+            [{"id": f"item_{i}", "name": f"Item {i}"} for i in range(num_records)]
+        )
+        # Deleting from the front is the worst case for shifting arrays
+        start_time = time.perf_counter()
+        for i in range(num_deletes):
+            await service.delete(f"item_{i}")
+        elapsed = time.perf_counter() - start_time
+        assert len(await service.list(limit=1000)) == 1000
+        return elapsed / num_deletes * 1_000_000
+
+    small_us = await delete_oldest(num_deletes * 2)
+    large_us = await delete_oldest(num_deletes * 40)
+
+    print(
+        f"✅ Delete from the front - {num_deletes * 2} resources: {small_us:.1f}us, "
+        f"{num_deletes * 40} resources: {large_us:.1f}us"
+    )
+
+    assert large_us < small_us * 3, "Deletes slow down as the collection grows"
+
+
+@pytest.mark.asyncio
+async def test_journal_write_overhead():
+    """Measure the cost of write-ahead logging on in-memory creates."""
+    import asyncio
+    from pydantic import BaseModel
+    from liveapi.implementation.persistence import ResourceJournal
+
+    class TestItem(BaseModel):
+        id: str | None = None
+        name: str
+
+    num_writes = 500
+    concurrency = 50
+
+    async def timed_creates(service):
+        start_time = time.perf_counter()
+        for batch in range(0, num_writes, concurrency):
+            await asyncio.gather(
+                *(
+                    service.create({"name": f"item_{i}"})
+                    for i in range(batch, batch + concurrency)
+                )
+            )
+        return (time.perf_counter() - start_time) / num_writes * 1000
+
+    memory_ms = await timed_creates(liveapi.DefaultResourceService(TestItem, "items"))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        durable_service = liveapi.DefaultResourceService(
+            TestItem, "items", journal=ResourceJournal(temp_dir)
+        )
+        durable_ms = await timed_creates(durable_service)
+
+    print(
+        f"✅ Create per write - memory: {memory_ms:.4f}ms, "
+        f"journaled: {durable_ms:.4f}ms ({durable_ms / memory_ms:.1f}x)"
+    )
+
+    assert durable_ms < 2, f"Journaled create time {durable_ms:.4f}ms exceeds 2ms"
+
+
+def test_snapshot_cold_start():
+    """Test that a mapped snapshot is ready without decoding every resource."""
+    import json
+    from liveapi.implementation.persistence import MappedSnapshot, write_snapshot
+
+    num_records = 100000
+    resources = [
+        (
+            f"item_{i}",
+            {"id": f"item_{i}", "name": f"Item {i}", "price": i * 0.5, "tags": ["a"]},
+        )
+        for i in range(num_records)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "snapshot.bin"
+        write_snapshot(path, resources)
+
+        start_time = time.perf_counter()
+        snapshot = MappedSnapshot(path)
+        first = snapshot["item_0"]
+        mapped_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        decoded = {key: json.loads(snapshot.encoded(key)) for key in snapshot}
+        decode_all_ms = (time.perf_counter() - start_time) * 1000
+
+    print(
+        f"✅ Cold start of {num_records} resources - mapped: {mapped_ms:.1f}ms, "
+        f"decoding everything: {decode_all_ms:.1f}ms"
+    )
+
+    assert first["name"] == "Item 0" and len(decoded) == num_records
+    assert mapped_ms < decode_all_ms / 3
+
+
+def _shared_journal_worker(directory, worker, num_writes, reads_per_write):
+    """Run creates and reads against a shared journal in a worker process."""
+    import asyncio
+    from pydantic import BaseModel
+    from liveapi.implementation.persistence import ResourceJournal
+
+    class TestItem(BaseModel):
+        id: str | None = None
+        name: str
+
+    async def run():
+        journal = ResourceJournal(directory, fsync=False, shared=True)
+        service = liveapi.DefaultResourceService(TestItem, "items", journal=journal)
+        for i in range(num_writes):
+            created = await service.create({"name": f"worker_{worker}_{i}"})
+            for _ in range(reads_per_write):
+                await service.read(created["id"])
+
+    asyncio.run(run())
+
+
+@pytest.mark.asyncio
+async def test_shared_journal_worker_throughput():
+    """Measure throughput of worker processes sharing one dataset."""
+    import multiprocessing
+    from pydantic import BaseModel
+    from liveapi.implementation.persistence import ResourceJournal
+
+    class TestItem(BaseModel):
+        id: str | None = None
+        name: str
+
+    num_writes = 200
+    reads_per_write = 20
+    context = multiprocessing.get_context("fork")
+
+    for num_workers in (1, 2, 4, 8):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            start_time = time.perf_counter()
+            processes = [
+                context.Process(
+                    target=_shared_journal_worker,
+                    args=(temp_dir, worker, num_writes, reads_per_write),
+                )
+                for worker in range(num_workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            elapsed = time.perf_counter() - start_time
+
+            assert all(process.exitcode == 0 for process in processes)
+            service = liveapi.DefaultResourceService(
+                TestItem, "items", journal=ResourceJournal(temp_dir)
+            )
+            total = len(await service.list(limit=num_workers * num_writes))
+            assert total == num_workers * num_writes
+
+        operations = num_workers * num_writes * (1 + reads_per_write)
+        print(
+            f"✅ {num_workers} shared worker(s): {operations / elapsed:,.0f} ops/s "
+            f"({elapsed * 1000:.0f}ms incl. process start)"
+        )
+
+
+def test_fast_serialization_overhead():
+    """Compare list responses with and without fast serialization."""
+    import gc
+    from fastapi.testclient import TestClient
+    from liveapi.implementation.liveapi_router import LiveAPIRouter
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string"},
+            "name": {"type": "string"},
+            "email": {"type": "string"},
+            "age": {"type": "integer"},
+            "score": {"type": "number"},
+            "active": {"type": "boolean"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["name"],
+    }
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "Users API", "version": "1.0.0"},
+        "components": {"schemas": {"User": schema}},
+        "paths": {
+            "/users": {
+                "get": {
+                    "operationId": "list_users",
+                    "responses": {"200": {"description": "Users"}},
+                },
+                "post": {
+                    "operationId": "create_user",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/User"}
+                            }
+                        },
+                    },
+                    "responses": {"201": {"description": "Created"}},
+                },
+            }
+        },
+    }
+    users = [
+        {
+            "id": f"user-{i}",
+            "name": f"user {i}",
+            "email": f"user{i}@example.com",
+            "age": 20 + i % 50,
+            "score": i * 0.5,
+            "active": i % 2 == 0,
+            "tags": ["a", "b", "c"],
+        }
+        for i in range(500)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        spec_path = Path(temp_dir) / "users.yaml"
+        spec_path.write_text(yaml.dump(spec))
+
+        timings = {}
+        bodies = {}
+        for fast in (False, True):
+            router = LiveAPIRouter()
+            router.fast_serialization = fast
+            client = TestClient(router.create_app_from_spec(str(spec_path)))
+            client.post("/users:batch", json=users)
+
+            client.get("/users", params={"limit": 500})  # Warm up
+            # Keep a full collection of the heap earlier tests left behind
+            # from landing in only one of the runs
+            gc.collect()
+            gc.freeze()
+            try:
+                start_time = time.perf_counter()
+                for _ in range(20):
+                    response = client.get("/users", params={"limit": 500})
+                timings[fast] = (time.perf_counter() - start_time) * 1000 / 20
+            finally:
+                gc.unfreeze()
+            bodies[fast] = response.json()
+
+    # Exactly the same payload either way
+    assert bodies[True] == bodies[False]
+
+    speedup = timings[False] / timings[True]
+    print(
+        f"✅ List 500 records - validated: {timings[False]:.2f}ms, "
+        f"fast: {timings[True]:.2f}ms ({speedup:.1f}x faster)"
+    )
+    assert speedup > 1, "Fast serialization is not faster than re-validation"
+
+
+def test_partial_validation_speedup():
+    """Compare field-level PATCH validation with a full model rebuild."""
+    from typing import List, Optional
+    from pydantic import BaseModel, create_model
+    from liveapi.implementation.validation import validate_partial
+
+    class Address(BaseModel):
+        street: str
+        city: str
+        zip: str
+
+    fields = {f"text_{i}": (str, ...) for i in range(40)}
+    fields.update({f"count_{i}": (int, 0) for i in range(20)})
+    fields["addresses"] = (List[Address], [])
+    fields["id"] = (Optional[str], None)
+    WideModel = create_model("WideModel", **fields)
+
+    data = {f"text_{i}": "x" * 10 for i in range(40)}
+    data["addresses"] = [{"street": "s", "city": "c", "zip": "z"}] * 10
+    record = WideModel(**data).model_dump()
+    patch = {"count_1": 5}
+
+    def full_rebuild():
+        return WideModel(**{**record, **patch}).model_dump()
+
+    def field_level():
+        return validate_partial(WideModel, record, patch)
+
+    assert field_level() == full_rebuild()
+
+    timings = {}
+    for name, validate in (("full", full_rebuild), ("field", field_level)):
+        start_time = time.perf_counter()
+        for _ in range(2000):
+            validate()
+        timings[name] = (time.perf_counter() - start_time) * 1000 / 2000
+
+    speedup = timings["full"] / timings["field"]
+    print(
+        f"✅ PATCH one field of 62 - full: {timings['full']:.4f}ms, "
+        f"field-level: {timings['field']:.4f}ms ({speedup:.1f}x faster)"
+    )
+    assert speedup > 2, f"Field-level validation is only {speedup:.1f}x faster"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("database", ["sqlite", "postgresql"])
+async def test_sql_create_round_trips(database):
+    """Compare SQL creates with and without the SELECT-before-INSERT.
+
+    The PostgreSQL run needs a local server; point LIVEAPI_TEST_POSTGRES_URL
+    at a scratch database to enable it.
+    """
+    import os
+    import uuid
+    from sqlmodel import Field, Session, SQLModel, create_engine
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    if database == "postgresql":
+        url = os.environ.get("LIVEAPI_TEST_POSTGRES_URL")
+        if not url:
+            pytest.skip("LIVEAPI_TEST_POSTGRES_URL is not set")
+        temp_dir = None
+    else:
+        temp_dir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{Path(temp_dir.name) / 'bench.db'}"
+
+    class BenchCreateModel(SQLModel, table=True):
+        __tablename__ = f"bench_create_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        name: str
+        quantity: int
+
+    engine = create_engine(url)
+    table = BenchCreateModel.__table__
+    SQLModel.metadata.create_all(engine, tables=[table])
+    num_creates = 300
+
+    try:
+        with Session(engine) as session:
+            # Before: look up the ID, add, commit, then refresh
+            start_time = time.perf_counter()
+            for i in range(num_creates):
+                resource = BenchCreateModel(id=f"old-{i}", name="item", quantity=i)
+                assert session.get(BenchCreateModel, resource.id) is None
+                session.add(resource)
+                session.commit()
+                session.refresh(resource)
+                resource.model_dump(mode="json")
+            before = (time.perf_counter() - start_time) * 1000 / num_creates
+
+            session.expunge_all()
+            service = SQLModelResourceService(BenchCreateModel, "bench", session)
+            start_time = time.perf_counter()
+            for i in range(num_creates):
+                await service.create({"id": f"new-{i}", "name": "item", "quantity": i})
+            after = (time.perf_counter() - start_time) * 1000 / num_creates
+    finally:
+        table.drop(engine)
+        SQLModel.metadata.remove(table)
+        engine.dispose()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    print(
+        f"✅ SQL create ({database}) - select+insert+refresh: {before:.3f}ms, "
+        f"single insert: {after:.3f}ms ({before / after:.1f}x faster)"
+    )
+    assert after < before, "Single-statement create is not faster"
+
+
+@pytest.mark.asyncio
+async def test_sql_upsert_round_trips():
+    """Compare syncing records by read-then-write against a batched upsert."""
+    import uuid
+    from sqlmodel import Field, Session, SQLModel, create_engine
+    from liveapi.implementation.exceptions import NotFoundError
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    class BenchUpsertModel(SQLModel, table=True):
+        __tablename__ = f"bench_upsert_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        name: str
+        quantity: int
+
+    temp_dir = tempfile.TemporaryDirectory()
+    engine = create_engine(f"sqlite:///{Path(temp_dir.name) / 'bench.db'}")
+    table = BenchUpsertModel.__table__
+    SQLModel.metadata.create_all(engine, tables=[table])
+    num_records = 500
+
+    def records(prefix):
+        # Half of each sync updates existing records, half creates new ones
+        return [
+            {"id": f"{prefix}-{i}", "name": "item", "quantity": i}
+            for i in range(num_records // 2, num_records + num_records // 2)
+        ]
+
+    try:
+        with Session(engine) as session:
+            service = SQLModelResourceService(BenchUpsertModel, "bench", session)
+            for prefix in ("old", "new"):
+                await service.bulk_create(records(prefix)[: num_records // 2])
+
+            # Before: read each record, then update it or create it
+            start_time = time.perf_counter()
+            for record in records("old"):
+                try:
+                    await service.read(record["id"])
+                    await service.update(record["id"], record)
+                except NotFoundError:
+                    await service.create(record)
+            before = (time.perf_counter() - start_time) * 1000
+
+            start_time = time.perf_counter()
+            await service.bulk_upsert(records("new"))
+            after = (time.perf_counter() - start_time) * 1000
+    finally:
+        table.drop(engine)
+        SQLModel.metadata.remove(table)
+        engine.dispose()
+        temp_dir.cleanup()
+
+    print(
+        f"✅ Sync {num_records} records - read+create/update: {before:.1f}ms, "
+        f"bulk upsert: {after:.1f}ms ({before / after:.1f}x faster)"
+    )
+    assert after * 5 < before, "Batched upsert isn't much faster than per-record"
+
+
+@pytest.mark.asyncio
+async def test_write_coalescing_throughput():
+    """Compare concurrent SQL creates committed one by one and in batches."""
+    import asyncio
+    import uuid
+    from sqlmodel import Field, Session, SQLModel, create_engine, func, select
+    from liveapi.implementation.coalescing import WriteCoalescer
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    class BenchWriteModel(SQLModel, table=True):
+        __tablename__ = f"bench_write_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        name: str
+        quantity: int
+
+    table = BenchWriteModel.__table__
+    num_writes = 400
+
+    async def concurrent_creates(engine, prefix, coalescer=None):
+        sessions = [Session(engine) for _ in range(num_writes)]
+        services = [
+            SQLModelResourceService(BenchWriteModel, "bench", s, coalescer=coalescer)
+            for s in sessions
+        ]
+        start_time = time.perf_counter()
+        await asyncio.gather(
+            *[
+                service.create({"id": f"{prefix}-{i}", "name": "item", "quantity": i})
+                for i, service in enumerate(services)
+            ]
+        )
+        elapsed = time.perf_counter() - start_time
+        for session in sessions:
+            session.close()
+        return num_writes / elapsed
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{Path(temp_dir) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine, tables=[table])
+        try:
+            plain = await concurrent_creates(engine, "plain")
+            coalescer = WriteCoalescer(engine)
+            batched = await concurrent_creates(engine, "batched", coalescer)
+            with Session(engine) as session:
+                count = session.exec(select(func.count()).select_from(table)).one()
+            assert count == 2 * num_writes
+        finally:
+            SQLModel.metadata.remove(table)
+            engine.dispose()
+
+    print(
+        f"✅ {num_writes} concurrent creates - commit each: {plain:.0f} writes/s, "
+        f"coalesced ({coalescer.batches} commits): {batched:.0f} writes/s "
+        f"({batched / plain:.1f}x faster)"
+    )
+    assert batched > plain, "Coalesced writes are not faster"
+
+
+@pytest.mark.asyncio
+async def test_read_cache_skewed_reads():
+    """Compare skewed reads by ID with and without the read-through cache."""
+    import random
+    import uuid
+    from sqlmodel import Field, Session, SQLModel, create_engine
+    from liveapi.implementation.caching import LRUCache
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    class BenchReadModel(SQLModel, table=True):
+        __tablename__ = f"bench_read_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        title: str
+        artist: str
+        year: int
+
+    table = BenchReadModel.__table__
+    num_records, num_reads, hot = 5000, 10000, 200
+
+    # 90% of reads go to a few hot records
+    rng = random.Random(42)
+    reads = [
+        f"art-{rng.randrange(hot) if rng.random() < 0.9 else rng.randrange(num_records)}"
+        for _ in range(num_reads)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{Path(temp_dir) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine, tables=[table])
+        try:
+            with Session(engine) as session:
+                await SQLModelResourceService(
+                    BenchReadModel, "art", session
+                ).bulk_create(
+                    [
+                        {
+                            "id": f"art-{i}",
+                            "title": "Untitled",
+                            "artist": "X",
+                            "year": i,
+                        }
+                        for i in range(num_records)
+                    ]
+                )
+
+            timings = {}
+            cache = LRUCache(max_entries=1000)
+            for name, service_cache in (("uncached", None), ("cached", cache)):
+                with Session(engine) as session:
+                    service = SQLModelResourceService(
+                        BenchReadModel, "art", session, cache=service_cache
+                    )
+                    start_time = time.perf_counter()
+                    for resource_id in reads:
+                        await service.read(resource_id)
+                        # Each request gets a fresh session in the app
+                        session.expunge_all()
+                    timings[name] = (time.perf_counter() - start_time) * 1e6 / num_reads
+        finally:
+            SQLModel.metadata.remove(table)
+            engine.dispose()
+
+    stats = cache.stats()
+    print(
+        f"✅ Skewed reads by ID - uncached: {timings['uncached']:.1f}µs, "
+        f"cached: {timings['cached']:.1f}µs "
+        f"({timings['uncached'] / timings['cached']:.1f}x faster, "
+        f"hit ratio {stats['hit_ratio']:.2f}, {stats['evictions']} evictions)"
+    )
+    assert timings["cached"] < timings["uncached"], "Cached reads are not faster"
+
+
+@pytest.mark.asyncio
+async def test_list_offloading_tail_latency():
+    """Measure small-read latency while a large list query is running.
+
+    Without the executor the large page is fetched and serialized on the
+    event loop, so every read issued meanwhile waits for it to finish.
+    """
+    import asyncio
+    import gc
+    import uuid
+    from sqlmodel import Field, Session, SQLModel, create_engine
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+    from liveapi.implementation.threadpool import BlockingExecutor
+
+    class BenchOffloadModel(SQLModel, table=True):
+        __tablename__ = f"bench_offload_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        title: str
+        artist: str
+        year: int
+
+    table = BenchOffloadModel.__table__
+    num_records, num_reads = 20000, 50
+
+    async def read_latencies(engine, executor):
+        sessions = [Session(engine) for _ in range(num_reads + 1)]
+        services = [
+            SQLModelResourceService(BenchOffloadModel, "art", s, executor=executor)
+            for s in sessions
+        ]
+
+        async def timed_read(service, i):
+            # Requests arrive spread out while the large list is running;
+            # latency counts from arrival, including time the loop was busy
+            arrival = start_time + i * 0.002
+            await asyncio.sleep(arrival - time.perf_counter())
+            await service.read(f"art-{i}")
+            return (time.perf_counter() - arrival) * 1000
+
+        start_time = time.perf_counter()
+        big_list = asyncio.ensure_future(services[-1].list(limit=num_records))
+        latencies = await asyncio.gather(
+            *[timed_read(services[i], i) for i in range(num_reads)]
+        )
+        assert len(await big_list) == num_records
+        for session in sessions:
+            session.close()
+        return sorted(latencies)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(
+            f"sqlite:///{Path(temp_dir) / 'bench.db'}",
+            connect_args={"check_same_thread": False},
+            pool_size=num_reads + 1,
+        )
+        SQLModel.metadata.create_all(engine, tables=[table])
+        executor = BlockingExecutor(max_workers=4)
+        try:
+            with Session(engine) as session:
+                await SQLModelResourceService(
+                    BenchOffloadModel, "art", session
+                ).bulk_create(
+                    [
+                        {
+                            "id": f"art-{i}",
+                            "title": "Untitled",
+                            "artist": "X",
+                            "year": i,
+                        }
+                        for i in range(num_records)
+                    ]
+                )
+            # Earlier tests leave a large heap behind; freeze it so a full
+            # collection landing in one of the runs doesn't decide the result
+            gc.collect()
+            gc.freeze()
+            on_loop = await read_latencies(engine, None)
+            offloaded = await read_latencies(engine, executor)
+        finally:
+            gc.unfreeze()
+            executor.shutdown()
+            SQLModel.metadata.remove(table)
+            engine.dispose()
+
+    def p99(latencies):
+        return latencies[int(len(latencies) * 0.99) - 1]
+
+    print(
+        f"✅ Reads during a {num_records}-row list - on the event loop: "
+        f"p50 {on_loop[len(on_loop) // 2]:.1f}ms, p99 {p99(on_loop):.1f}ms; "
+        f"offloaded: p50 {offloaded[len(offloaded) // 2]:.1f}ms, "
+        f"p99 {p99(offloaded):.1f}ms"
+    )
+    assert p99(offloaded) < p99(on_loop), "Offloading didn't reduce tail latency"
+
+
+@pytest.mark.asyncio
+async def test_sql_stream_constant_memory():
+    """Check that streaming an export keeps peak memory flat as tables grow."""
+    import tracemalloc
+    import uuid
+    from sqlmodel import Field, Session, SQLModel, create_engine
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    class BenchStreamModel(SQLModel, table=True):
+        __tablename__ = f"bench_stream_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        title: str
+        artist: str
+        year: int
+
+    table = BenchStreamModel.__table__
+
+    async def measure(session, num_rows):
+        service = SQLModelResourceService(BenchStreamModel, "art", session)
+        results = {}
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        count = 0
+        async for _ in service.stream(batch_size=1000):
+            count += 1
+        results["stream"] = (
+            time.perf_counter() - start_time,
+            tracemalloc.get_traced_memory()[1],
+        )
+        tracemalloc.stop()
+        assert count == num_rows
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        assert len(await service.list(limit=num_rows)) == num_rows
+        results["list"] = (
+            time.perf_counter() - start_time,
+            tracemalloc.get_traced_memory()[1],
+        )
+        tracemalloc.stop()
+        return results
+
+    measurements = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        engine = create_engine(f"sqlite:///{Path(temp_dir) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine, tables=[table])
+        try:
+            inserted = 0
+            for num_rows in (5000, 25000):
+                with engine.begin() as connection:
+                    connection.execute(
+                        table.insert(),
+                        [
+                            {
+                                "id": f"art-{i:07d}",
+                                "title": "Untitled",
+                                "artist": "X",
+                                "year": i,
+                            }
+                            for i in range(inserted, num_rows)
+                        ],
+                    )
+                inserted = num_rows
+                with Session(engine) as session:
+                    measurements[num_rows] = await measure(session, num_rows)
+        finally:
+            SQLModel.metadata.remove(table)
+            engine.dispose()
+
+    for num_rows, results in measurements.items():
+        print(
+            f"✅ Export of {num_rows} rows - stream: {results['stream'][0]:.2f}s, "
+            f"peak {results['stream'][1] / 1e6:.1f}MB; list: "
+            f"{results['list'][0]:.2f}s, peak {results['list'][1] / 1e6:.1f}MB"
+        )
+    small, large = measurements[5000], measurements[25000]
+    assert large["stream"][1] < 2 * small["stream"][1], "Stream memory grows with rows"
+    assert large["stream"][1] < large["list"][1] / 5
+
+
+@pytest.mark.asyncio
+async def test_sql_read_rows_per_second():
+    """Compare rows/s of reads selecting rows against hydrating ORM models."""
+    import uuid
+    from datetime import datetime, timezone
+    from typing import Optional
+    from sqlmodel import Field, Session, SQLModel, create_engine, select
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    class BenchReadModel(SQLModel, table=True):
+        __tablename__ = f"bench_read_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        title: str
+        artist: Optional[str] = None
+        year: int
+        price: float
+        sold: bool
+        created_at: Optional[datetime] = None
+
+    table = BenchReadModel.__table__
+    num_rows = 10000
+    rounds = 3
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine, tables=[table])
+    created_at = datetime.now(timezone.utc)
+    with engine.begin() as connection:
+        connection.execute(
+            table.insert(),
+            [
+                {
+                    "id": f"art-{i:06d}",
+                    "title": "Untitled",
+                    "artist": "X",
+                    "year": i,
+                    "price": i / 4,
+                    "sold": i % 2 == 0,
+                    "created_at": created_at,
+                }
+                for i in range(num_rows)
+            ],
+        )
+
+    try:
+        with Session(engine) as session:
+            service = SQLModelResourceService(BenchReadModel, "art", session)
+
+            # The previous read path: load model instances, then dump each one
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                hydrated = [
+                    service._model_to_dict(resource)
+                    for resource in session.exec(select(BenchReadModel).limit(num_rows))
+                ]
+                session.expunge_all()
+            orm_rate = rounds * num_rows / (time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                rows = await service.list(limit=num_rows)
+            row_rate = rounds * num_rows / (time.perf_counter() - start_time)
+    finally:
+        SQLModel.metadata.remove(table)
+        engine.dispose()
+
+    assert rows == hydrated
+    print(
+        f"✅ List of {num_rows} rows - ORM models: {orm_rate:,.0f} rows/s, "
+        f"column rows: {row_rate:,.0f} rows/s ({row_rate / orm_rate:.1f}x)"
+    )
+    assert row_rate > orm_rate * 1.3, "Reading rows isn't faster than ORM models"
+
+
+@pytest.mark.asyncio
+async def test_request_session_scope_overhead():
+    """Measure the per-request overhead saved by pooled units of work.
+
+    Reads are served by the read cache, so the time measured is what it
+    takes to set up and tear down the request's session and service.
+    """
+    import uuid
+    import httpx
+    from fastapi import Depends, FastAPI
+    from sqlmodel import Field, Session, SQLModel
+    import liveapi.implementation.database as db_module
+    from liveapi.implementation.database import DatabaseConfig, DatabaseManager
+    from liveapi.implementation.sql_model_resource_service import (
+        SQLModelResourceService,
+    )
+
+    class BenchScopeModel(SQLModel, table=True):
+        __tablename__ = f"bench_scope_{uuid.uuid4().hex[:8]}"
+        id: str = Field(primary_key=True)
+        title: str
+
+    table = BenchScopeModel.__table__
+    num_requests = 1000
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_manager = DatabaseManager(
+            f"sqlite:///{Path(temp_dir) / 'bench.db'}",
+            config=DatabaseConfig(read_cache_size=100),
+        )
+        engine = db_manager.get_engine()
+        SQLModel.metadata.create_all(engine, tables=[table])
+        db_module._db_manager = db_manager
+
+        # The previous dependencies: a session, then a service, per request
+        def get_session():
+            with Session(engine) as session:
+                yield session
+
+        def get_service(session=Depends(get_session)):
+            return SQLModelResourceService(
+                BenchScopeModel,
+                "art",
+                session,
+                cache=db_manager.get_read_cache("art"),
+                executor=db_manager.get_executor(),
+            )
+
+        async def get_scoped_service(unit=Depends(db_module.get_unit_of_work)):
+            return unit.service(BenchScopeModel, "art")
+
+        app = FastAPI()
+
+        @app.get("/per-request/{id}")
+        async def read_per_request(id: str, service=Depends(get_service)):
+            return await service.read(id)
+
+        @app.get("/scoped/{id}")
+        async def read_scoped(id: str, service=Depends(get_scoped_service)):
+            return await service.read(id)
+
+        timings = {}
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                with Session(engine) as session:
+                    await SQLModelResourceService(
+                        BenchScopeModel, "art", session
+                    ).create({"id": "art-1", "title": "Untitled"})
+                for route in ("per-request", "scoped"):
+                    for _ in range(50):
+                        await client.get(f"/{route}/art-1")
+                    start_time = time.perf_counter()
+                    for _ in range(num_requests):
+                        response = await client.get(f"/{route}/art-1")
+                        assert response.status_code == 200
+                    timings[route] = (time.perf_counter() - start_time) / num_requests
+            reused = db_manager.session_stats()["sync"]["reused"]
+        finally:
+            db_module._db_manager = None
+            db_manager.close()
+            SQLModel.metadata.remove(table)
+
+    print(
+        f"✅ Cached reads - session and service per request: "
+        f"{timings['per-request'] * 1e6:.0f}us/request, pooled unit of work: "
+        f"{timings['scoped'] * 1e6:.0f}us/request"
+    )
+    assert reused >= num_requests
+    assert timings["scoped"] < timings["per-request"], "Units of work aren't cheaper"
+
+
+async def _sql_backend_throughput(backend, directory, concurrency, num_records):
+    """Serve concurrent list requests from a fresh app and return requests/s."""
+    import asyncio
+    import json
+    import os
+    from unittest.mock import patch
+    import httpx
+    import liveapi.implementation.database as db_module
+
+    # A resource per backend, since generated table models are global
+    name = f"bench{backend.replace('_', '')}"
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string"},
+            "name": {"type": "string"},
+            "rank": {"type": "integer"},
+        },
+        "required": ["name"],
+    }
+    body = {"application/json": {"schema": {"$ref": f"#/components/schemas/{name}"}}}
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "Bench API", "version": "1.0.0"},
+        "components": {"schemas": {name: schema}},
+        "paths": {
+            f"/{name}s": {
+                "get": {
+                    "operationId": f"list_{name}s",
+                    "responses": {"200": {"description": "List"}},
+                },
+                "post": {
+                    "operationId": f"create_{name}",
+                    "requestBody": {"required": True, "content": body},
+                    "responses": {"201": {"description": "Created"}},
+                },
+            }
+        },
+    }
+
+    project = Path(directory) / backend
+    (project / ".liveapi").mkdir(parents=True)
+    (project / ".liveapi" / "config.json").write_text(
+        json.dumps({"backend_type": backend})
+    )
+    spec_path = project / "bench.yaml"
+    spec_path.write_text(yaml.dump(spec))
+
+    db_module._db_manager = None
+    environment = {"DATABASE_URL": f"sqlite:///{project / 'bench.db'}"}
+    try:
+        with patch.dict(os.environ, environment), patch(
+            "pathlib.Path.cwd", return_value=project
+        ):
+            app = liveapi.create_app(spec_path)
+            if backend == "sqlmodel_async":
+                await db_module.init_async_database()
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                records = [{"name": f"item {i}", "rank": i} for i in range(num_records)]
+                response = await client.post(f"/{name}s:batch", json=records)
+                assert response.status_code == 201
+
+                start_time = time.perf_counter()
+                responses = await asyncio.gather(
+                    *[
+                        client.get(
+                            f"/{name}s",
+                            params={"limit": 20, "offset": num_records - 100 + i},
+                        )
+                        for i in range(concurrency)
+                    ]
+                )
+                elapsed = time.perf_counter() - start_time
+            assert all(response.status_code == 200 for response in responses)
+    finally:
+        if db_module._db_manager is not None:
+            await db_module.close_async_database()
+            db_module.close_database()
+
+    return concurrency / elapsed
+
+
+@pytest.mark.asyncio
+async def test_async_sql_backend_concurrency():
+    """Measure SQL backend throughput under many concurrent requests.
+
+    The sync backend runs its queries on the event loop while each request
+    holds a pooled connection, so it can't serve more concurrent requests
+    than its pool holds (the next one blocks the loop waiting for a
+    connection). It is measured at that limit; the async backend at 120.
+    """
+    pytest.importorskip("aiosqlite")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sync_rate = await _sql_backend_throughput("sqlmodel", temp_dir, 15, 5000)
+        async_rate = await _sql_backend_throughput(
+            "sqlmodel_async", temp_dir, 120, 5000
+        )
+
+    print(
+        f"✅ Concurrent list requests - sqlmodel (15 at once): {sync_rate:.0f} req/s, "
+        f"sqlmodel_async (120 at once): {async_rate:.0f} req/s"
+    )
+
+
 def test_pydantic_model_generation_performance(fast_openapi_spec):
     """Test that Pydantic model generation is fast."""
     parser = liveapi.LiveAPIParser(fast_openapi_spec)
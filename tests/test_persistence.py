@@ -0,0 +1,373 @@
+"""Tests for snapshot + write-ahead log persistence of the in-memory backend."""
+
+import asyncio
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from src.liveapi.implementation.default_resource_service import (
+    DefaultResourceService,
+)
+from src.liveapi.implementation.exceptions import ConflictError
+from src.liveapi.implementation.persistence import (
+    MappedSnapshot,
+    ResourceJournal,
+    write_snapshot,
+)
+
+
+class Note(BaseModel):
+    """Simple model for persistence tests."""
+
+    id: Optional[str] = None
+    title: str
+    stars: int = 0
+
+
+class Artwork(BaseModel):
+    """Model with a date-time field, which JSON stores as a string."""
+
+    id: Optional[str] = None
+    title: str
+    acquired: Optional[datetime] = None
+
+
+def make_service(directory, model=Note, **journal_options):
+    """Create a service backed by a journal in the directory."""
+    journal = ResourceJournal(directory, **journal_options)
+    return DefaultResourceService(model, "notes", journal=journal)
+
+
+class TestResourceJournal:
+    """Test durability and replay of the journal."""
+
+    @pytest.mark.asyncio
+    async def test_restart_replays_changes(self, tmp_path):
+        """Test that creates, updates and deletes survive a restart."""
+        service = make_service(tmp_path)
+        first = await service.create({"title": "first"})
+        second = await service.create({"title": "second"})
+        await service.create({"title": "third", "id": "n3"})
+        await service.update(first["id"], {"stars": 5}, partial=True)
+        await service.delete(second["id"])
+
+        restarted = make_service(tmp_path)
+        resources = await restarted.list()
+        assert [r["title"] for r in resources] == ["first", "third"]
+        assert resources[0]["stars"] == 5
+        assert await restarted.read("n3") == await service.read("n3")
+
+    @pytest.mark.asyncio
+    async def test_restart_keeps_field_types(self, tmp_path):
+        """Test that replayed date-times are filtered like live ones."""
+        service = make_service(tmp_path, Artwork)
+        for year in (2018, 2020):
+            await service.create(
+                {
+                    "id": f"a{year}",
+                    "title": "Untitled",
+                    "acquired": datetime(year, 6, 1, tzinfo=timezone.utc),
+                }
+            )
+        since = datetime(2019, 1, 1, tzinfo=timezone.utc)
+        before = await service.list(acquired__gte=since)
+        assert [r["id"] for r in before] == ["a2020"]
+
+        restarted = make_service(tmp_path, Artwork)
+        assert await restarted.list(acquired__gte=since) == before
+        assert await restarted.read("a2018") == await service.read("a2018")
+
+    @pytest.mark.asyncio
+    async def test_compaction(self, tmp_path):
+        """Test that the log is folded into a snapshot once it grows."""
+        service = make_service(tmp_path, snapshot_interval=3)
+        for i in range(4):
+            await service.create({"title": f"note {i}", "id": f"n{i}"})
+        await service.delete("n0")
+
+        journal = service._journal
+        assert journal.snapshot_path.exists()
+        assert journal.log_entries == 2
+        assert len(MappedSnapshot(journal.snapshot_path)) == 3
+
+        restarted = make_service(tmp_path)
+        assert [r["id"] for r in await restarted.list()] == ["n1", "n2", "n3"]
+
+    @pytest.mark.asyncio
+    async def test_compaction_off_the_event_loop(self, tmp_path):
+        """Test that compaction runs on a worker thread while reads go on."""
+        service = make_service(tmp_path, snapshot_interval=3)
+        journal = service._journal
+        started, release = threading.Event(), threading.Event()
+        real_compact = journal.compact
+        threads = []
+
+        def slow_compact(resources):
+            threads.append(threading.get_ident())
+            started.set()
+            release.wait(5)
+            real_compact(resources)
+
+        loop = asyncio.get_running_loop()
+        with patch.object(journal, "compact", side_effect=slow_compact):
+            for i in range(2):
+                await service.create({"title": f"note {i}", "id": f"n{i}"})
+            write = asyncio.ensure_future(
+                service.create({"title": "note 2", "id": "n2"})
+            )
+            assert await loop.run_in_executor(None, started.wait, 5)
+            # Reads are served while the snapshot is being written
+            assert (await service.read("n2"))["title"] == "note 2"
+            release.set()
+            await write
+
+        assert threads and threading.get_ident() not in threads
+        assert journal.log_entries == 0
+        restarted = make_service(tmp_path)
+        assert [r["id"] for r in await restarted.list()] == ["n0", "n1", "n2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_fsync(self, tmp_path):
+        """Test that concurrent writers are group-committed."""
+        service = make_service(tmp_path)
+        await service.create({"title": "warm up"})
+
+        with patch(
+            "src.liveapi.implementation.persistence.os.fsync", wraps=os.fsync
+        ) as fsync:
+            await asyncio.gather(
+                *(service.create({"title": f"note {i}"}) for i in range(50))
+            )
+
+        assert 1 <= fsync.call_count < 10
+        assert len(await make_service(tmp_path).list(limit=1000)) == 51
+
+    @pytest.mark.asyncio
+    async def test_log_outlives_an_fsync_in_flight(self, tmp_path):
+        """Test that reopening the log waits for a running fsync to finish."""
+        journal = ResourceJournal(tmp_path)
+        journal.put("a", {"id": "a", "title": "ok"})
+        started, release = threading.Event(), threading.Event()
+        real_fsync = os.fsync
+
+        def slow_fsync(fd):
+            started.set()
+            release.wait(5)
+            real_fsync(fd)
+
+        loop = asyncio.get_running_loop()
+        with patch(
+            "src.liveapi.implementation.persistence.os.fsync", side_effect=slow_fsync
+        ):
+            commit = asyncio.ensure_future(journal.commit())
+            assert await loop.run_in_executor(None, started.wait, 5)
+            log = journal._log
+            # As when another worker compacted the log and it's reloaded
+            journal._close_log()
+            assert not log.closed
+            release.set()
+            await commit
+        assert log.closed
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        """Test that a partially written last entry is ignored and removed."""
+        journal = ResourceJournal(tmp_path)
+        entry = {"op": "put", "id": "a", "data": {"id": "a", "title": "ok"}}
+        journal.wal_path.write_text(json.dumps(entry) + '\n{"op": "pu')
+
+        assert list(journal.load()) == ["a"]
+        assert journal.wal_path.read_text() == json.dumps(entry) + "\n"
+
+    def test_corrupt_entry_is_an_error(self, tmp_path):
+        """Test that corruption before the tail is not silently skipped."""
+        journal = ResourceJournal(tmp_path)
+        journal.wal_path.write_text('{"op": "pu\n{"op": "delete", "id": "a"}\n')
+        with pytest.raises(ValueError, match="Corrupt journal line 1"):
+            journal.load()
+
+
+class TestMappedSnapshot:
+    """Test the memory-mapped binary snapshot."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that resources read back in order and decode on access."""
+        path = tmp_path / "snapshot.bin"
+        resources = [(f"n{i}", {"id": f"n{i}", "title": f"note {i}"}) for i in range(5)]
+        write_snapshot(path, resources)
+
+        snapshot = MappedSnapshot(path)
+        assert list(snapshot) == [resource_id for resource_id, _ in resources]
+        assert snapshot.decoded_count() == 0
+        assert snapshot["n3"] == {"id": "n3", "title": "note 3"}
+        assert snapshot.decoded_count() == 1
+
+    def test_decode_on_first_read(self, tmp_path):
+        """Test that a record is decoded through the callable once."""
+        path = tmp_path / "snapshot.bin"
+        write_snapshot(path, [("a", {"id": "a", "acquired": "2020-06-01T00:00:00Z"})])
+
+        decoded = []
+
+        def decode(record):
+            decoded.append(record["id"])
+            return Artwork.model_validate({"title": "x", **record}).model_dump()
+
+        snapshot = MappedSnapshot(path, decode)
+        assert snapshot["a"]["acquired"] == datetime(2020, 6, 1, tzinfo=timezone.utc)
+        assert snapshot["a"] is snapshot["a"]
+        assert decoded == ["a"]
+
+    def test_overlay_writes(self, tmp_path):
+        """Test that writes and deletes behave like a dict."""
+        path = tmp_path / "snapshot.bin"
+        write_snapshot(path, [("a", {"id": "a"}), ("b", {"id": "b"})])
+
+        snapshot = MappedSnapshot(path)
+        snapshot["a"] = {"id": "a", "title": "changed"}
+        snapshot["c"] = {"id": "c"}
+        del snapshot["b"]
+        assert list(snapshot) == ["a", "c"]
+        assert snapshot.encoded("a") == b'{"id":"a","title":"changed"}'
+
+    def test_empty_snapshot(self, tmp_path):
+        """Test a snapshot with no resources."""
+        path = tmp_path / "snapshot.bin"
+        write_snapshot(path, [])
+        assert len(MappedSnapshot(path)) == 0
+
+    def test_not_a_snapshot(self, tmp_path):
+        """Test that other files are rejected."""
+        path = tmp_path / "snapshot.bin"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="Not a LiveAPI snapshot"):
+            MappedSnapshot(path)
+
+    @pytest.mark.asyncio
+    async def test_service_loads_lazily(self, tmp_path):
+        """Test that restarting and compacting again decode nothing."""
+        service = make_service(tmp_path, snapshot_interval=10)
+        for i in range(10):
+            await service.create({"title": f"note {i}", "id": f"n{i}"})
+        assert service._journal.log_entries == 0
+
+        restarted = make_service(tmp_path, snapshot_interval=1)
+        storage = restarted._storage
+        assert isinstance(storage, MappedSnapshot)
+        assert storage.decoded_count() == 0
+
+        # Compaction copies untouched resources straight from the map
+        await restarted.update("n4", {"stars": 3}, partial=True)
+        assert storage.decoded_count() == 1
+        assert (await make_service(tmp_path).read("n4"))["stars"] == 3
+        assert len(await make_service(tmp_path).list()) == 10
+
+    @pytest.mark.asyncio
+    async def test_snapshot_keeps_field_types(self, tmp_path):
+        """Test that records read from the map match records written live."""
+        service = make_service(tmp_path, Artwork, snapshot_interval=2)
+        for year in (2018, 2020):
+            await service.create(
+                {
+                    "id": f"a{year}",
+                    "title": "Untitled",
+                    "acquired": datetime(year, 6, 1, tzinfo=timezone.utc),
+                }
+            )
+        assert service._journal.log_entries == 0
+
+        restarted = make_service(tmp_path, Artwork)
+        assert isinstance(restarted._storage, MappedSnapshot)
+        assert await restarted.read("a2018") == await service.read("a2018")
+        since = datetime(2019, 1, 1, tzinfo=timezone.utc)
+        assert [r["id"] for r in await restarted.list(acquired__gte=since)] == ["a2020"]
+
+
+class TestSharedJournal:
+    """Test several services (as if in separate workers) sharing a journal."""
+
+    @pytest.fixture
+    def workers(self, tmp_path):
+        return [
+            make_service(tmp_path, shared=True, snapshot_interval=5) for _ in range(2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_changes_are_visible_to_other_workers(self, workers):
+        """Test that creates, updates and deletes propagate."""
+        first, second = workers
+        created = await first.create({"title": "shared", "id": "s1"})
+        assert await second.read("s1") == created
+
+        await second.update("s1", {"stars": 4}, partial=True)
+        assert (await first.read("s1"))["stars"] == 4
+
+        await first.delete("s1")
+        assert await second.list() == []
+
+    @pytest.mark.asyncio
+    async def test_reads_catch_up_off_the_event_loop(self, workers):
+        """Test that reads read the shared log on a worker thread."""
+        first, second = workers
+        await first.create({"title": "shared", "id": "s1"})
+
+        threads = []
+        read_new = second._journal.read_new
+
+        def recording_read_new():
+            threads.append(threading.current_thread())
+            return read_new()
+
+        with patch.object(second._journal, "read_new", recording_read_new):
+            assert (await second.read("s1"))["title"] == "shared"
+            assert len(await second.list()) == 1
+        assert threads
+        assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_writes_see_other_workers_first(self, workers):
+        """Test that conflicts are detected across workers."""
+        first, second = workers
+        await first.create({"title": "one", "id": "dup"})
+        with pytest.raises(ConflictError):
+            await second.create({"title": "two", "id": "dup"})
+
+    @pytest.mark.asyncio
+    async def test_compaction_by_another_worker(self, workers):
+        """Test that a worker reloads after another compacts the log."""
+        first, second = workers
+        for i in range(4):
+            await second.create({"title": f"note {i}", "id": f"n{i}"})
+        await second.list()
+        for i in range(4, 8):
+            await first.create({"title": f"note {i}", "id": f"n{i}"})
+        assert first._journal.log_entries < 5
+
+        assert [r["id"] for r in await second.list()] == [f"n{i}" for i in range(8)]
+        await second.create({"title": "after", "id": "n8"})
+        assert (await first.read("n8"))["title"] == "after"
+
+    @pytest.mark.asyncio
+    async def test_workers_filter_date_times_alike(self, tmp_path):
+        """Test that changes applied from the log keep the model's types."""
+        first, second = [make_service(tmp_path, Artwork, shared=True) for _ in range(2)]
+        for year in (2018, 2020):
+            await first.create(
+                {
+                    "id": f"a{year}",
+                    "title": "Untitled",
+                    "acquired": datetime(year, 6, 1, tzinfo=timezone.utc),
+                }
+            )
+
+        since = datetime(2019, 1, 1, tzinfo=timezone.utc)
+        for worker in (first, second):
+            assert [r["id"] for r in await worker.list(acquired__gte=since)] == [
+                "a2020"
+            ]
+        assert await second.read("a2018") == await first.read("a2018")
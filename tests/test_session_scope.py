@@ -0,0 +1,99 @@
+"""Tests for request units of work over pooled sessions."""
+
+import pytest
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+from sqlalchemy.pool import StaticPool
+
+from src.liveapi.implementation.database import DatabaseManager
+from src.liveapi.implementation.session_scope import SessionScopes
+from src.liveapi.implementation.sql_model_resource_service import (
+    SQLModelResourceService,
+)
+
+
+class ScopedArtwork(SQLModel, table=True):
+    """Table model for the unit of work tests."""
+
+    __tablename__ = "test_scoped_artworks"
+    id: str = Field(primary_key=True)
+    title: str
+
+
+class ScopedArtist(SQLModel, table=True):
+    """Second table model, for requests touching two resources."""
+
+    __tablename__ = "test_scoped_artists"
+    id: str = Field(primary_key=True)
+    name: str
+
+
+class TestSessionScopes:
+    """Test SessionScopes reuse and cleanup of units of work."""
+
+    @pytest.fixture(autouse=True)
+    def set_up(self):
+        """Set up a pool over an in-memory database."""
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        SQLModel.metadata.create_all(
+            self.engine, tables=[ScopedArtwork.__table__, ScopedArtist.__table__]
+        )
+        self.built = []
+
+        def build_service(model, resource_name, session):
+            self.built.append(resource_name)
+            return SQLModelResourceService(model, resource_name, session)
+
+        self.scopes = SessionScopes(
+            lambda: Session(self.engine), build_service, max_idle=1
+        )
+        yield
+        self.engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_units_and_services_are_reused(self):
+        """Test that released units are handed out again with their services."""
+        unit = self.scopes.acquire()
+        artworks = unit.service(ScopedArtwork, "artworks")
+        artists = unit.service(ScopedArtist, "artists")
+        assert unit.service(ScopedArtwork, "artworks") is artworks
+        assert artworks.session is artists.session is unit.session
+        await self.scopes.release(unit)
+
+        assert self.scopes.acquire() is unit
+        assert unit.service(ScopedArtwork, "artworks") is artworks
+        assert self.built == ["artworks", "artists"]
+
+        other = self.scopes.acquire()
+        assert other is not unit
+        await self.scopes.release(unit)
+        await self.scopes.release(other)
+
+        stats = self.scopes.stats()
+        assert (stats["created"], stats["reused"]) == (2, 1)
+        assert (stats["in_use"], stats["idle"]) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_release_discards_uncommitted_work(self):
+        """Test that a released session keeps nothing from its request."""
+        unit = self.scopes.acquire()
+        service = unit.service(ScopedArtwork, "artworks")
+        await service.create({"id": "a", "title": "Irises"})
+        unit.session.add(ScopedArtwork(id="b", title="never committed"))
+        unit.session.flush()
+        unit.session.get(ScopedArtwork, "a")
+        await self.scopes.release(unit)
+
+        assert len(unit.session.identity_map) == 0
+        with Session(self.engine) as session:
+            ids = session.exec(select(ScopedArtwork.id)).all()
+        assert ids == ["a"]
+
+    def test_manager_pools_per_backend(self):
+        """Test that the manager sizes its pool after the connection pool."""
+        db_manager = DatabaseManager("sqlite://")
+        scopes = db_manager.get_session_scopes()
+        assert db_manager.get_session_scopes() is scopes
+        assert scopes.max_idle == 15
+        assert set(db_manager.session_stats()) == {"sync"}
+        db_manager.close()
+        assert db_manager.session_stats() == {}
@@ -0,0 +1,131 @@
+"""Tests for the in-memory storage engines."""
+
+import pytest
+from pydantic import BaseModel
+from typing import Optional
+
+from src.liveapi.implementation.default_resource_service import (
+    DefaultResourceService,
+)
+from src.liveapi.implementation.storage import ColumnarStorage, create_storage
+
+
+class Order(BaseModel):
+    """Model with one field of each column type."""
+
+    id: Optional[str] = None
+    customer: str
+    quantity: int
+    price: float
+    paid: bool
+    note: Optional[str] = None
+
+
+class TestColumnarStorage:
+    """Test ColumnarStorage mapping behaviour."""
+
+    def test_round_trip(self):
+        """Test that records read back exactly as stored."""
+        storage = ColumnarStorage()
+        record = {
+            "id": "a",
+            "quantity": 3,
+            "price": 2.5,
+            "paid": True,
+            "note": None,
+            "tags": ["x", "y"],
+            "created_at": "2024-01-02T03:04:05.123456+00:00",
+        }
+        storage["a"] = record
+        assert storage["a"] == record
+        assert type(storage["a"]["paid"]) is bool
+        assert storage._columns["created_at"].overflow == {}
+
+    def test_values_that_do_not_fit_the_column(self):
+        """Test that values of another type or out of range are kept as-is."""
+        storage = ColumnarStorage()
+        storage["a"] = {"n": 1, "ts": "2024-01-02T03:04:05+00:00"}
+        storage["b"] = {"n": 2**70, "ts": "yesterday"}
+        storage["c"] = {"n": "many", "ts": "2024-01-02T03:04:05+02:00"}
+        assert storage["b"] == {"n": 2**70, "ts": "yesterday"}
+        assert storage["c"] == {"n": "many", "ts": "2024-01-02T03:04:05+02:00"}
+
+    def test_missing_fields_stay_missing(self):
+        """Test that absent keys are distinguished from None values."""
+        storage = ColumnarStorage()
+        storage["a"] = {"id": "a", "x": 1}
+        storage["b"] = {"id": "b", "y": None}
+        assert storage["a"] == {"id": "a", "x": 1}
+        assert storage["b"] == {"id": "b", "y": None}
+
+        storage["a"] = {"id": "a", "y": 5}
+        assert storage["a"] == {"id": "a", "y": 5}
+
+    def test_mapping_protocol(self):
+        """Test iteration order, membership and deletion."""
+        storage = ColumnarStorage()
+        for key in "abc":
+            storage[key] = {"id": key}
+        del storage["b"]
+        assert list(storage) == ["a", "c"]
+        assert "b" not in storage and len(storage) == 2
+        with pytest.raises(KeyError):
+            storage["b"]
+
+        # The freed row is reused without leaking old values
+        storage["d"] = {"other": 1}
+        assert storage["d"] == {"other": 1}
+        assert storage._row_count == 3
+
+    def test_reads_are_copies(self):
+        """Test that mutating a returned record does not change storage."""
+        storage = ColumnarStorage()
+        storage["a"] = {"id": "a", "n": 1}
+        storage["a"]["n"] = 2
+        assert storage["a"]["n"] == 1
+
+    def test_repeated_strings_are_shared(self):
+        """Test that equal strings are stored as one object."""
+        storage = ColumnarStorage()
+        storage["a"] = {"status": "".join(["sh", "ipped"])}
+        storage["b"] = {"status": "".join(["ship", "ped"])}
+        values = storage._columns["status"].values
+        assert values[0] is values[1]
+
+    def test_unknown_engine(self):
+        """Test that an unknown engine name is rejected."""
+        with pytest.raises(ValueError, match="Unknown storage engine"):
+            create_storage("rows")
+
+
+class TestColumnarService:
+    """Test DefaultResourceService on the columnar engine."""
+
+    @pytest.fixture
+    def service(self):
+        return DefaultResourceService(Order, "orders", storage_engine="columnar")
+
+    @pytest.mark.asyncio
+    async def test_crud(self, service):
+        """Test the full resource lifecycle."""
+        created = await service.create(
+            {"customer": "acme", "quantity": 2, "price": 9.5, "paid": False}
+        )
+        assert await service.read(created["id"]) == created
+
+        updated = await service.update(created["id"], {"paid": True}, partial=True)
+        assert updated["paid"] is True
+        assert await service.read(created["id"]) == updated
+
+        await service.delete(created["id"])
+        assert await service.list() == []
+
+    @pytest.mark.asyncio
+    async def test_list_filters(self, service):
+        """Test that filtering works on materialised records."""
+        for i in range(6):
+            await service.create(
+                {"customer": f"c{i % 2}", "quantity": i, "price": 1.0, "paid": True}
+            )
+        results = await service.list(customer="c1", quantity__gte=2)
+        assert [r["quantity"] for r in results] == [3, 5]
@@ -0,0 +1,58 @@
+"""Tests for the bounded thread pool running blocking database work."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.liveapi.implementation.threadpool import BlockingExecutor
+
+
+class TestBlockingExecutor:
+    """Test BlockingExecutor bounds and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        """Test that calls run on pool threads and return their results."""
+        executor = BlockingExecutor(max_workers=2)
+        name = await executor.run(lambda: threading.current_thread().name)
+        assert name.startswith("liveapi-db")
+        assert await executor.run(pow, 2, 10) == 1024
+
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+        stats = executor.stats()
+        assert stats["submitted"] == stats["completed"] == 3
+        assert stats["active"] == stats["queued"] == 0
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_is_bounded(self):
+        """Test that callers beyond the queue wait and are counted."""
+        executor = BlockingExecutor(max_workers=1, max_queue=1)
+        running = []
+
+        def work(i):
+            running.append(i)
+            time.sleep(0.02)
+            return i
+
+        results = await asyncio.gather(*[executor.run(work, i) for i in range(4)])
+        assert results == [0, 1, 2, 3]
+        assert sorted(running) == [0, 1, 2, 3]
+
+        stats = executor.stats()
+        # One call waits for the thread (two if the first hasn't started
+        # yet); the others wait on the event loop for room in the queue
+        assert 1 <= stats["peak_queued"] <= 2
+        assert stats["peak_waiting"] == 2
+        assert stats["max_queue_ms"] >= 15
+        executor.shutdown()
+
+    def test_invalid_sizes(self):
+        """Test that the pool needs a thread and a non-negative queue."""
+        with pytest.raises(ValueError):
+            BlockingExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            BlockingExecutor(max_queue=-1)